@@ -8,17 +8,442 @@ Provides a unified interface for database operations.
 import logging
 from typing import Dict, List, Any, Optional
 from .postgres_db import PostgresDatabase
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+from psycopg2.extras import execute_values
 from finance_assistant.schema_validator import SchemaValidator
+import concurrent.futures
+import contextlib
 import csv
+import functools
+import io
+import itertools
+import json
 import os
+import queue
 import threading
+import time
 import re
 import difflib
+from datetime import datetime
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+@functools.lru_cache(maxsize=None)
+def _load_pyarrow():
+    """Import pyarrow on first use; it is slow to load and only the INSERT fallback needs it
+    
+    pyarrow's C++ CSV parser is used for large imports when it is installed.
+    
+    Returns:
+        tuple: (pyarrow, pyarrow.csv), or None if pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None
+    return pa, pacsv
+
 logger = logging.getLogger(__name__)
 
+# Seconds a cached table structure stays valid for imports
+_STRUCTURE_CACHE_TTL = 30.0
+
+# Seconds the table list shown in pickers is reused before it is fetched again
+_TABLE_LIST_TTL = 30.0
+
+# Rows per committed batch when a CSV import has to fall back to INSERTs
+IMPORT_BATCH_SIZE = 10000
+
+# Rows per INSERT statement on the fallback path are sized so a statement
+# carries about this many bytes of CSV text: a few thousand narrow rows or a
+# few hundred wide ones, within the bounds below
+_INSERT_TARGET_BYTES = 256 * 1024
+_INSERT_PAGE_MIN = 100
+_INSERT_PAGE_MAX = 5000
+
+# Bulk loads don't wait for the WAL flush on commit. A crash can lose the last
+# few committed batches but never corrupts them; SET LOCAL ends with the transaction.
+_BULK_LOAD_SETTINGS_SQL = "SET LOCAL synchronous_commit TO OFF"
+
+# Indexes behind the dashboards' invoice list, status filter and detail lookups:
+# (table, index name, key columns, INCLUDE columns). Each is only created when the
+# table has all of its columns, since older databases use a different invoice schema.
+_INVOICE_LOOKUP_INDEXES = (
+    ('invoices', 'idx_invoices_status_date', ('payment_status', 'invoice_date DESC'),
+     ('invoice_id', 'vendor_id', 'amount')),
+    ('invoices', 'idx_invoices_date', ('invoice_date DESC',), ()),
+    ('invoice_items', 'idx_invoice_items_invoice', ('invoice_id',), ()),
+    ('expense_allocation', 'idx_expense_allocation_invoice', ('invoice_id',), ()),
+)
+
+# Secondary indexes are only dropped for an import when the CSV is at least this
+# fraction of the table's size; smaller loads cost less than a full index rebuild
+_DEFER_INDEXES_MIN_RATIO = 0.1
+
+# Definitions of indexes dropped for a bulk load, recorded in the same transaction as
+# the drop so an import that dies before rebuilding them is repaired on the next connect
+_DEFERRED_INDEXES_TABLE = "import_deferred_indexes"
+
+# Files at least this large are split and loaded over several connections at once
+_PARALLEL_COPY_MIN_BYTES = 100 * 1024 * 1024
+_PARALLEL_COPY_WORKERS = min(4, os.cpu_count() or 1)
+
+# Patterns used on the CSV import path, compiled once at import time
+_SAFE_COL_RE = re.compile(r'[^a-z0-9_]')
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+_ALNUM_RUN_RE = re.compile(r'[a-z0-9]+')
+_NON_NUMERIC_RE = re.compile(r'[^0-9.\-]')
+_NON_INTEGER_RE = re.compile(r'[^0-9\-]')
+_UNSAFE_IDENT_RE = re.compile(r'[^a-zA-Z0-9_]')
+_UNSAFE_HEADER_RE = re.compile(r'[^a-zA-Z0-9]')
+# YYYY-MM-DD, MM/DD/YYYY, MM/DD/YY, MM-DD-YYYY or MM-DD-YY, tested in one match
+_DATE_RE = re.compile(r'^(?:\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/(?:\d{4}|\d{2})|\d{1,2}-\d{1,2}-(?:\d{4}|\d{2}))$')
+# Currency symbols and thousands separators dropped before numeric sniffing
+_NUMBER_FORMATTING = str.maketrans('', '', '$€£,')
+_DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%m-%d-%Y')
+
+def _clean_numeric(value):
+    """Strip formatting like commas and currency symbols and return a float"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        cleaned = _NON_NUMERIC_RE.sub('', value)
+        if not cleaned:
+            return None
+        try:
+            return float(cleaned)
+        except ValueError:
+            return None
+    elif isinstance(value, (int, float)):
+        return value
+    return None
+
+def _clean_integer(value):
+    """Strip formatting characters and return an int"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        cleaned = _NON_INTEGER_RE.sub('', value)
+        if not cleaned:
+            return None
+        try:
+            return int(cleaned)
+        except ValueError:
+            return None
+    elif isinstance(value, int):
+        return value
+    elif isinstance(value, float):
+        return int(value)
+    return None
+
+def _clean_date(value):
+    """Parse a date string in one of the known formats as YYYY-MM-DD, or return None"""
+    if isinstance(value, str) and value:
+        for fmt in _DATE_FORMATS:
+            try:
+                return datetime.strptime(value, fmt).strftime('%Y-%m-%d')
+            except ValueError:
+                continue
+    return None
+
+def _clean_text(value):
+    """Return the value unchanged, with empty strings as NULL"""
+    if value is None or value == '':
+        return None
+    return value
+
+@functools.lru_cache(maxsize=None)
+def _converter_for_type(column_type):
+    """Pick the cleaning function for a column type once instead of per value
+    
+    Args:
+        column_type: Lowercase PostgreSQL column type
+        
+    Returns:
+        function: Takes a raw CSV value and returns the cleaned value
+    """
+    if any(num_type in column_type for num_type in ('numeric', 'decimal', 'double', 'float', 'real')):
+        return _clean_numeric
+    if any(int_type in column_type for int_type in ('int', 'serial', 'bigint', 'smallint')):
+        return _clean_integer
+    if 'date' in column_type:
+        return _clean_date
+    return _clean_text
+
+def _insert_page_size(rows, sample_size=100):
+    """Choose how many rows each INSERT statement carries from the width of sample rows
+    
+    Args:
+        rows: Row dictionaries from the CSV; only the first sample_size are measured
+        sample_size: Number of rows to measure
+        
+    Returns:
+        int: Rows per statement, between _INSERT_PAGE_MIN and _INSERT_PAGE_MAX
+    """
+    sample = rows[:sample_size]
+    if not sample:
+        return _INSERT_PAGE_MIN
+    
+    avg_row_bytes = sum(len(','.join(map(str, row.values()))) for row in sample) / len(sample)
+    page_size = int(_INSERT_TARGET_BYTES // max(avg_row_bytes, 1))
+    return max(_INSERT_PAGE_MIN, min(_INSERT_PAGE_MAX, page_size))
+
+@contextlib.contextmanager
+def _open_for_import(csv_file, offset=0, length=0):
+    """Open a CSV file for one sequential pass without flooding the page cache
+    
+    Where the OS supports it, the kernel is told to read ahead aggressively and,
+    once the pass is done, to drop the file's pages so a multi-GB import doesn't
+    evict the database's own working set.
+    
+    Args:
+        csv_file: Path to the CSV file
+        offset: Start of the byte range that will be read
+        length: Length of that range; 0 means to the end of the file
+        
+    Yields:
+        file: The file opened in binary mode
+    """
+    with open(csv_file, 'rb') as f:
+        advise = getattr(os, 'posix_fadvise', None)
+        if advise:
+            advise(f.fileno(), offset, length, os.POSIX_FADV_SEQUENTIAL)
+        try:
+            yield f
+        finally:
+            if advise:
+                advise(f.fileno(), offset, length, os.POSIX_FADV_DONTNEED)
+
+@contextlib.contextmanager
+def _transaction_block(conn):
+    """Keep a connection out of autocommit mode so SAVEPOINT and SET LOCAL work
+    
+    PostgresDatabase.commit_transaction and rollback_transaction leave the shared
+    connection in autocommit mode. The caller still commits or rolls back; work
+    left open when the block exits is rolled back before autocommit is restored.
+    
+    Args:
+        conn: psycopg2 connection
+        
+    Yields:
+        connection: conn, with autocommit off
+    """
+    if not conn.autocommit:
+        yield conn
+        return
+    
+    conn.autocommit = False
+    try:
+        yield conn
+    finally:
+        if conn.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+            conn.rollback()
+        conn.autocommit = True
+
+class _CsvRowStream:
+    """File-like adapter that serves rows as CSV text for COPY FROM STDIN"""
+    
+    def __init__(self, rows):
+        """Initialize the stream
+        
+        Args:
+            rows: Iterable of row value lists
+        """
+        self._rows = iter(rows)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+    
+    def read(self, size=-1):
+        """Return up to size characters of CSV text, or '' when exhausted"""
+        buffer = self._buffer
+        
+        # Serialize rows until we have enough text for this chunk
+        while size < 0 or buffer.tell() < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._writer.writerow(row)
+        
+        data = buffer.getvalue()
+        if 0 <= size < len(data):
+            data, rest = data[:size], data[size:]
+        else:
+            rest = ''
+        
+        # Keep whatever didn't fit for the next read
+        buffer.seek(0)
+        buffer.truncate()
+        buffer.write(rest)
+        return data
+    
+    readline = read
+
+class _ByteCountingLines:
+    """Iterate the decoded lines of a binary file while tracking bytes consumed"""
+    
+    def __init__(self, binary_file, encoding='utf-8-sig'):
+        self._file = binary_file
+        self._encoding = encoding
+        self.bytes_read = 0
+    
+    def __iter__(self):
+        for raw_line in self._file:
+            self.bytes_read += len(raw_line)
+            yield raw_line.decode(self._encoding)
+
+class _ByteRangeReader:
+    """Binary reader limited to the bytes between two offsets of a file"""
+    
+    def __init__(self, binary_file, start, end):
+        binary_file.seek(start)
+        self._file = binary_file
+        self._remaining = end - start
+    
+    def read(self, size=-1):
+        """Read up to size bytes without passing the end offset"""
+        if self._remaining <= 0:
+            return b''
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
+    
+    readline = read
+
+def _csv_record_boundaries(csv_file, parts, skip_header=False):
+    """Split a CSV file into byte ranges that start and end on record boundaries
+    
+    A newline only ends a record when an even number of quote characters
+    precede it; otherwise it is inside a quoted field. Quotes are counted
+    with bytes.count, so the scan runs at C speed.
+    
+    Args:
+        csv_file: Path to the CSV file
+        parts: Number of ranges wanted
+        skip_header: Start the first range after the header record
+        
+    Returns:
+        list: Offsets [start, ..., file_size]; consecutive pairs are the ranges
+    """
+    size = os.path.getsize(csv_file)
+    with open(csv_file, 'rb') as f:
+        pos = 0
+        quotes = 0
+        
+        def next_record_end():
+            # Advance to just past the first newline that ends a record
+            nonlocal pos, quotes
+            for line in iter(f.readline, b''):
+                quotes += line.count(b'"')
+                pos += len(line)
+                if quotes % 2 == 0:
+                    break
+        
+        if skip_header:
+            next_record_end()
+        boundaries = [pos]
+        
+        for k in range(1, parts):
+            target = boundaries[0] + (size - boundaries[0]) * k // parts
+            while pos < target:
+                block = f.read(min(1 << 22, target - pos))
+                if not block:
+                    break
+                quotes += block.count(b'"')
+                pos += len(block)
+            next_record_end()
+            
+            if pos >= size:
+                break
+            if pos > boundaries[-1]:
+                boundaries.append(pos)
+    
+    boundaries.append(size)
+    return boundaries
+
+class _ProgressReader:
+    """Binary file wrapper that reports lines and bytes read to a callback"""
+    
+    def __init__(self, binary_file, callback=None):
+        self._file = binary_file
+        self._callback = callback
+        self.bytes_read = 0
+        self.lines_read = 0
+    
+    def read(self, size=-1):
+        """Read a chunk from the wrapped file and report progress"""
+        data = self._file.read(size)
+        if data:
+            self.bytes_read += len(data)
+            self.lines_read += data.count(b'\n')
+            if self._callback:
+                self._callback(self.lines_read, self.bytes_read)
+        return data
+    
+    readline = read
+
+def _read_ahead(iterable, chunk_size=1000, max_chunks=2):
+    """Yield items from iterable while a background thread produces the next chunks
+    
+    Lets CSV parsing and value cleaning overlap with the database writing
+    the previous chunk. The bounded queue makes the reader wait when the
+    writer falls behind. Closing the generator stops the reader thread.
+    
+    Args:
+        iterable: Source iterable; consumed on the reader thread
+        chunk_size: Items handed over per queue entry
+        max_chunks: Chunks the reader may get ahead by
+        
+    Yields:
+        Items from iterable, in order
+    """
+    chunks = queue.Queue(maxsize=max_chunks)
+    stop_reading = threading.Event()
+    read_errors = []
+    
+    def read_chunks():
+        try:
+            items = iter(iterable)
+            while not stop_reading.is_set():
+                chunk = list(itertools.islice(items, chunk_size))
+                if not chunk:
+                    break
+                chunks.put(chunk)
+        except Exception as e:
+            read_errors.append(e)
+        finally:
+            chunks.put(None)
+    
+    reader_thread = threading.Thread(target=read_chunks, daemon=True)
+    reader_thread.start()
+    
+    chunk = None
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                break
+            yield from chunk
+    finally:
+        # Unblock and stop the reader if the consumer stopped early
+        stop_reading.set()
+        while chunk is not None:
+            chunk = chunks.get()
+        reader_thread.join()
+    
+    if read_errors:
+        raise read_errors[0]
+
+class _PartialCopyError(Exception):
+    """Some ranges of a parallel COPY were committed and others were not
+    
+    Retrying the whole file would duplicate the committed rows, so callers
+    must report this instead of falling back to another loader.
+    """
+
 class DatabaseManager:
     """Database manager that provides a unified interface for database operations"""
     
@@ -32,7 +457,9 @@ class DatabaseManager:
         self.db = PostgresDatabase()
         self.connected = False
         self.tables = []  # Add tables list attribute
+        self._tables_fetched_at = None  # time.monotonic() of the last successful fetch
         self.schema_validator = None  # Schema validator instance
+        self._structure_cache = {}  # table name -> (fetched_at, columns)
         
     def connect_to_database(self, db_name: str, host: str = "localhost", 
                           port: int = 5432, user: str = "postgres", 
@@ -59,6 +486,12 @@ class DatabaseManager:
                 # Initialize and use schema validator
                 self._initialize_schema_validator()
                 
+                # Rebuild indexes an interrupted import left dropped
+                self.restore_pending_indexes()
+                
+                # Make sure the dashboards' invoice queries are index-backed
+                self.ensure_invoice_indexes()
+                
                 return True, f"Successfully connected to database '{db_name}'"
             else:
                 return False, f"Failed to connect: {self.db.error}"
@@ -77,7 +510,7 @@ class DatabaseManager:
             validation_results = {}
             
             for table in tables_to_validate:
-                if table in self.tables:
+                if table in self.tables_set:
                     logger.info(f"Validating and auto-fixing {table} table schema")
                     
                     # First check for missing columns (traditional validation)
@@ -133,6 +566,19 @@ class DatabaseManager:
         # Check and fix schema
         return self.schema_validator.ensure_valid_schema(table_name)
     
+    @property
+    def tables(self):
+        """list: Table names in the connected database"""
+        return self._tables
+    
+    @tables.setter
+    def tables(self, tables):
+        # Keep set and sorted views in step with the list so lookups don't rescan it
+        self._tables = list(tables)
+        self.tables_set = frozenset(self._tables)
+        self._tables_lower = frozenset(t.lower() for t in self._tables)
+        self.sorted_tables = sorted(self._tables)
+    
     def _fetch_tables(self):
         """Fetch the list of tables from the database"""
         if not self.connected or not self.db:
@@ -149,6 +595,7 @@ class DatabaseManager:
                 logger.error(f"Error fetching tables: {result['error']}")
             elif 'tables' in result:
                 self.tables = result['tables']
+                self._tables_fetched_at = time.monotonic()
                 
                 if not self.tables:
                     logger.warning("No tables found in database. You may need to initialize with sample tables.")
@@ -156,6 +603,23 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Exception in _fetch_tables: {str(e)}")
     
+    def get_tables_cached(self, max_age=_TABLE_LIST_TTL):
+        """Return the sorted table list, fetching it only if it is older than max_age
+        
+        Code that creates or drops tables calls _fetch_tables, which refreshes
+        the cache, so this only misses changes made outside the application.
+        
+        Args:
+            max_age: Seconds a fetched list may be reused
+            
+        Returns:
+            list: Table names, sorted
+        """
+        fetched_at = self._tables_fetched_at
+        if fetched_at is None or time.monotonic() - fetched_at > max_age:
+            self._fetch_tables()
+        return self.sorted_tables
+    
     @property
     def is_connected(self):
         """Check if connected to a database
@@ -394,7 +858,7 @@ class DatabaseManager:
             # Replace spaces with underscores
             snake_name = original_table_name.replace(' ', '_')
             # Replace any special characters with underscores
-            snake_name = re.sub(r'[^a-zA-Z0-9_]', '_', snake_name)
+            snake_name = _UNSAFE_IDENT_RE.sub('_', snake_name)
             # Convert to lowercase
             snake_name = snake_name.lower()
             
@@ -413,6 +877,7 @@ class DatabaseManager:
                 
             # Update the tables list after successful rename
             self._fetch_tables()
+            self.invalidate_table_structure(original_table_name)
             
             return True
         except Exception as e:
@@ -449,7 +914,7 @@ class DatabaseManager:
                 # Replace spaces with underscores
                 snake_name = table.replace(' ', '_')
                 # Replace any special characters with underscores
-                snake_name = re.sub(r'[^a-zA-Z0-9_]', '_', snake_name)
+                snake_name = _UNSAFE_IDENT_RE.sub('_', snake_name)
                 # Convert to lowercase
                 snake_name = snake_name.lower()
                 
@@ -468,6 +933,7 @@ class DatabaseManager:
                     
                 # Add to the mapping
                 renamed_map[table] = snake_name
+                self.invalidate_table_structure(table)
                 
             # Update the tables list after all renames
             self._fetch_tables()
@@ -556,13 +1022,18 @@ class DatabaseManager:
                     except StopIteration:
                         break
                 
-                # Reset file pointer and count total rows
-                f.seek(0)
-                next(reader)  # Skip header
-                total_rows = sum(1 for _ in reader)
+            # Estimate the row count from the sample's average row size
+            # rather than scanning the whole file a second time
+            sample_size = sum(len(','.join(row)) + 1 for row in sample_rows)
+            if sample_rows and sample_size:
+                header_size = len(','.join(csv_headers)) + 1
+                file_size = os.path.getsize(csv_file)
+                total_rows = max(len(sample_rows), (file_size - header_size) * len(sample_rows) // sample_size)
+            else:
+                total_rows = len(sample_rows)
             
             # Step 2: Get existing table structure
-            table_structure = self.get_table_structure(table_name)
+            table_structure = self.get_cached_table_structure(table_name)
             existing_columns = [col['name'].lower() for col in table_structure]
             
             # Step 3: Analyze differences
@@ -570,12 +1041,14 @@ class DatabaseManager:
             column_mapping = {}
             
             for csv_header in csv_headers:
+                header_lower = csv_header.lower()
+                
                 # Try different variations to find matches
                 variations = [
-                    csv_header.lower(),                         # exact lowercase match
-                    csv_header.lower().replace(' ', '_'),       # spaces to underscores
-                    re.sub(r'[^a-z0-9]', '_', csv_header.lower()),  # any non-alphanumeric to underscore
-                    ''.join(re.findall(r'[a-z0-9]+', csv_header.lower()))  # remove all non-alphanumeric
+                    header_lower,                               # exact lowercase match
+                    header_lower.replace(' ', '_'),             # spaces to underscores
+                    _NON_ALNUM_RE.sub('_', header_lower),       # any non-alphanumeric to underscore
+                    ''.join(_ALNUM_RUN_RE.findall(header_lower))  # remove all non-alphanumeric
                 ]
                 
                 # Find best match
@@ -588,25 +1061,25 @@ class DatabaseManager:
                 
                 if not matched:
                     # Check for semantic similarities
-                    if 'date' in csv_header.lower():
+                    if 'date' in header_lower:
                         date_cols = [col for col in existing_columns if 'date' in col]
                         if date_cols:
                             # Find most similar date column
-                            best_match = max(date_cols, key=lambda x: difflib.SequenceMatcher(None, x, csv_header.lower()).ratio())
+                            best_match = max(date_cols, key=lambda x: difflib.SequenceMatcher(None, x, header_lower).ratio())
                             column_mapping[csv_header] = best_match
                             matched = True
-                    elif any(term in csv_header.lower() for term in ['amount', 'payment', 'cost', 'price', 'total']):
+                    elif any(term in header_lower for term in ['amount', 'payment', 'cost', 'price', 'total']):
                         amount_cols = [col for col in existing_columns 
                                       if any(term in col for term in ['amount', 'payment', 'cost', 'price', 'total'])]
                         if amount_cols:
-                            best_match = max(amount_cols, key=lambda x: difflib.SequenceMatcher(None, x, csv_header.lower()).ratio())
+                            best_match = max(amount_cols, key=lambda x: difflib.SequenceMatcher(None, x, header_lower).ratio())
                             column_mapping[csv_header] = best_match
                             matched = True
-                    elif any(term in csv_header.lower() for term in ['vendor', 'supplier', 'company']):
+                    elif any(term in header_lower for term in ['vendor', 'supplier', 'company']):
                         vendor_cols = [col for col in existing_columns 
                                       if any(term in col for term in ['vendor', 'supplier', 'company'])]
                         if vendor_cols:
-                            best_match = max(vendor_cols, key=lambda x: difflib.SequenceMatcher(None, x, csv_header.lower()).ratio())
+                            best_match = max(vendor_cols, key=lambda x: difflib.SequenceMatcher(None, x, header_lower).ratio())
                             column_mapping[csv_header] = best_match
                             matched = True
                 
@@ -618,15 +1091,16 @@ class DatabaseManager:
             if unknown_columns:
                 logger.info(f"Found {len(unknown_columns)} unknown columns in CSV")
                 
+                # Transpose the sample once so every column's values are ready;
+                # short rows are padded with '' which type inference ignores
+                sample_columns = dict(zip(csv_headers, itertools.zip_longest(*sample_rows, fillvalue='')))
+                
                 for col in unknown_columns:
                     # Infer type from sample data
-                    col_index = csv_headers.index(col)
-                    col_data = [row[col_index] for row in sample_rows if col_index < len(row)]
-                    col_type = self._infer_column_type(col_data)
+                    col_type = self._infer_column_type(sample_columns.get(col, ()))
                     
                     # Sanitize column name for SQL
-                    safe_col_name = re.sub(r'[^a-z0-9_]', '_', col.lower())
-                    safe_col_name = re.sub(r'_+', '_', safe_col_name).strip('_')
+                    safe_col_name = _MULTI_UNDERSCORE_RE.sub('_', _SAFE_COL_RE.sub('_', col.lower())).strip('_')
                     
                     # Store for UI display
                     new_columns[safe_col_name] = col_type
@@ -663,22 +1137,8 @@ class DatabaseManager:
             return "VARCHAR(255)"
         
         # Check if all values are dates
-        date_patterns = [
-            r'^\d{4}-\d{2}-\d{2}$',            # YYYY-MM-DD
-            r'^\d{1,2}/\d{1,2}/\d{4}$',         # MM/DD/YYYY
-            r'^\d{1,2}/\d{1,2}/\d{2}$',         # MM/DD/YY
-            r'^\d{1,2}-\d{1,2}-\d{4}$',         # MM-DD-YYYY
-            r'^\d{1,2}-\d{1,2}-\d{2}$'          # MM-DD-YY
-        ]
-        
-        all_dates = True
-        for v in values:
-            is_date = any(re.match(pattern, v) for pattern in date_patterns)
-            if not is_date:
-                all_dates = False
-                break
-        
-        if all_dates:
+        date_match = _DATE_RE.match
+        if all(date_match(v) for v in values):
             return "DATE"
         
         # Check if all values are numeric
@@ -686,7 +1146,12 @@ class DatabaseManager:
         has_decimal = False
         for v in values:
             # Remove currency symbols
-            test_value = v.replace('$', '').replace('€', '').replace('£', '').replace(',', '')
+            test_value = v.translate(_NUMBER_FORMATTING)
+            
+            # Plain integers need no float() round trip
+            digits = test_value[1:] if test_value.startswith('-') else test_value
+            if digits.isascii() and digits.isdigit():
+                continue
             try:
                 float_val = float(test_value)
                 has_decimal = has_decimal or ('.' in test_value)
@@ -745,6 +1210,38 @@ class DatabaseManager:
         
         return columns
 
+    def get_cached_table_structure(self, table_name):
+        """Get structure of a table, reusing a lookup from the last few seconds
+        
+        Args:
+            table_name: The name of the table
+            
+        Returns:
+            list: List of column definitions
+        """
+        key = table_name.lower()
+        now = time.monotonic()
+        
+        cached = self._structure_cache.get(key)
+        if cached and now - cached[0] < _STRUCTURE_CACHE_TTL:
+            return cached[1]
+        
+        columns = self.get_table_structure(table_name)
+        if columns:
+            self._structure_cache[key] = (now, columns)
+        return columns
+
+    def invalidate_table_structure(self, table_name=None):
+        """Drop cached table structures after a schema change
+        
+        Args:
+            table_name: The table to forget, or None to clear the whole cache
+        """
+        if table_name is None:
+            self._structure_cache.clear()
+        else:
+            self._structure_cache.pop(table_name.lower(), None)
+
     def add_column_to_table(self, table_name, column_name, column_type):
         """Add a new column to existing table
         
@@ -767,6 +1264,7 @@ class DatabaseManager:
             # Add the column
             query = f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"
             result = self.db.execute_update(query)
+            self.invalidate_table_structure(table_name)
             
             if 'error' in result and result['error']:
                 logger.error(f"Error adding column: {result['error']}")
@@ -779,6 +1277,42 @@ class DatabaseManager:
             logger.error(f"Error adding column: {str(e)}")
             return False
 
+    def add_columns_to_table(self, table_name, columns):
+        """Add several columns to an existing table with one ALTER TABLE
+        
+        Args:
+            table_name: The name of the table
+            columns: Dictionary mapping column names to data types
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            # Skip columns that already exist
+            table_structure = self.get_table_structure(table_name)
+            existing_columns = {col['name'].lower() for col in table_structure}
+            new_columns = {name: col_type for name, col_type in columns.items() 
+                          if name.lower() not in existing_columns}
+            
+            if not new_columns:
+                return True  # Nothing to add
+            
+            # One statement means one lock acquisition and one commit for all columns
+            add_clauses = ", ".join(f"ADD COLUMN {name} {col_type}" for name, col_type in new_columns.items())
+            result = self.db.execute_update(f"ALTER TABLE {table_name} {add_clauses}")
+            self.invalidate_table_structure(table_name)
+            
+            if 'error' in result and result['error']:
+                logger.error(f"Error adding columns: {result['error']}")
+                return False
+            
+            logger.info(f"Added columns {list(new_columns)} to table '{table_name}'")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error adding columns: {str(e)}")
+            return False
+
     def _execute_mapped_import(self, csv_file, table_name, column_mapping):
         """Execute the import using column mapping
         
@@ -795,68 +1329,63 @@ class DatabaseManager:
             successful_rows = 0
             
             # Get column types from database
-            table_structure = self.get_table_structure(table_name)
+            table_structure = self.get_cached_table_structure(table_name)
             column_types = {col['name'].lower(): col['type'].lower() for col in table_structure}
             
-            # Read CSV data
-            with open(csv_file, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-            
-            if not rows:
-                return {'success': True, 'message': 'CSV file is empty', 'rows_imported': 0}
-            
-            # Get target columns for insert
+            # Get target columns for insert and resolve their CSV sources once
             target_columns = list(set(column_mapping.values()))
+            column_sources = self._resolve_column_sources(column_mapping, target_columns, column_types)
             
-            # Process in batches
-            batch_size = 100
-            for i in range(0, len(rows), batch_size):
-                batch = rows[i:i+batch_size]
-                total_rows += len(batch)
-                
-                values_list = []
-                for row in batch:
-                    row_values = []
-                    for col in target_columns:
-                        # Find original CSV column that maps to this target
-                        source_col = None
-                        for src, tgt in column_mapping.items():
-                            if tgt.lower() == col.lower():
-                                source_col = src
-                                break
-                        
-                        if source_col and source_col in row:
-                            # Get the value and clean it based on column type
-                            value = row[source_col]
-                            col_type = column_types.get(col.lower(), 'varchar')
-                            cleaned_value = self._clean_value_for_type(value, col_type)
-                            row_values.append(cleaned_value)
-                        else:
-                            row_values.append(None)
-                    
-                    values_list.append(row_values)
-                
-                # Build the insert query
-                placeholders = ", ".join(["%s"] * len(target_columns))
-                columns_str = ", ".join(target_columns)
-                
-                query = f"INSERT INTO {table_name} ({columns_str}) VALUES "
-                query += ", ".join([f"({placeholders})"] * len(batch))
-                
-                # Flatten values for parameterized query
-                flat_values = [val for sublist in values_list for val in sublist]
-                
-                # Execute insert
-                result = self.db.execute_update(query, flat_values)
+            # Build the insert once; execute_values expands VALUES %s per page
+            query = f"INSERT INTO {table_name} ({', '.join(target_columns)}) VALUES %s"
+            batch_size = 1000
+            conn = self.db.connection
+            
+            def insert_batch(cur, batch):
+                nonlocal successful_rows
+                values_list = [self._map_row_values(row, column_sources) for row in batch]
                 
-                if 'error' in result and result['error']:
-                    logger.error(f"Error inserting batch: {result['error']}")
-                    # Fall back to individual inserts to handle problematic rows
-                    individual_success = self._insert_rows_individually(table_name, batch, target_columns, column_mapping, column_types)
-                    successful_rows += individual_success
-                else:
+                # A savepoint lets a bad batch be undone without losing earlier ones
+                cur.execute("SAVEPOINT mapped_batch")
+                try:
+                    execute_values(cur, query, values_list, page_size=batch_size)
+                    cur.execute("RELEASE SAVEPOINT mapped_batch")
                     successful_rows += len(batch)
+                except Exception as e:
+                    logger.error(f"Error inserting batch: {str(e)}")
+                    cur.execute("ROLLBACK TO SAVEPOINT mapped_batch")
+                    cur.execute("RELEASE SAVEPOINT mapped_batch")
+                    # Fall back to individual inserts to handle problematic rows. That
+                    # commits the import so far, so restore the bulk load setting after it.
+                    successful_rows += self._insert_rows_individually(table_name, batch, target_columns, column_mapping, column_types)
+                    cur.execute(_BULK_LOAD_SETTINGS_SQL)
+            
+            # Stream CSV data in batches and commit at the end
+            with open(csv_file, 'r', encoding='utf-8-sig') as f, _transaction_block(conn):
+                reader = csv.DictReader(f)
+                cur = conn.cursor()
+                try:
+                    cur.execute(_BULK_LOAD_SETTINGS_SQL)
+                    batch = []
+                    for row in reader:
+                        batch.append(row)
+                        if len(batch) >= batch_size:
+                            total_rows += len(batch)
+                            insert_batch(cur, batch)
+                            batch = []
+                    
+                    if batch:
+                        total_rows += len(batch)
+                        insert_batch(cur, batch)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    cur.close()
+            
+            if total_rows == 0:
+                return {'success': True, 'message': 'CSV file is empty', 'rows_imported': 0}
             
             # Return result
             return {
@@ -890,7 +1419,7 @@ class DatabaseManager:
                 return {'success': False, 'error': f"Table '{table_name}' does not exist"}
             
             # Get table structure to validate columns
-            table_structure = self.get_table_structure(table_name)
+            table_structure = self.get_cached_table_structure(table_name)
             table_columns = [col['name'].lower() for col in table_structure]
             
             # Read CSV headers
@@ -921,11 +1450,6 @@ class DatabaseManager:
                         'error': f"CSV file is missing required columns: {', '.join(missing_required)}"
                     }
                 
-                # Read data
-                data = list(reader)
-                if not data:
-                    return {'success': True, 'message': 'CSV file is empty', 'rows_imported': 0}
-                
                 # Map CSV columns to table columns
                 column_mapping = {}
                 for i, header in enumerate(headers):
@@ -939,35 +1463,19 @@ class DatabaseManager:
                         'error': f"No columns in CSV match table columns"
                     }
                 
-                # Generate SQL for insert
+                # Map values according to column mapping while streaming the rows
                 target_columns = list(column_mapping.values())
-                placeholders = ", ".join(["%s"] * len(target_columns))
+                source_indices = list(column_mapping.keys())
+                mapped_rows = ([row[idx] if idx < len(row) else None for idx in source_indices]
+                               for row in reader)
                 
-                insert_sql = f"INSERT INTO {table_name} ({', '.join(target_columns)}) VALUES ({placeholders})"
-                
-                # Process in batches for large files
-                batch_size = 100
-                rows_imported = 0
+                result = self._insert_rows_batched(table_name, target_columns, mapped_rows)
+                if 'error' in result and result['error']:
+                    return {'success': False, 'error': result['error']}
                 
-                for i in range(0, len(data), batch_size):
-                    batch = data[i:i+batch_size]
-                    batch_values = []
-                    
-                    for row in batch:
-                        # Map values according to column mapping
-                        row_values = [row[idx] if idx < len(row) else None for idx in column_mapping.keys()]
-                        batch_values.append(row_values)
-                    
-                    # Flatten values for query parameters
-                    flat_values = [val for sublist in batch_values for val in sublist]
-                    
-                    # Execute batch insert
-                    result = self.db.execute_update(insert_sql, flat_values)
-                    
-                    if 'error' in result and result['error']:
-                        return {'success': False, 'error': result['error']}
-                    
-                    rows_imported += len(batch)
+                rows_imported = result['rowcount']
+                if not rows_imported:
+                    return {'success': True, 'message': 'CSV file is empty', 'rows_imported': 0}
                 
                 return {
                     'success': True,
@@ -979,13 +1487,14 @@ class DatabaseManager:
             logger.error(f"Error importing CSV to table: {str(e)}")
             return {'success': False, 'error': str(e)}
 
-    def import_csv_to_new_table(self, csv_file, table_name, options=None):
+    def import_csv_to_new_table(self, csv_file, table_name, options=None, progress_callback=None):
         """Import CSV to a new table
         
         Args:
             csv_file: Path to CSV file
             table_name: Name of the target table to create
             options: Dictionary of import options
+            progress_callback: Function called with (rows_read, bytes_read) while loading
             
         Returns:
             dict: Results of the import operation
@@ -1020,7 +1529,7 @@ class DatabaseManager:
                     clean_headers = []
                     for header in headers:
                         # Replace spaces and special chars with underscores
-                        clean_name = re.sub(r'[^a-zA-Z0-9]', '_', header)
+                        clean_name = _UNSAFE_HEADER_RE.sub('_', header)
                         # Ensure it starts with a letter
                         if not clean_name[0].isalpha():
                             clean_name = 'col_' + clean_name
@@ -1041,16 +1550,12 @@ class DatabaseManager:
                     except StopIteration:
                         break
                 
-                # Reset file pointer
-                f.seek(0)
-                if has_header:
-                    next(reader)  # Skip header again
-                
-                # Infer column types
+                # Infer column types from the transposed sample
+                sample_columns = list(itertools.zip_longest(*sample_rows, fillvalue=""))
                 column_types = []
                 for i, header in enumerate(clean_headers):
                     # Get sample data for this column
-                    column_data = [row[i] if i < len(row) else "" for row in sample_rows]
+                    column_data = sample_columns[i] if i < len(sample_columns) else ()
                     column_types.append(self._infer_column_type(column_data))
                 
                 # Create table
@@ -1063,49 +1568,30 @@ class DatabaseManager:
                 create_sql += "\n)"
                 
                 result = self.db.execute_update(create_sql)
+                self.invalidate_table_structure(table_name)
                 if 'error' in result and result['error']:
                     return {'success': False, 'error': f"Error creating table: {result['error']}"}
                 
-                # Import data
-                all_data = list(reader)
-                if not all_data:
-                    return {'success': True, 'message': 'Created table but CSV file has no data', 'rows_imported': 0}
-                
-                # Generate SQL for insert
-                placeholders = ", ".join(["%s"] * len(clean_headers))
-                
-                insert_sql = f"INSERT INTO {table_name} ({', '.join(clean_headers)}) VALUES ({placeholders})"
-                
-                # Process in batches for large files
-                batch_size = 100
-                rows_imported = 0
-                
-                for i in range(0, len(all_data), batch_size):
-                    batch = all_data[i:i+batch_size]
-                    batch_values = []
-                    
-                    for row in batch:
-                        # Pad row if needed
-                        padded_row = row + [None] * (len(clean_headers) - len(row))
-                        batch_values.append(padded_row[:len(clean_headers)])
-                    
-                    # Flatten values for query parameters
-                    flat_values = [val for sublist in batch_values for val in sublist]
-                    
-                    # Execute batch insert
-                    result = self.db.execute_update(insert_sql, flat_values)
-                    
-                    if 'error' in result and result['error']:
-                        return {'success': False, 'error': result['error']}
-                    
-                    rows_imported += len(batch)
-                
-                return {
-                    'success': True,
-                    'rows_imported': rows_imported,
-                    'table': table_name,
-                    'columns': list(zip(clean_headers, column_types))
-                }
+            # The new table's columns match the file column for column, so PostgreSQL
+            # can parse the whole file with COPY (falling back to cleaned batches)
+            column_pairs = list(zip(headers, clean_headers)) if has_header else None
+            result = self.copy_import(csv_file, table_name, column_pairs,
+                                      delimiter=delimiter, has_header=has_header,
+                                      progress_callback=progress_callback,
+                                      batch_size=options.get('batch_size', IMPORT_BATCH_SIZE))
+            if not result.get('success'):
+                return {'success': False, 'error': result.get('error', 'Unknown error')}
+            
+            rows_imported = result.get('successful_rows', 0)
+            if not rows_imported:
+                return {'success': True, 'message': 'Created table but CSV file has no data', 'rows_imported': 0}
+            
+            return {
+                'success': True,
+                'rows_imported': rows_imported,
+                'table': table_name,
+                'columns': list(zip(clean_headers, column_types))
+            }
             
         except Exception as e:
             logger.error(f"Error importing CSV to new table: {str(e)}")
@@ -1122,7 +1608,7 @@ class DatabaseManager:
         """
         # Make sure we have an up-to-date list of tables
         self._fetch_tables()
-        return table_name.lower() in [t.lower() for t in self.tables]
+        return table_name.lower() in self._tables_lower
 
     def get_table_expected_columns(self, table_name):
         """Get expected columns for a table
@@ -1200,59 +1686,39 @@ class DatabaseManager:
         Returns:
             The cleaned value appropriate for the column type
         """
-        if value is None or value == '':
-            return None
+        return _converter_for_type(column_type)(value)
+
+    def _resolve_column_sources(self, column_mapping, target_columns, column_types):
+        """Pair each target column with the CSV column that feeds it
         
-        # Handle numeric types
-        if any(num_type in column_type for num_type in ['numeric', 'decimal', 'double', 'float', 'real']):
-            # Remove any formatting characters like commas and currency symbols
-            if isinstance(value, str):
-                cleaned = re.sub(r'[^0-9.\-]', '', value)
-                if not cleaned:
-                    return None
-                try:
-                    return float(cleaned)
-                except ValueError:
-                    return None
-            elif isinstance(value, (int, float)):
-                return value
-            return None
-            
-        # Handle integer types
-        if any(int_type in column_type for int_type in ['int', 'serial', 'bigint', 'smallint']):
-            # Remove any formatting characters
-            if isinstance(value, str):
-                cleaned = re.sub(r'[^0-9\-]', '', value)
-                if not cleaned:
-                    return None
-                try:
-                    return int(cleaned)
-                except ValueError:
-                    return None
-            elif isinstance(value, int):
-                return value
-            elif isinstance(value, float):
-                return int(value)
-            return None
+        Args:
+            column_mapping: Dictionary mapping CSV columns to DB columns
+            target_columns: List of target database columns
+            column_types: Dictionary of column types
             
-        # Handle date types
-        if 'date' in column_type:
-            if isinstance(value, str):
-                # Try different date formats
-                date_formats = ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%m-%d-%Y']
-                for fmt in date_formats:
-                    try:
-                        from datetime import datetime
-                        date_obj = datetime.strptime(value, fmt)
-                        return date_obj.strftime('%Y-%m-%d')  # Format consistently for SQL
-                    except ValueError:
-                        continue
+        Returns:
+            list: (source_column, converter) tuples in target_columns order
+        """
+        sources = {}
+        for src, tgt in column_mapping.items():
+            # The first CSV column mapped to a target wins, as before
+            sources.setdefault(tgt.lower(), src)
         
-            # If we can't parse the date, return NULL
-            return None
+        return [(sources.get(col.lower()), _converter_for_type(column_types.get(col.lower(), 'varchar')))
+                for col in target_columns]
+
+    def _map_row_values(self, row, column_sources):
+        """Build the cleaned insert values for one CSV row
         
-        # For other types, return as is
-        return value 
+        Args:
+            row: Row dictionary from CSV
+            column_sources: Result of _resolve_column_sources
+            
+        Returns:
+            list: Cleaned values in target column order
+        """
+        get = row.get
+        return [convert(get(src)) for src, convert in column_sources]
 
     def _insert_rows_individually(self, table_name, rows, target_columns, column_mapping, column_types):
         """Insert rows one by one to isolate and handle problematic rows
@@ -1268,65 +1734,79 @@ class DatabaseManager:
             int: Number of successfully inserted rows
         """
         successful = 0
-        
-        for row in rows:
+        column_sources = self._resolve_column_sources(column_mapping, target_columns, column_types)
+        
+        # Parse and plan the INSERT once, then run it per row on one cursor. A
+        # savepoint per row lets a bad row fail without aborting the rest.
+        placeholders = ", ".join(f"${i}" for i in range(1, len(target_columns) + 1))
+        columns_str = ", ".join(target_columns)
+        execute_sql = f"EXECUTE import_row ({', '.join(['%s'] * len(target_columns))})"
+        
+        conn = self.db.connection
+        cur = conn.cursor()
+        prepared = False
+        with _transaction_block(conn):
             try:
-                row_values = []
-                for col in target_columns:
-                    # Find original CSV column that maps to this target
-                    source_col = None
-                    for src, tgt in column_mapping.items():
-                        if tgt.lower() == col.lower():
-                            source_col = src
-                            break
-                    
-                    if source_col and source_col in row:
-                        # Get the value and clean it based on column type
-                        value = row[source_col]
-                        col_type = column_types.get(col.lower(), 'varchar')
-                        cleaned_value = self._clean_value_for_type(value, col_type)
-                        row_values.append(cleaned_value)
-                    else:
-                        row_values.append(None)
-                
-                # Build query for a single row
-                placeholders = ", ".join(["%s"] * len(target_columns))
-                columns_str = ", ".join(target_columns)
+                cur.execute(f"PREPARE import_row AS INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})")
+                prepared = True
                 
-                query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})"
-                
-                # Execute query
-                result = self.db.execute_update(query, row_values)
-                
-                if not ('error' in result and result['error']):
-                    successful += 1
-                else:
-                    # Log the problematic row data (safely)
-                    safe_row = {}
-                    for src, tgt in column_mapping.items():
-                        if src in row:
-                            value = row[src]
-                            if isinstance(value, str) and len(value) > 50:
-                                safe_row[tgt] = value[:50] + "..."
-                            else:
-                                safe_row[tgt] = str(value)
+                for row in rows:
+                    try:
+                        row_values = self._map_row_values(row, column_sources)
+                    except Exception as e:
+                        logger.warning(f"Error importing individual row: {str(e)}")
+                        continue
                     
-                    logger.warning(f"Could not import row: {safe_row}")
-                    logger.warning(f"Error: {result.get('error', 'Unknown error')}")
+                    cur.execute("SAVEPOINT import_row")
+                    try:
+                        cur.execute(execute_sql, row_values)
+                        cur.execute("RELEASE SAVEPOINT import_row")
+                        successful += 1
+                    except Exception as e:
+                        cur.execute("ROLLBACK TO SAVEPOINT import_row")
+                        
+                        # Log the problematic row data (safely)
+                        safe_row = {}
+                        for src, tgt in column_mapping.items():
+                            if src in row:
+                                value = row[src]
+                                if isinstance(value, str) and len(value) > 50:
+                                    safe_row[tgt] = value[:50] + "..."
+                                else:
+                                    safe_row[tgt] = str(value)
+                        
+                        logger.warning(f"Could not import row: {safe_row}")
+                        logger.warning(f"Error: {str(e)}")
+                
+                conn.commit()
             except Exception as e:
-                logger.warning(f"Error importing individual row: {str(e)}")
+                conn.rollback()
+                logger.error(f"Error inserting rows individually: {str(e)}")
+                successful = 0
+            finally:
+                # Prepared statements outlive rollbacks, so always release it
+                if prepared:
+                    try:
+                        cur.execute("DEALLOCATE import_row")
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                cur.close()
         
         logger.info(f"Individually inserted {successful} out of {len(rows)} rows")
         return successful 
 
-    def _execute_mapped_import_with_progress(self, csv_file, table_name, column_mapping, progress_callback=None):
+    def _execute_mapped_import_with_progress(self, csv_file, table_name, column_mapping, progress_callback=None,
+                                             delimiter=',', batch_size=IMPORT_BATCH_SIZE):
         """Execute import with progress reporting
         
         Args:
             csv_file: Path to the CSV file
             table_name: Target table name
             column_mapping: Dictionary mapping CSV columns to DB columns
-            progress_callback: Function to call with progress updates
+            progress_callback: Function called after each batch with (rows_read, bytes_read)
+            delimiter: CSV field delimiter
+            batch_size: Rows inserted and committed per batch
             
         Returns:
             dict: Import results
@@ -1336,40 +1816,66 @@ class DatabaseManager:
             successful_rows = 0
             
             # Get column types from database
-            table_structure = self.get_table_structure(table_name)
+            table_structure = self.get_cached_table_structure(table_name)
             column_types = {col['name'].lower(): col['type'].lower() for col in table_structure}
             
-            # Read CSV data
-            with open(csv_file, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                row_count = 0
-                
-                # Process in batches
-                batch_size = 50
-                current_batch = []
-                
-                for row in reader:
-                    row_count += 1
-                    total_rows += 1
+            # Resolve the target columns and their cleaners once for every batch
+            target_columns = list(set(column_mapping.values()))
+            column_sources = self._resolve_column_sources(column_mapping, target_columns, column_types)
+            
+            # A reader thread parses batches while this thread inserts them;
+            # the bounded queue keeps memory flat however large the file is
+            batch_queue = queue.Queue(maxsize=4)
+            stop_reading = threading.Event()
+            read_errors = []
+            
+            def read_batches():
+                try:
+                    for current_batch, bytes_read in self._iter_csv_row_batches(
+                            csv_file, column_mapping, delimiter, batch_size):
+                        if stop_reading.is_set():
+                            return
+                        batch_queue.put((current_batch, bytes_read))
+                except Exception as e:
+                    read_errors.append(e)
+                finally:
+                    batch_queue.put(None)
+            
+            reader_thread = threading.Thread(target=read_batches, daemon=True)
+            reader_thread.start()
+            
+            item = None
+            page_size = None
+            try:
+                while True:
+                    item = batch_queue.get()
+                    if item is None:
+                        break
                     
-                    # Add to current batch
-                    current_batch.append(row)
+                    current_batch, bytes_read = item
+                    total_rows += len(current_batch)
                     
-                    # Update progress if callback provided
-                    if progress_callback:
-                        progress_callback(row_count)
+                    # Size INSERT statements from the first batch's row width
+                    if page_size is None:
+                        page_size = _insert_page_size(current_batch)
                     
-                    # Process batch when it reaches batch size
-                    if len(current_batch) >= batch_size:
-                        # Process batch
-                        batch_success = self._process_import_batch(table_name, current_batch, column_mapping, column_types)
-                        successful_rows += batch_success
-                        current_batch = []
-                
-                # Process any remaining rows
-                if current_batch:
-                    batch_success = self._process_import_batch(table_name, current_batch, column_mapping, column_types)
+                    # Process batch
+                    batch_success = self._process_import_batch(table_name, current_batch, column_mapping, column_types,
+                                                               target_columns, column_sources, page_size)
                     successful_rows += batch_success
+                    
+                    # Update progress if callback provided
+                    if progress_callback:
+                        progress_callback(total_rows, bytes_read)
+            finally:
+                # Unblock and stop the reader if we bailed out early
+                stop_reading.set()
+                while item is not None:
+                    item = batch_queue.get()
+                reader_thread.join()
+            
+            if read_errors:
+                raise read_errors[0]
             
             # Return result
             return {
@@ -1384,7 +1890,134 @@ class DatabaseManager:
             logger.error(f"Error executing import with progress: {str(e)}")
             return {'success': False, 'error': str(e)}
 
-    def _process_import_batch(self, table_name, rows, column_mapping, column_types):
+    def _iter_csv_row_batches(self, csv_file, column_mapping, delimiter=',', batch_size=50):
+        """Read a CSV file once as batches of row dictionaries
+        
+        Uses pyarrow's streaming CSV reader when available, parsing only the
+        mapped columns, and falls back to csv.DictReader otherwise.
+        
+        Args:
+            csv_file: Path to the CSV file
+            column_mapping: Dictionary mapping CSV columns to DB columns
+            delimiter: CSV field delimiter
+            batch_size: Number of rows per yielded batch
+            
+        Yields:
+            tuple: (list of row dictionaries, bytes read so far)
+        """
+        pyarrow_modules = _load_pyarrow()
+        with _open_for_import(csv_file) as f:
+            if pyarrow_modules:
+                pa, pacsv = pyarrow_modules
+                
+                # Keep every value as a string so cleaning matches the csv path,
+                # and allow quoted values that span lines as csv.DictReader does
+                source_columns = list(column_mapping)
+                reader = pacsv.open_csv(
+                    f,
+                    read_options=pacsv.ReadOptions(block_size=1 << 22),
+                    parse_options=pacsv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+                    convert_options=pacsv.ConvertOptions(
+                        include_columns=source_columns,
+                        include_missing_columns=True,
+                        column_types={col: pa.string() for col in source_columns}
+                    )
+                )
+                
+                for record_batch in reader:
+                    names = record_batch.schema.names
+                    bytes_read = f.tell()
+                    
+                    # Slice the Arrow block first (zero-copy) so only one insert
+                    # batch is ever held as Python dictionaries
+                    for start in range(0, record_batch.num_rows, batch_size):
+                        chunk = record_batch.slice(start, batch_size)
+                        columns = [chunk.column(i).to_pylist() for i in range(len(names))]
+                        yield [dict(zip(names, values)) for values in zip(*columns)], bytes_read
+                return
+            
+            # Read CSV data in a single pass, tracking the byte offset for progress
+            lines = _ByteCountingLines(f)
+            reader = csv.DictReader(lines, delimiter=delimiter)
+            current_batch = []
+            
+            for row in reader:
+                current_batch.append(row)
+                
+                if len(current_batch) >= batch_size:
+                    yield current_batch, lines.bytes_read
+                    current_batch = []
+            
+            # Yield any remaining rows
+            if current_batch:
+                yield current_batch, lines.bytes_read
+
+    def _insert_rows_batched(self, table_name, columns, rows, page_size=1000):
+        """Insert rows with execute_values in a single transaction
+        
+        Args:
+            table_name: Target table name
+            columns: Target column names
+            rows: Iterable of row value lists; consumed once
+            page_size: Rows sent per INSERT statement
+            
+        Returns:
+            dict: {'rowcount': rows inserted} or {'error': message}
+        """
+        query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES %s"
+        conn = self.db.connection
+        cur = conn.cursor()
+        
+        with _transaction_block(conn):
+            try:
+                cur.execute(_BULK_LOAD_SETTINGS_SQL)
+                row_count = 0
+                rows = iter(rows)
+                while True:
+                    batch = list(itertools.islice(rows, page_size))
+                    if not batch:
+                        break
+                    execute_values(cur, query, batch, page_size=page_size)
+                    row_count += len(batch)
+                
+                conn.commit()
+                return {'rowcount': row_count}
+                
+            except Exception as e:
+                conn.rollback()
+                return {'error': str(e)}
+            finally:
+                cur.close()
+
+    def _insert_values(self, query, rows, page_size=1000):
+        """Run a 'VALUES %s' statement for many rows with execute_values and commit once
+        
+        Args:
+            query: SQL statement containing a single VALUES %s placeholder
+            rows: List of row tuples
+            page_size: Rows sent per statement
+            
+        Returns:
+            dict: {'rowcount': rows affected} or {'error': message}
+        """
+        if not rows:
+            return {'rowcount': 0}
+        
+        conn = self.db.connection
+        cur = conn.cursor()
+        try:
+            execute_values(cur, query, rows, page_size=page_size)
+            conn.commit()
+            return {'rowcount': cur.rowcount}
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error inserting rows: {str(e)}")
+            return {'error': str(e)}
+        finally:
+            cur.close()
+
+    def _process_import_batch(self, table_name, rows, column_mapping, column_types,
+                              target_columns=None, column_sources=None, page_size=None):
         """Process a batch of rows for import
         
         Args:
@@ -1392,6 +2025,9 @@ class DatabaseManager:
             rows: List of row dictionaries from CSV
             column_mapping: Dictionary mapping CSV columns to DB columns
             column_types: Dictionary of column types
+            target_columns: Target columns, if already resolved by the caller
+            column_sources: Result of _resolve_column_sources for target_columns
+            page_size: Rows per INSERT statement; defaults to one statement per batch
             
         Returns:
             int: Number of successfully inserted rows
@@ -1400,56 +2036,627 @@ class DatabaseManager:
             return 0
         
         try:
-            # Get target columns
-            target_columns = list(set(column_mapping.values()))
+            # Get target columns and resolve their CSV sources unless the caller did
+            if target_columns is None:
+                target_columns = list(set(column_mapping.values()))
+            if column_sources is None:
+                column_sources = self._resolve_column_sources(column_mapping, target_columns, column_types)
+            
+            # Prepare values and insert them with multi-row statements; bad rows are
+            # isolated by splitting the batch instead of retrying it row by row
+            values_list = [self._map_row_values(row, column_sources) for row in rows]
+            query = f"INSERT INTO {table_name} ({', '.join(target_columns)}) VALUES %s"
+            rejected = []
+            
+            conn = self.db.connection
+            with _transaction_block(conn):
+                cur = conn.cursor()
+                try:
+                    cur.execute(_BULK_LOAD_SETTINGS_SQL)
+                    inserted = self._insert_bisecting(cur, query, rows, values_list, rejected, page_size)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    cur.close()
             
-            # Prepare values
-            values_list = []
-            for row in rows:
-                row_values = []
-                for col in target_columns:
-                    # Find original CSV column that maps to this target
-                    source_col = None
-                    for src, tgt in column_mapping.items():
-                        if tgt.lower() == col.lower():
-                            source_col = src
-                            break
-                    
-                    if source_col and source_col in row:
-                        # Get the value and clean it based on column type
-                        value = row[source_col]
-                        col_type = column_types.get(col.lower(), 'varchar')
-                        cleaned_value = self._clean_value_for_type(value, col_type)
-                        row_values.append(cleaned_value)
-                    else:
-                        row_values.append(None)
-                
-                values_list.append(row_values)
+            if rejected:
+                logger.warning(f"Rejected {len(rejected)} of {len(rows)} rows for '{table_name}'")
+                self._quarantine_rows(table_name, rejected)
             
-            # Build the insert query
-            placeholders = ", ".join(["%s"] * len(target_columns))
-            columns_str = ", ".join(target_columns)
+            return inserted
             
-            query = f"INSERT INTO {table_name} ({columns_str}) VALUES "
-            query += ", ".join([f"({placeholders})"] * len(rows))
+        except Exception as e:
+            logger.error(f"Error processing import batch: {str(e)}")
+            # Try individual rows as fallback
+            return self._insert_rows_individually(table_name, rows, target_columns, column_mapping, column_types) 
+
+    def _insert_bisecting(self, cur, query, rows, values_list, rejected, page_size=None):
+        """Insert rows under a savepoint, halving the batch on failure to isolate bad rows
+        
+        A clean batch costs its INSERT statements plus a SAVEPOINT and RELEASE.
+        Each bad row costs about log2(batch size) retries instead of a retry for
+        every row in the batch.
+        
+        Args:
+            cur: Cursor inside an open transaction
+            query: INSERT statement with a single VALUES %s placeholder
+            rows: Source row dictionaries, parallel to values_list
+            values_list: Row value lists to insert
+            rejected: List that receives (row, error message) for each bad row
+            page_size: Rows per INSERT statement; defaults to all rows in one statement
             
-            # Flatten values for parameterized query
-            flat_values = [val for sublist in values_list for val in sublist]
+        Returns:
+            int: Number of rows inserted
+        """
+        cur.execute("SAVEPOINT import_bisect")
+        try:
+            execute_values(cur, query, values_list, page_size=page_size or len(values_list))
+            cur.execute("RELEASE SAVEPOINT import_bisect")
+            return len(values_list)
+        except Exception as e:
+            cur.execute("ROLLBACK TO SAVEPOINT import_bisect")
+            cur.execute("RELEASE SAVEPOINT import_bisect")
             
-            # Execute insert
-            result = self.db.execute_update(query, flat_values)
+            if len(values_list) == 1:
+                rejected.append((rows[0], str(e).strip()))
+                return 0
+        
+        mid = len(values_list) // 2
+        return (self._insert_bisecting(cur, query, rows[:mid], values_list[:mid], rejected, page_size) +
+                self._insert_bisecting(cur, query, rows[mid:], values_list[mid:], rejected, page_size))
+
+    def _quarantine_rows(self, table_name, rejected):
+        """Save rows the database refused into <table_name>_reject for later review
+        
+        Args:
+            table_name: Table the rows were meant for
+            rejected: List of (row dictionary, error message) tuples
+        """
+        reject_table = f"{table_name}_reject"
+        result = self.db.execute_update(f"""
+            CREATE TABLE IF NOT EXISTS {reject_table} (
+                id SERIAL PRIMARY KEY,
+                rejected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                error TEXT,
+                row_data JSONB
+            )
+        """)
+        if 'error' in result and result['error']:
+            logger.error(f"Could not create {reject_table}: {result['error']}")
+            return
+        
+        result = self._insert_values(
+            f"INSERT INTO {reject_table} (error, row_data) VALUES %s",
+            [(error, json.dumps(row, default=str)) for row, error in rejected]
+        )
+        if 'error' not in result:
+            logger.info(f"Saved {len(rejected)} rejected rows to {reject_table}")
+
+    def bulk_copy_import(self, csv_file, table_name, column_mapping=None, delimiter=',', 
+                         has_header=True, progress_callback=None, batch_size=IMPORT_BATCH_SIZE):
+        """Stream a CSV file into a table with a single COPY FROM STDIN
+        
+        The file is read once. Each row is reordered to the mapped table columns,
+        cleaned for the column's type and handed to PostgreSQL in large chunks.
+        If COPY rejects the data, the import falls back to the batched INSERT
+        path, which can skip bad rows.
+        
+        Args:
+            csv_file: Path to the CSV file
+            table_name: Target table name
+            column_mapping: Dictionary or iterable of (csv_column, db_column) pairs;
+                            it is consumed once. When None, CSV headers are matched
+                            to table columns by name.
+            delimiter: CSV field delimiter
+            has_header: Whether the first CSV row is a header row
+            progress_callback: Function called with (rows_read, bytes_read)
+            batch_size: Rows per INSERT batch if COPY fails
             
-            if 'error' in result and result['error']:
-                logger.error(f"Error inserting batch: {result['error']}")
-                # Fall back to individual inserts
-                return self._insert_rows_individually(table_name, rows, target_columns, column_mapping, column_types)
+        Returns:
+            dict: Import results
+        """
+        try:
+            # Get column types from database
+            table_structure = self.get_cached_table_structure(table_name)
+            column_types = {col['name'].lower(): col['type'].lower() for col in table_structure}
+            
+            with _open_for_import(csv_file) as f:
+                lines = _ByteCountingLines(f)
+                reader = csv.reader(lines, delimiter=delimiter)
+                
+                if has_header:
+                    csv_headers = next(reader, [])
+                else:
+                    # Without headers, CSV fields line up with the table's columns
+                    csv_headers = [col['name'] for col in table_structure]
+                
+                if column_mapping is None:
+                    column_pairs = ((h, h.lower()) for h in csv_headers if h.lower() in column_types)
+                elif isinstance(column_mapping, dict):
+                    column_pairs = column_mapping.items()
+                else:
+                    column_pairs = column_mapping
+                
+                # Resolve the mapping to column positions once, not per row
+                header_index = {h: i for i, h in enumerate(csv_headers)}
+                source_indices = []
+                target_columns = []
+                for csv_col, db_col in column_pairs:
+                    if db_col and csv_col in header_index and db_col not in target_columns:
+                        source_indices.append(header_index[csv_col])
+                        target_columns.append(db_col)
+                
+                # The mapping actually applied, for the fallback path and the result
+                applied_mapping = dict(zip([csv_headers[i] for i in source_indices], target_columns))
+                
+                if not target_columns:
+                    return {'success': False, 'error': "No columns in CSV match table columns"}
+                
+                # Resolve each column's cleaner once so the row loop only calls functions
+                converters = [_converter_for_type(column_types.get(col.lower(), 'varchar'))
+                              for col in target_columns]
+                row_count = 0
+                
+                def mapped_rows():
+                    nonlocal row_count
+                    for row in reader:
+                        row_count += 1
+                        yield [convert(row[i]) if i < len(row) else None
+                               for i, convert in zip(source_indices, converters)]
+                        
+                        if progress_callback and row_count % 1000 == 0:
+                            progress_callback(row_count, lines.bytes_read)
+                
+                copy_sql = f"COPY {table_name} ({', '.join(target_columns)}) FROM STDIN WITH (FORMAT CSV)"
+                
+                # Parse and clean on a reader thread while this one feeds COPY
+                rows = _read_ahead(mapped_rows())
+                with _transaction_block(self.db.connection):
+                    cur = self.db.connection.cursor()
+                    try:
+                        cur.execute(_BULK_LOAD_SETTINGS_SQL)
+                        cur.copy_expert(copy_sql, _CsvRowStream(rows), size=65536)
+                        self.db.connection.commit()
+                    except Exception as e:
+                        self.db.connection.rollback()
+                        rows.close()
+                        logger.warning(f"COPY into '{table_name}' failed, falling back to batched inserts: {str(e)}")
+                        return self._execute_mapped_import_with_progress(
+                            csv_file, table_name, applied_mapping,
+                            progress_callback=progress_callback, delimiter=delimiter,
+                            batch_size=batch_size)
+                    finally:
+                        cur.close()
+                
+                if progress_callback:
+                    progress_callback(row_count, lines.bytes_read)
+            
+            logger.info(f"Copied {row_count} rows into '{table_name}'")
+            return {
+                'success': True,
+                'table': table_name,
+                'total_rows': row_count,
+                'successful_rows': row_count,
+                'column_mapping': applied_mapping
+            }
+            
+        except Exception as e:
+            logger.error(f"Error bulk importing CSV: {str(e)}")
+            return {'success': False, 'error': str(e)}
+
+    def copy_import(self, csv_file, table_name, column_mapping=None, delimiter=',',
+                    has_header=True, progress_callback=None, batch_size=IMPORT_BATCH_SIZE,
+                    clean_on_error=True):
+        """Load a CSV file with COPY and let PostgreSQL parse and coerce the values
+        
+        Values are not cleaned in Python. When every CSV column is mapped in file
+        order, the raw file bytes are sent to the server unchanged. Otherwise
+        only the mapped fields are passed through. Empty fields become NULL.
+        If the server rejects the data (for example "$1,234" in a numeric
+        column), the import falls back to bulk_copy_import, which cleans values.
+        
+        Args:
+            csv_file: Path to the CSV file
+            table_name: Target table name
+            column_mapping: Dictionary or iterable of (csv_column, db_column) pairs;
+                            it is consumed once. When None, CSV headers are matched
+                            to table columns by name.
+            delimiter: CSV field delimiter
+            has_header: Whether the first CSV row is a header row
+            progress_callback: Function called with (rows_read, bytes_read)
+            batch_size: Rows per INSERT batch if both COPY attempts fail
+            clean_on_error: Retry with values cleaned in Python if the server rejects
+                            the raw data; when False the server's error is returned
+            
+        Returns:
+            dict: Import results
+        """
+        try:
+            table_structure = self.get_cached_table_structure(table_name)
+            table_columns = {col['name'].lower() for col in table_structure}
             
-            return len(rows)
+            # Read just the header line to resolve the mapping
+            with open(csv_file, 'r', newline='', encoding='utf-8-sig') as f:
+                if has_header:
+                    csv_headers = next(csv.reader(f, delimiter=delimiter), [])
+                else:
+                    csv_headers = [col['name'] for col in table_structure]
+            
+            if column_mapping is None:
+                column_pairs = ((h, h.lower()) for h in csv_headers if h.lower() in table_columns)
+            elif isinstance(column_mapping, dict):
+                column_pairs = column_mapping.items()
+            else:
+                column_pairs = column_mapping
+            
+            header_index = {h: i for i, h in enumerate(csv_headers)}
+            source_indices = []
+            target_columns = []
+            for csv_col, db_col in column_pairs:
+                if db_col and csv_col in header_index and db_col not in target_columns:
+                    source_indices.append(header_index[csv_col])
+                    target_columns.append(db_col)
+            
+            applied_mapping = dict(zip([csv_headers[i] for i in source_indices], target_columns))
+            
+            if not target_columns:
+                return {'success': False, 'error': "No columns in CSV match table columns"}
+            
+            col_list = ', '.join(target_columns)
+            delimiter_sql = delimiter.replace("'", "''")
+            
+            # The file can go to the server untouched only if it has exactly the mapped columns, in order
+            passthrough = source_indices == list(range(len(csv_headers)))
+            header_sql = 'true' if passthrough and has_header else 'false'
+            copy_sql_template = (f"COPY {table_name} ({col_list}) FROM STDIN WITH "
+                                 f"(FORMAT csv, HEADER {{header}}, DELIMITER '{delimiter_sql}', "
+                                 f"NULL '', FORCE_NULL ({col_list}))")
+            copy_sql = copy_sql_template.format(header=header_sql)
+            
+            with _transaction_block(self.db.connection):
+                cur = self.db.connection.cursor()
+                try:
+                    # Parallel ranges are committed together with two-phase commit, which
+                    # the server only supports when max_prepared_transactions allows it
+                    parallel = (passthrough and os.path.getsize(csv_file) >= _PARALLEL_COPY_MIN_BYTES
+                                and self._prepared_transaction_slots(cur) >= _PARALLEL_COPY_WORKERS)
+                    cur.execute(_BULK_LOAD_SETTINGS_SQL)
+                    with _open_for_import(csv_file) as f:
+                        if parallel:
+                            row_count, bytes_read = self._parallel_copy(
+                                csv_file, copy_sql_template.format(header='false'),
+                                has_header, progress_callback)
+                        elif passthrough:
+                            stream = _ProgressReader(f, progress_callback)
+                            cur.copy_expert(copy_sql, stream, size=65536)
+                            row_count = stream.lines_read - (1 if has_header else 0)
+                            bytes_read = stream.bytes_read
+                        else:
+                            # Send only the mapped fields, still as raw text
+                            lines = _ByteCountingLines(f)
+                            reader = csv.reader(lines, delimiter=delimiter)
+                            if has_header:
+                                next(reader, None)
+                            row_count = 0
+                            
+                            def projected_rows():
+                                nonlocal row_count
+                                for row in reader:
+                                    row_count += 1
+                                    yield [row[i] if i < len(row) else None for i in source_indices]
+                                    
+                                    if progress_callback and row_count % 1000 == 0:
+                                        progress_callback(row_count, lines.bytes_read)
+                            
+                            cur.copy_expert(copy_sql, _CsvRowStream(projected_rows()), size=65536)
+                            bytes_read = lines.bytes_read
+                        
+                        # The server knows exactly how many rows were copied
+                        if cur.rowcount is not None and cur.rowcount >= 0:
+                            row_count = cur.rowcount
+                    self.db.connection.commit()
+                except Exception as e:
+                    self.db.connection.rollback()
+                    if not clean_on_error or isinstance(e, _PartialCopyError):
+                        # Reloading after a partial commit would duplicate the committed rows
+                        logger.error(f"Raw COPY into '{table_name}' failed: {str(e)}")
+                        return {'success': False, 'error': str(e).strip()}
+                    
+                    logger.warning(f"Raw COPY into '{table_name}' failed, retrying with cleaned values: {str(e)}")
+                    return self.bulk_copy_import(
+                        csv_file, table_name, applied_mapping, delimiter=delimiter,
+                        has_header=has_header, progress_callback=progress_callback,
+                        batch_size=batch_size)
+                finally:
+                    cur.close()
+            
+            if progress_callback:
+                progress_callback(row_count, bytes_read)
+            
+            logger.info(f"Copied {row_count} raw rows into '{table_name}'")
+            return {
+                'success': True,
+                'table': table_name,
+                'total_rows': row_count,
+                'successful_rows': row_count,
+                'column_mapping': applied_mapping
+            }
             
         except Exception as e:
-            logger.error(f"Error processing import batch: {str(e)}")
-            # Try individual rows as fallback
-            return self._insert_rows_individually(table_name, rows, target_columns, column_mapping, column_types) 
+            logger.error(f"Error copying CSV: {str(e)}")
+            return {'success': False, 'error': str(e)}
+
+    def _parallel_copy(self, csv_file, copy_sql, has_header, progress_callback=None):
+        """COPY byte ranges of a large CSV file over several connections at once
+        
+        Every range is loaded in its own two-phase transaction. All of them are
+        prepared before any is committed, so a failed range rolls every range
+        back. The server must allow at least one prepared transaction per range
+        (see _prepared_transaction_slots).
+        
+        Args:
+            csv_file: Path to the CSV file
+            copy_sql: COPY ... FROM STDIN statement without a header row
+            has_header: Whether the file starts with a header record to skip
+            progress_callback: Function called with (rows_read, bytes_read) totals
+            
+        Returns:
+            tuple: (rows copied, bytes read)
+            
+        Raises:
+            _PartialCopyError: A prepared range could not be committed after others were
+            Exception: The first error from any range, after all are rolled back
+        """
+        boundaries = _csv_record_boundaries(csv_file, _PARALLEL_COPY_WORKERS, skip_header=has_header)
+        ranges = list(zip(boundaries, boundaries[1:]))
+        
+        progress_lock = threading.Lock()
+        progress = {'lines': 0, 'bytes': 0}
+        
+        def copy_range(conn, start, end):
+            last = {'lines': 0, 'bytes': 0}
+            
+            def report(lines_read, bytes_read):
+                with progress_lock:
+                    progress['lines'] += lines_read - last['lines']
+                    progress['bytes'] += bytes_read - last['bytes']
+                    totals = (progress['lines'], progress['bytes'])
+                last['lines'], last['bytes'] = lines_read, bytes_read
+                if progress_callback:
+                    progress_callback(*totals)
+            
+            with _open_for_import(csv_file, start, end - start) as f, conn.cursor() as cur:
+                cur.execute(_BULK_LOAD_SETTINGS_SQL)
+                cur.copy_expert(copy_sql, _ProgressReader(_ByteRangeReader(f, start, end), report),
+                                size=65536)
+                return cur.rowcount
+        
+        # Global transaction ids, unique to this load
+        load_id = f"fa-copy-{os.getpid()}-{time.time_ns()}"
+        gids = [f"{load_id}-{i}" for i in range(len(ranges))]
+        
+        connections = []
+        try:
+            for gid in gids:
+                conn = self.db.new_connection()
+                connections.append(conn)
+                conn.tpc_begin(gid)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                futures = [pool.submit(copy_range, conn, start, end)
+                           for conn, (start, end) in zip(connections, ranges)]
+                concurrent.futures.wait(futures)
+            
+            errors = [future.exception() for future in futures if future.exception()]
+            try:
+                if errors:
+                    raise errors[0]
+                for conn in connections:
+                    conn.tpc_prepare()
+            except Exception:
+                # Nothing is committed yet; undo prepared and open ranges alike
+                for conn in connections:
+                    try:
+                        conn.tpc_rollback()
+                    except Exception as e:
+                        logger.error(f"Error rolling back a parallel COPY range: {str(e)}")
+                raise
+            
+            uncommitted = []
+            for gid, conn in zip(gids, connections):
+                try:
+                    conn.tpc_commit()
+                except Exception as e:
+                    logger.error(f"Error committing prepared COPY range {gid}: {str(e)}")
+                    uncommitted.append(gid)
+            
+            # A prepared transaction survives its connection; finish it from a fresh one
+            if uncommitted:
+                conn = self.db.new_connection()
+                try:
+                    conn.autocommit = True
+                    with conn.cursor() as cur:
+                        for gid in uncommitted[:]:
+                            try:
+                                cur.execute("COMMIT PREPARED %s", (gid,))
+                                uncommitted.remove(gid)
+                            except Exception as e:
+                                logger.error(f"Error committing prepared COPY range {gid}: {str(e)}")
+                finally:
+                    conn.close()
+            if uncommitted:
+                raise _PartialCopyError(
+                    f"{len(uncommitted)} of {len(gids)} ranges are still prepared but not committed "
+                    f"({', '.join(uncommitted)}); run COMMIT PREPARED or ROLLBACK PREPARED for them")
+            
+            logger.info(f"Copied {csv_file} over {len(ranges)} connections")
+            return sum(future.result() for future in futures), boundaries[-1]
+        finally:
+            for conn in connections:
+                conn.close()
+
+    @staticmethod
+    def _prepared_transaction_slots(cur):
+        """Return how many prepared transactions the server allows (0 disables them)
+        
+        Args:
+            cur: Cursor on the connection to ask through
+        """
+        cur.execute("SELECT current_setting('max_prepared_transactions')::int")
+        return cur.fetchone()[0]
+
+    def should_defer_indexes(self, table_name, csv_bytes):
+        """Decide whether an append import is large enough to rebuild indexes afterwards
+        
+        Dropping and rebuilding indexes scans the whole table under an exclusive
+        lock, which only pays off when the load is a sizeable part of the table.
+        
+        Args:
+            table_name: Table about to be loaded
+            csv_bytes: Size of the CSV file in bytes
+            
+        Returns:
+            bool: True if the CSV is at least _DEFER_INDEXES_MIN_RATIO of the table's size
+        """
+        result = self.execute_query("SELECT pg_table_size(%s::regclass)", [table_name])
+        if 'error' in result and result['error'] or not result.get('rows'):
+            return False
+        return csv_bytes >= result['rows'][0][0] * _DEFER_INDEXES_MIN_RATIO
+
+    def drop_secondary_indexes(self, table_name):
+        """Drop a table's plain (non-primary, non-unique) indexes before a bulk load
+        
+        Primary key and unique indexes stay in place because they back
+        constraints. Each definition is recorded in _DEFERRED_INDEXES_TABLE in
+        the same transaction as its drop, so restore_pending_indexes can rebuild
+        it if the import never gets to restore_indexes.
+        
+        Args:
+            table_name: Table about to be loaded
+            
+        Returns:
+            list: CREATE INDEX statements for the indexes that were dropped
+        """
+        result = self.execute_query(
+            """
+            SELECT i.indexrelid::regclass::text, pg_get_indexdef(i.indexrelid)
+            FROM pg_index i
+            WHERE i.indrelid = %s::regclass
+              AND NOT i.indisprimary
+              AND NOT i.indisunique
+            """,
+            [table_name]
+        )
+        if 'error' in result and result['error']:
+            logger.warning(f"Could not list indexes on '{table_name}': {result['error']}")
+            return []
+        if not result.get('rows'):
+            return []
+        
+        ledger = self.db.execute_update(
+            f"CREATE TABLE IF NOT EXISTS {_DEFERRED_INDEXES_TABLE} ("
+            "index_def TEXT PRIMARY KEY, table_name TEXT NOT NULL, "
+            "dropped_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+        )
+        if 'error' in ledger and ledger['error']:
+            logger.warning(f"Not dropping indexes on '{table_name}': {ledger['error']}")
+            return []
+        
+        conn = self.db.connection
+        dropped = []
+        for index_name, index_def in result['rows']:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"INSERT INTO {_DEFERRED_INDEXES_TABLE} (index_def, table_name) VALUES (%s, %s) "
+                        "ON CONFLICT (index_def) DO NOTHING",
+                        (index_def, table_name)
+                    )
+                    cur.execute(f"DROP INDEX IF EXISTS {index_name}")
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.warning(f"Could not drop index {index_name}: {str(e)}")
+                continue
+            dropped.append(index_def)
+        
+        if dropped:
+            logger.info(f"Dropped {len(dropped)} indexes on '{table_name}' for bulk load")
+        return dropped
+
+    def restore_indexes(self, index_definitions):
+        """Recreate indexes dropped by drop_secondary_indexes
+        
+        Each index is created and its _DEFERRED_INDEXES_TABLE record removed in
+        one transaction; a failed index keeps its record for the next attempt.
+        
+        Args:
+            index_definitions: CREATE INDEX statements to run
+            
+        Returns:
+            list: Error messages for the indexes that could not be recreated
+        """
+        conn = self.db.connection
+        errors = []
+        for index_def in index_definitions:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(index_def)
+                    cur.execute(f"DELETE FROM {_DEFERRED_INDEXES_TABLE} WHERE index_def = %s", (index_def,))
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Error recreating index ({index_def}): {str(e)}")
+                errors.append(f"{index_def}: {str(e)}")
+        return errors
+
+    def restore_pending_indexes(self):
+        """Rebuild indexes recorded as dropped by an import that did not restore them
+        
+        Returns:
+            list: Error messages for the indexes that could not be recreated
+        """
+        result = self.execute_query("SELECT to_regclass(%s) IS NOT NULL", [_DEFERRED_INDEXES_TABLE])
+        if 'error' in result and result['error'] or not result.get('rows') or not result['rows'][0][0]:
+            return []
+        
+        pending = self.execute_query(f"SELECT index_def FROM {_DEFERRED_INDEXES_TABLE} ORDER BY dropped_at")
+        if 'error' in pending and pending['error'] or not pending.get('rows'):
+            return []
+        
+        logger.warning(f"Rebuilding {len(pending['rows'])} indexes left dropped by an interrupted import")
+        return self.restore_indexes([row[0] for row in pending['rows']])
+
+    def ensure_invoice_indexes(self):
+        """Create the indexes the invoice list, filter and detail queries rely on
+        
+        Indexes whose table or columns are missing are skipped.
+        
+        Returns:
+            list: Names of the indexes that exist after the call
+        """
+        ensured = []
+        for table_name, index_name, key_columns, include_columns in _INVOICE_LOOKUP_INDEXES:
+            if table_name not in self.tables_set:
+                continue
+            
+            table_columns = {col['name'].lower() for col in self.get_cached_table_structure(table_name)}
+            needed = [column.split()[0] for column in key_columns + include_columns]
+            if not all(column in table_columns for column in needed):
+                continue
+            
+            index_sql = f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({', '.join(key_columns)})"
+            if include_columns:
+                index_sql += f" INCLUDE ({', '.join(include_columns)})"
+            
+            result = self.db.execute_update(index_sql)
+            if 'error' in result and result['error']:
+                logger.warning(f"Could not create index {index_name}: {result['error']}")
+                continue
+            ensured.append(index_name)
+        
+        return ensured
 
     def ensure_private_equity_schema(self):
         """Ensure the database has the necessary tables and views for private equity fund management.
@@ -1462,7 +2669,7 @@ class DatabaseManager:
         try:
             # Check if required tables exist
             required_tables = ['invoices', 'vendors', 'funds']
-            missing_tables = [table for table in required_tables if table not in self.tables]
+            missing_tables = [table for table in required_tables if table not in self.tables_set]
             
             if missing_tables:
                 logger.info(f"Creating missing tables for private equity: {missing_tables}")
@@ -1474,7 +2681,7 @@ class DatabaseManager:
                 self._fetch_tables()
             
             # Create or update the deal_allocations table if it doesn't exist
-            if 'deal_allocations' not in self.tables:
+            if 'deal_allocations' not in self.tables_set:
                 logger.info("Creating deal_allocations table for private equity fund management")
                 
                 # SQL to create the deal_allocations table
@@ -1495,7 +2702,7 @@ class DatabaseManager:
                 self._fetch_tables()
             
             # Create or update the expense_allocation table if it doesn't exist
-            if 'expense_allocation' not in self.tables:
+            if 'expense_allocation' not in self.tables_set:
                 logger.info("Creating expense_allocation table for private equity fund management")
                 
                 # SQL to create the expense_allocation table
@@ -1542,27 +2749,27 @@ class DatabaseManager:
                 funds_result = self.db.execute_query("SELECT id, name FROM funds")
                 
                 if 'rows' in funds_result and funds_result['rows']:
+                    # Sample deals for each fund
+                    deals = []
                     for fund in funds_result['rows']:
                         fund_id = fund[0]
-                        
-                        # Sample deals for each fund
-                        deals = [
+                        deals.extend([
                             (f"Deal A - Fund {fund_id}", fund_id, 40.0),
                             (f"Deal B - Fund {fund_id}", fund_id, 30.0),
                             (f"Deal C - Fund {fund_id}", fund_id, 20.0),
                             (f"Operations - Fund {fund_id}", fund_id, 10.0)
-                        ]
-                        
-                        for deal in deals:
-                            self.db.execute_update(
-                                """
-                                INSERT INTO deal_allocations 
-                                (deal_name, fund_id, allocation_percentage) 
-                                VALUES (%s, %s, %s)
-                                ON CONFLICT (deal_name, fund_id) DO NOTHING
-                                """,
-                                deal
-                            )
+                        ])
+                    
+                    # One multi-row INSERT instead of a round trip and commit per deal
+                    self._insert_values(
+                        """
+                        INSERT INTO deal_allocations 
+                        (deal_name, fund_id, allocation_percentage) 
+                        VALUES %s
+                        ON CONFLICT (deal_name, fund_id) DO NOTHING
+                        """,
+                        deals
+                    )
                 
                 logger.info("Sample deal allocation data inserted")
                 
@@ -1587,32 +2794,32 @@ class DatabaseManager:
             if 'rows' in invoices_result and invoices_result['rows']:
                 logger.info(f"Linking {len(invoices_result['rows'])} invoices to deals")
                 
+                # Load every fund's deals once rather than querying per invoice
+                deals_result = self.db.execute_query("SELECT id, fund_id FROM deal_allocations")
+                deals_by_fund = {}
+                for deal_id, deal_fund_id in deals_result.get('rows', []):
+                    deals_by_fund.setdefault(deal_fund_id, []).append(deal_id)
+                
+                import random
+                allocations = []
                 for invoice in invoices_result['rows']:
                     invoice_id = invoice[0]
-                    fund_id = invoice[2]
+                    fund_deals = deals_by_fund.get(invoice[2])
                     
-                    if fund_id:
-                        # Get deals for this fund
-                        deals_result = self.db.execute_query(
-                            "SELECT id FROM deal_allocations WHERE fund_id = %s",
-                            [fund_id]
-                        )
-                        
-                        if 'rows' in deals_result and deals_result['rows']:
-                            # Randomly assign to a deal
-                            import random
-                            deal_id = random.choice(deals_result['rows'])[0]
-                            
-                            # Create expense allocation
-                            self.db.execute_update(
-                                """
-                                INSERT INTO expense_allocation
-                                (invoice_id, deal_allocation_id, allocation_percentage)
-                                VALUES (%s, %s, 100.0)
-                                ON CONFLICT (invoice_id, deal_allocation_id) DO NOTHING
-                                """,
-                                [invoice_id, deal_id]
-                            )
+                    if fund_deals:
+                        # Randomly assign to a deal
+                        allocations.append((invoice_id, random.choice(fund_deals), 100.0))
+                
+                # Create all expense allocations in one multi-row INSERT
+                self._insert_values(
+                    """
+                    INSERT INTO expense_allocation
+                    (invoice_id, deal_allocation_id, allocation_percentage)
+                    VALUES %s
+                    ON CONFLICT (invoice_id, deal_allocation_id) DO NOTHING
+                    """,
+                    allocations
+                )
                 
                 logger.info("Invoices linked to deals")
         
@@ -9,8 +9,10 @@ import logging
 import os
 import psycopg2
 import psycopg2.extras
-import pandas as pd
-from typing import Dict, List, Any, Tuple, Union, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Tuple, Union, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -28,6 +30,7 @@ class PostgresDatabase:
         self.port = None
         self.user = None
         self.error = None
+        self._conn_params = None
         
     def connect(self, db_name: str, host: str = "localhost", port: int = 5432, 
                 user: str = "postgres", password: str = None) -> bool:
@@ -60,6 +63,7 @@ class PostgresDatabase:
             self.connection = psycopg2.connect(**conn_params)
             self.cursor = self.connection.cursor(cursor_factory=psycopg2.extras.DictCursor)
             self.connected = True
+            self._conn_params = conn_params
             self.db_name = db_name
             self.host = host
             self.port = port
@@ -393,7 +397,7 @@ class PostgresDatabase:
                 'error': str(e)
             }
     
-    def query_to_dataframe(self, query: str, params: List = None) -> pd.DataFrame:
+    def query_to_dataframe(self, query: str, params: List = None) -> 'pd.DataFrame':
         """Execute a query and return results as a pandas DataFrame
         
         Args:
@@ -403,6 +407,9 @@ class PostgresDatabase:
         Returns:
             pd.DataFrame: A pandas DataFrame with the query results
         """
+        # pandas is only needed here, so don't make every connection pay to import it
+        import pandas as pd
+        
         if not self.connected:
             logger.error("Not connected to database")
             return pd.DataFrame()
@@ -413,7 +420,7 @@ class PostgresDatabase:
             logger.error(f"Error executing query to DataFrame: {str(e)}")
             return pd.DataFrame()
     
-    def dataframe_to_table(self, df: pd.DataFrame, table_name: str, if_exists: str = 'replace') -> bool:
+    def dataframe_to_table(self, df: 'pd.DataFrame', table_name: str, if_exists: str = 'replace') -> bool:
         """Write a pandas DataFrame to a database table
         
         Args:
@@ -435,6 +442,16 @@ class PostgresDatabase:
             logger.error(f"Error writing DataFrame to table: {str(e)}")
             return False
     
+    def new_connection(self):
+        """Open an extra connection to the same database, e.g. for parallel loads
+        
+        The caller owns the returned connection and must close it.
+        
+        Returns:
+            psycopg2 connection
+        """
+        return psycopg2.connect(**self._conn_params)
+    
     def close(self):
         """Close the database connection"""
         try:
@@ -141,9 +141,8 @@ class DemoDatabase:
                 placeholders = ", ".join(["?"] * len(rows[0]))
                 query = f"INSERT INTO {table} VALUES ({placeholders})"
                 
-                # Insert each row
-                for row in rows:
-                    cursor.execute(query, row)
+                # One statement per table; sqlite3 reuses the compiled statement for every row
+                cursor.executemany(query, rows)
                     
             self.connection.commit()
             logger.info("Demo data populated successfully")
@@ -588,14 +588,10 @@ class EnhancedInvoiceDashboard:
                     start_date_picker.set_date(today - timedelta(days=30))
                     end_date_picker.set_date(today)
                     
-                    # Variables to store selected dates
-                    selected_start_date = [None]
-                    selected_end_date = [None]
-                    
                     def apply_custom_dates():
-                        selected_start_date[0] = start_date_picker.get_date()
-                        selected_end_date[0] = end_date_picker.get_date()
+                        date_range = (start_date_picker.get_date(), end_date_picker.get_date())
                         date_dialog.destroy()
+                        self._load_filtered_data(status, date_range, fund, search)
                     
                     # Add buttons
                     button_frame = ttk.Frame(frame)
@@ -604,15 +600,26 @@ class EnhancedInvoiceDashboard:
                     ttk.Button(button_frame, text="Apply", command=apply_custom_dates).pack(side=tk.LEFT, padx=5)
                     ttk.Button(button_frame, text="Cancel", command=date_dialog.destroy).pack(side=tk.LEFT, padx=5)
                     
-                    # Wait for dialog to close
-                    self.parent.wait_window(date_dialog)
-                    
-                    # Check if dates were selected
-                    if selected_start_date[0] and selected_end_date[0]:
-                        date_range = (selected_start_date[0], selected_end_date[0])
-                    else:
-                        return  # User cancelled, abort filtering
+                    # Apply loads the data; cancelling just closes the dialog,
+                    # so there is no nested event loop waiting on it
+                    return
+            
+            self._load_filtered_data(status, date_range, fund, search)
             
+        except Exception as e:
+            logger.error(f"Error setting up filters: {str(e)}")
+            self.status_var.set(f"Error: {str(e)}")
+    
+    def _load_filtered_data(self, status, date_range, fund, search):
+        """Load invoices matching the given filter values on a background thread
+        
+        Args:
+            status: Status filter value ('All' for no filter)
+            date_range: (start, end) tuple, or None
+            fund: Fund filter value ('All' for no filter)
+            search: Search text
+        """
+        try:
             # Build filters dictionary
             filters = {}
             if status != 'All':
@@ -1211,45 +1218,51 @@ class EnhancedInvoiceDashboard:
             # Show loading indication
             self.status_var.set("Exporting data...")
             
+            # Read headers and rows from the tree here - Tk must only be touched on the main thread
+            headers = self.invoice_tree['columns']
+            
+            # Clean up headers to remove sort indicators
+            clean_headers = []
+            for col in headers:
+                header_text = self.invoice_tree.heading(col)["text"]
+                if " ↓" in header_text:
+                    header_text = header_text.replace(" ↓", "")
+                elif " ↑" in header_text:
+                    header_text = header_text.replace(" ↑", "")
+                clean_headers.append(header_text)
+            
+            tree_rows = [self.invoice_tree.item(item_id, 'values') for item_id in self.invoice_tree.get_children()]
+            amount_index = list(headers).index('amount') if 'amount' in headers else None
+            
             # Use a thread for export to avoid freezing UI
             def export_thread():
                 try:
-                    # Export headers and data
-                    headers = self.invoice_tree['columns']
                     with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
                         writer = csv.writer(csvfile)
-                        
-                        # Write headers - clean up headers to remove sort indicators
-                        clean_headers = []
-                        for col in headers:
-                            header_text = self.invoice_tree.heading(col)["text"]
-                            if " ↓" in header_text:
-                                header_text = header_text.replace(" ↓", "")
-                            elif " ↑" in header_text:
-                                header_text = header_text.replace(" ↑", "")
-                            clean_headers.append(header_text)
-                        
                         writer.writerow(clean_headers)
                         
-                        # Write data rows - get all values from tree
-                        for item_id in self.invoice_tree.get_children():
-                            row_data = []
-                            for col in headers:
+                        # Write data rows - stream values through a generator
+                        def export_rows():
+                            for values in tree_rows:
+                                row_data = [str(value) for value in values]
                                 # Clean up currency formatting for export
-                                value = self.invoice_tree.set(item_id, col)
-                                if col == 'amount' and value.startswith('$'):
-                                    # Remove $ and commas for better data analysis
-                                    value = value.replace('$', '').replace(',', '')
-                                row_data.append(value)
-                            writer.writerow(row_data)
+                                if amount_index is not None and amount_index < len(row_data):
+                                    value = row_data[amount_index]
+                                    if value.startswith('$'):
+                                        # Remove $ and commas for better data analysis
+                                        row_data[amount_index] = value.replace('$', '').replace(',', '')
+                                yield row_data
+                        
+                        writer.writerows(export_rows())
                     
                     # Update UI in the main thread
                     self.parent.after(0, lambda: self._export_complete(file_path))
                     
                 except Exception as e:
                     logger.error(f"Export error: {str(e)}")
-                    # Update UI in the main thread
-                    self.parent.after(0, lambda: self._export_error(str(e)))
+                    # Update UI in the main thread; bind the message now since e is cleared after except
+                    error_msg = str(e)
+                    self.parent.after(0, lambda: self._export_error(error_msg))
             
             # Start export thread
             thread = threading.Thread(target=export_thread)
@@ -1343,12 +1356,19 @@ class EnhancedInvoiceDashboard:
             issues_frame = ttk.Frame(notebook, padding=10)
             notebook.add(issues_frame, text="Potential Issues")
             
+            # Tab contents are built on first view of each tab for the inspected
+            # table, so opening the inspector only pays for the visible tab
+            inspected = {'table': None, 'structure': None, 'built': set()}
+            
             # Function to inspect selected table
             def inspect_table():
                 selected_table = table_var.get()
                 if not selected_table:
                     return
                 
+                inspected['table'] = None
+                inspected['built'].clear()
+                
                 # Clear previous content
                 for widget in structure_frame.winfo_children():
                     widget.destroy()
@@ -1374,6 +1394,16 @@ class EnhancedInvoiceDashboard:
                     ttk.Label(structure_frame, text=f"Error: {structure_result['error']}").pack()
                     return
                 
+                inspected['table'] = selected_table
+                inspected['structure'] = structure_result
+                
+                # Build whichever tab is currently showing
+                on_tab_changed()
+            
+            def build_structure():
+                """Populate the Structure tab"""
+                structure_result = inspected['structure']
+                
                 # Create structure tree
                 structure_tree = ttk.Treeview(structure_frame, columns=("name", "type", "length", "nullable", "default"))
                 structure_tree.heading("name", text="Column Name")
@@ -1389,21 +1419,31 @@ class EnhancedInvoiceDashboard:
                 structure_tree.column("nullable", width=80)
                 structure_tree.column("default", width=150)
                 
+                # Format all rows up front so the insert loop is just Tcl calls
+                structure_rows = [
+                    (column_name, data_type,
+                     str(max_length) if max_length is not None else "",
+                     "YES" if nullable == "YES" else "NO",
+                     str(default) if default is not None else "")
+                    for column_name, data_type, max_length, nullable, default in structure_result['rows']
+                ]
+                
+                # Populate structure tree before it is mapped so Tk lays it out once
+                insert = structure_tree.insert
+                for values in structure_rows:
+                    insert("", tk.END, values=values)
+                
                 structure_tree.pack(fill=tk.BOTH, expand=True)
                 
                 # Add scrollbar
                 structure_scrollbar = ttk.Scrollbar(structure_frame, orient=tk.VERTICAL, command=structure_tree.yview)
                 structure_tree.configure(yscrollcommand=structure_scrollbar.set)
                 structure_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-                
-                # Populate structure tree
-                for row in structure_result['rows']:
-                    column_name, data_type, max_length, nullable, default = row
-                    length_str = str(max_length) if max_length is not None else ""
-                    nullable_str = "YES" if nullable == "YES" else "NO"
-                    default_str = str(default) if default is not None else ""
-                    
-                    structure_tree.insert("", tk.END, values=(column_name, data_type, length_str, nullable_str, default_str))
+            
+            def build_columns():
+                """Populate the Columns tab with per-column statistics"""
+                selected_table = inspected['table']
+                structure_result = inspected['structure']
                 
                 # Create columns analysis in columns tab
                 columns_text = tk.Text(columns_frame, wrap=tk.WORD, bg=self.bg_medium, fg=self.text_color,
@@ -1458,6 +1498,10 @@ class EnhancedInvoiceDashboard:
                 
                 # Make columns text read-only
                 columns_text.configure(state=tk.DISABLED)
+            
+            def build_data():
+                """Populate the Sample Data tab"""
+                selected_table = inspected['table']
                 
                 # Get sample data
                 data_query = f"""
@@ -1510,6 +1554,11 @@ class EnhancedInvoiceDashboard:
                                     formatted_row.append(str(val))
                             
                             data_tree.insert("", tk.END, values=formatted_row)
+            
+            def build_issues():
+                """Populate the Potential Issues tab"""
+                selected_table = inspected['table']
+                structure_result = inspected['structure']
                 
                 # Identify potential issues
                 issues_text = tk.Text(issues_frame, wrap=tk.WORD, bg=self.bg_medium, fg=self.text_color,
@@ -1617,6 +1666,27 @@ class EnhancedInvoiceDashboard:
                 # Make issues text read-only
                 issues_text.configure(state=tk.DISABLED)
             
+            tab_builders = {
+                str(structure_frame): build_structure,
+                str(columns_frame): build_columns,
+                str(data_frame): build_data,
+                str(issues_frame): build_issues
+            }
+            
+            def on_tab_changed(event=None):
+                """Build the selected tab's contents the first time it is shown"""
+                if inspected['table'] is None:
+                    return
+                
+                tab = notebook.select()
+                if tab in inspected['built'] or tab not in tab_builders:
+                    return
+                
+                inspected['built'].add(tab)
+                tab_builders[tab]()
+            
+            notebook.bind('<<NotebookTabChanged>>', on_tab_changed)
+            
             # Link the inspect button
             inspect_button.configure(command=inspect_table)
             
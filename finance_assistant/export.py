@@ -40,9 +40,8 @@ class ExportManager:
                 # Write headers
                 csv_writer.writerow(results['columns'])
                 
-                # Write data rows
-                for row in results['rows']:
-                    csv_writer.writerow(row)
+                # Write data rows in one call so the csv module drives the loop
+                csv_writer.writerows(results['rows'])
                     
             self.app.ui_manager.display_message("Assistant", f"Data successfully exported to {os.path.basename(file_path)}")
         except Exception as e:
@@ -615,7 +615,7 @@ class CSVImportManager:
                     # Update progress
                     self.progress_info.set(f"Processing row {idx+1}/{total_rows}")
                     self.progress['value'] = idx + 1
-                    progress_window.update()
+                    progress_window.update_idletasks()
                     
                     # Skip completely empty rows
                     if row.isna().all():
@@ -667,7 +667,7 @@ class CSVImportManager:
             
             # Show completion message
             self.progress_info.set(f"Import completed: {success_count} rows imported, {error_count} errors")
-            progress_window.update()
+            progress_window.update_idletasks()
             
             messagebox.showinfo(
                 "Import Complete", 
@@ -494,7 +494,7 @@ class LLMInvoiceDashboard:
         progress.start(10)
         
         # Update the display while processing
-        loading_window.update()
+        loading_window.update_idletasks()
         return loading_window
     
     def _display_results(self, sql_query, result):
@@ -945,7 +945,7 @@ class LLMInvoiceDashboard:
             
             # Start with a loading indicator
             self.status_var.set(f"Fixing schema for {table_name}...")
-            parent_window.update()
+            parent_window.update_idletasks()
             
             # Check and fix table schema
             result = self.db_manager.schema_validator.validate_table_schema(table_name, auto_fix=True)
@@ -1136,7 +1136,7 @@ class LLMInvoiceDashboard:
             def add_text(text):
                 progress_text.insert(tk.END, text + "\n")
                 progress_text.see(tk.END)
-                progress_window.update()
+                progress_window.update_idletasks()
             
             # Fix schemas
             add_text("Starting schema validation and correction...")
@@ -1157,7 +1157,7 @@ class LLMInvoiceDashboard:
                     issues_found += 1
                 
                 tables_fixed += 1
-                progress_window.update()
+                progress_window.update_idletasks()
             
             # Add close button
             ttk.Button(frame, text="Close", command=progress_window.destroy,
@@ -1214,7 +1214,7 @@ class LLMInvoiceDashboard:
             def add_text(text):
                 results_text.insert(tk.END, text + "\n")
                 results_text.see(tk.END)
-                analysis_window.update()
+                analysis_window.update_idletasks()
             
             add_text("Analyzing database schema and types...\n")
             issues_found = 0
@@ -1304,7 +1304,7 @@ class LLMInvoiceDashboard:
         
         # Show the loading animation
         loading_window = self._show_loading_animation()
-        self.window.update()
+        self.window.update_idletasks()
         
         try:
             # Create progress indicator
@@ -7,6 +7,7 @@ A simplified tool for managing financial data with a user-friendly interface.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
 import os
 import sys
 import logging
@@ -15,13 +16,17 @@ from dotenv import load_dotenv
 import re
 import difflib
 import threading
+import queue
+import time
 import csv
 import argparse
+import importlib
+import functools
 
 # Add parent directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from finance_assistant.database.manager import DatabaseManager
+from finance_assistant.database.manager import DatabaseManager, IMPORT_BATCH_SIZE
 
 # Load environment variables from .env file
 load_dotenv()
@@ -45,11 +50,200 @@ except ImportError as e:
     logger = logging.getLogger(__name__)
     logger.warning(f"Enhanced logging not available, using basic logging: {str(e)}")
 
+# Dashboard classes opened from the menus: name -> (module, class)
+DASHBOARD_CLASSES = {
+    'invoice': ('finance_assistant.dashboard', 'InvoiceDashboard'),
+    'modern': ('finance_assistant.modern_dashboard', 'ModernDashboard'),
+    'unified': ('finance_assistant.unified_dashboard', 'UnifiedDashboard'),
+}
+
+# Platform never changes while the app runs
+_PLATFORM = platform.system()
+
+# Connection defaults used when the .env file leaves a setting out
+DB_DEFAULTS = {'DB_HOST': 'localhost', 'DB_PORT': '5432', 'DB_USER': 'postgres'}
+
+# Application color palette
+THEME_PALETTE = {
+    'bg_dark': '#1e1e2e',
+    'bg_medium': '#2a2a3a',
+    'bg_light': '#313145',
+    'accent_color': '#7e57c2',
+    'text_color': '#e0e0e0',
+    'highlight_color': '#bb86fc',
+}
+
+# Style name for accent (primary action) buttons
+ACCENT_BUTTON_STYLE = 'Accent.TButton'
+
+# Named fonts registered once per interpreter: name -> (size, weight)
+NAMED_FONTS = {
+    'FaSmall': (9, 'normal'),
+    'FaBody': (10, 'normal'),
+    'FaBodyBold': (10, 'bold'),
+    'FaLarge': (12, 'normal'),
+    'FaH3': (12, 'bold'),
+    'FaH2': (14, 'bold'),
+    'FaH1': (16, 'bold'),
+    'FaTitle': (18, 'bold'),
+}
+
+def _install_theme(root, palette, font_family):
+    """Configure ttk styles and menu options for a Tk interpreter
+    
+    ttk styles are shared by every window of an interpreter, so repeated calls
+    for the same root interpreter only return the existing style.
+    
+    Args:
+        root: Tk root window
+        palette: Color palette dictionary (see THEME_PALETTE)
+        font_family: Font family for widgets
+        
+    Returns:
+        ttk.Style: The configured style
+    """
+    style = ttk.Style(root)
+    if getattr(_install_theme, '_done', None) is root.tk:
+        return style
+    
+    style.theme_use('clam')  # Most customizable built-in theme
+    
+    # Register named fonts so widgets share font handles instead of resolving tuples.
+    # Tk deletes a named font when its Font object is collected, so the root keeps them.
+    root.named_fonts = {
+        font_name: tkfont.Font(root=root, name=font_name, family=font_family, size=size, weight=weight)
+        for font_name, (size, weight) in NAMED_FONTS.items()
+    }
+    
+    # Configure base styles
+    style.configure('TFrame', background=palette['bg_dark'])
+    style.configure('TLabelframe', background=palette['bg_dark'], foreground=palette['text_color'])
+    style.configure('TLabelframe.Label', background=palette['bg_dark'], foreground=palette['text_color'], font='FaBody')
+    style.configure('TLabel', background=palette['bg_dark'], foreground=palette['text_color'], font='FaBody')
+    style.configure('TButton', background=palette['accent_color'], foreground=palette['text_color'], font='FaBody')
+    style.map('TButton', 
+              background=[('active', palette['highlight_color']), ('pressed', palette['bg_light'])],
+              foreground=[('active', 'white')])
+    style.configure('TEntry', fieldbackground=palette['bg_light'], foreground=palette['text_color'], font='FaBody')
+    
+    # Configure Treeview colors
+    style.configure('Treeview', 
+                    background=palette['bg_medium'], 
+                    foreground=palette['text_color'],
+                    fieldbackground=palette['bg_medium'],
+                    font='FaBody')
+    style.map('Treeview', 
+              background=[('selected', palette['accent_color'])],
+              foreground=[('selected', 'white')])
+    style.configure('Treeview.Heading', font='FaBodyBold')
+    
+    # Configure menu appearance
+    root.option_add('*Menu.background', palette['bg_medium'])
+    root.option_add('*Menu.foreground', palette['text_color'])
+    root.option_add('*Menu.activeBackground', palette['accent_color'])
+    root.option_add('*Menu.activeForeground', 'white')
+    
+    # Accent style for important buttons
+    style.configure(ACCENT_BUTTON_STYLE, font='FaBodyBold')
+    
+    # Configure window background
+    root.configure(background=palette['bg_dark'])
+    
+    _install_theme._done = root.tk
+    return style
+
+@functools.lru_cache(maxsize=8)
+def _header_gradient_data(height, bg_hex):
+    """Build PhotoImage data for a vertical header gradient
+    
+    The gradient runs from bg_hex down to a slightly lighter, bluer shade.
+    
+    Args:
+        height: Gradient height in pixels
+        bg_hex: Starting color as '#rrggbb'
+        
+    Returns:
+        str: One '{#rrggbb}' row per pixel, for PhotoImage.put
+    """
+    # Imported here rather than at module level; the header is drawn at startup, so
+    # this still loads numpy then, but only when the main window is actually built
+    import numpy as np
+    
+    # Integer interpolation of all rows at once into a packed RGB buffer
+    base = np.frombuffer(bytes.fromhex(bg_hex[1:7]), dtype=np.uint8).astype(np.int32)
+    steps = np.array([18, 18, 23], dtype=np.int32)
+    rows = np.arange(height, dtype=np.int32)[:, None]
+    rgb = (base + (rows * steps) // height).astype(np.uint8)
+    
+    hex_colors = rgb.tobytes().hex()
+    return ' '.join('{#' + hex_colors[k:k + 6] + '}' for k in range(0, len(hex_colors), 6))
+
+def _validate_import_request(csv_file, table, create_table):
+    """Check the import dialog's inputs
+    
+    Args:
+        csv_file: Selected CSV path
+        table: Target or new table name
+        create_table: Whether a new table is being created
+        
+    Returns:
+        str: The first problem found, or None if the inputs are complete
+    """
+    if not csv_file:
+        return "Please select a CSV file"
+    if not table:
+        return "Please enter a name for the new table" if create_table else "Please select a target table"
+    return None
+
+def _precheck_csv_file(csv_file):
+    """Check that a CSV file can be read and sniff its delimiter from the first 4 KB
+    
+    Runs on a background thread when a file is chosen, so the Import click
+    doesn't have to touch the disk.
+    
+    Args:
+        csv_file: Path to the CSV file
+        
+    Returns:
+        dict: {'error': message} or {'delimiter': sniffed delimiter or None}
+    """
+    try:
+        if os.path.getsize(csv_file) == 0:
+            return {'error': f"{os.path.basename(csv_file)} is empty"}
+        with open(csv_file, 'rb') as f:
+            sample = f.read(4096).decode('utf-8-sig', errors='replace')
+    except OSError as e:
+        return {'error': f"Cannot read {os.path.basename(csv_file)}: {e.strerror or e}"}
+    
+    try:
+        return {'delimiter': csv.Sniffer().sniff(sample, delimiters=",;\t|").delimiter}
+    except csv.Error:
+        return {'delimiter': None}
+
 class FinancialAssistant:
     """Main application class - simplified version"""
     
-    def __init__(self, use_modern_ui=False):
-        """Initialize the application"""
+    # Header gradient images keyed by (width, height, bg color), shared by all instances
+    _gradient_cache = {}
+    
+    def __init__(self, use_modern_ui=False, headless=False):
+        """Initialize the application
+        
+        Args:
+            use_modern_ui: Open the modern dashboard after connecting
+            headless: Connect and fix the schema without creating any windows
+        """
+        self.headless = headless
+        
+        # LLM client is created on first use (see llm_client); False marks a failed init
+        self._llm_client = None
+        
+        if headless:
+            # No Tk at all: theme, layout and gradients would never be seen
+            self.root = None
+            self.db_manager = DatabaseManager()
+            return
+        
         # Create main window
         self.root = tk.Tk()
         self.root.title("Financial Database Assistant")
@@ -58,82 +252,129 @@ class FinancialAssistant:
         # Initialize database manager
         self.db_manager = DatabaseManager()
         
-        # Initialize LLM client
-        try:
-            from finance_assistant.llm_client import LLMClient
-            self.llm_client = LLMClient()
-            logger.info("LLM client initialized")
-        except Exception as e:
-            logger.error(f"Error initializing LLM client: {str(e)}")
-            self.llm_client = None
-        
         # Store UI preference
         self.use_modern_ui = use_modern_ui
         
+        # Worker threads post (callable, args) here; only the Tk thread runs them
+        self._ui_queue = queue.Queue()
+        
+        # Dashboard classes, imported once on first use or by the preload thread
+        self._dashboards = {}
+        
+        # Open dashboard windows by name, so reopening raises the existing window
+        self._dashboard_windows = {}
+        
+        # Connection and import dialogs, built on first use and hidden between uses
+        self._connect_dialog = None
+        self._import_dialog = None
+        self._about_dialog = None
+        
         # Configure theme
         self._configure_theme()
         
         # Create main layout
         self._create_layout()
         
-        # Try to auto-connect using .env file
-        self._try_auto_connect()
+        # Start applying UI updates posted by worker threads
+        self.root.after(50, self._drain_ui_queue)
+        
+        # Import the dashboard modules in the background so the first click opens quickly
+        threading.Thread(target=self._preload_dashboards, daemon=True).start()
+        
+        # Try to auto-connect using .env file once the window has painted
+        self.root.after(50, self._try_auto_connect)
+    
+    @property
+    def llm_client(self):
+        """LLMClient: Shared LLM client, created on first access (None if unavailable)"""
+        if self._llm_client is None:
+            try:
+                from finance_assistant.llm_client import LLMClient
+                self._llm_client = LLMClient()
+                logger.info("LLM client initialized")
+            except Exception as e:
+                logger.error(f"Error initializing LLM client: {str(e)}")
+                self._llm_client = False
+        return self._llm_client or None
+    
+    def _get_dashboard_cls(self, name):
+        """Return a dashboard class, importing its module the first time
+        
+        Args:
+            name: Key in DASHBOARD_CLASSES
+            
+        Returns:
+            type: The dashboard class
+        """
+        cls = self._dashboards.get(name)
+        if cls is None:
+            module_name, class_name = DASHBOARD_CLASSES[name]
+            cls = getattr(importlib.import_module(module_name), class_name)
+            self._dashboards[name] = cls
+        return cls
+    
+    def _raise_dashboard_window(self, name):
+        """Bring an already open dashboard window to the front
         
+        Args:
+            name: Key in DASHBOARD_CLASSES
+            
+        Returns:
+            bool: True if an open window was raised
+        """
+        window = self._dashboard_windows.get(name)
+        if window is None or not window.winfo_exists():
+            self._dashboard_windows.pop(name, None)
+            return False
+        
+        window.deiconify()
+        window.lift()
+        return True
+    
+    def _preload_dashboards(self):
+        """Import every dashboard module (runs on a background thread)"""
+        for name in DASHBOARD_CLASSES:
+            try:
+                self._get_dashboard_cls(name)
+            except Exception as e:
+                # The menu action will report the error if the user opens it
+                logger.warning(f"Could not preload {name} dashboard: {str(e)}")
+        
+    def _drain_ui_queue(self):
+        """Run UI updates queued by worker threads on the Tk thread"""
+        try:
+            while True:
+                func, args = self._ui_queue.get_nowait()
+                try:
+                    func(*args)
+                except tk.TclError as e:
+                    # The target widget was closed before the update arrived
+                    logger.debug(f"Dropped UI update: {str(e)}")
+        except queue.Empty:
+            pass
+        
+        self.root.after(50, self._drain_ui_queue)
+    
     def _configure_theme(self):
         """Configure the dark gradient theme for the application"""
         # Define color palette
-        self.bg_dark = '#1e1e2e'  # Dark background
-        self.bg_medium = '#2a2a3a'  # Medium background
-        self.bg_light = '#313145'  # Lighter background
-        self.accent_color = '#7e57c2'  # Purple accent
-        self.text_color = '#e0e0e0'  # Light text
-        self.highlight_color = '#bb86fc'  # Highlight color
+        self.bg_dark = THEME_PALETTE['bg_dark']  # Dark background
+        self.bg_medium = THEME_PALETTE['bg_medium']  # Medium background
+        self.bg_light = THEME_PALETTE['bg_light']  # Lighter background
+        self.accent_color = THEME_PALETTE['accent_color']  # Purple accent
+        self.text_color = THEME_PALETTE['text_color']  # Light text
+        self.highlight_color = THEME_PALETTE['highlight_color']  # Highlight color
 
         # Determine platform-specific font
-        if platform.system() == "Windows":
+        if _PLATFORM == "Windows":
             self.font_family = "Segoe UI"
-        elif platform.system() == "Darwin":  # macOS
+        elif _PLATFORM == "Darwin":  # macOS
             self.font_family = "SF Pro Text"
         else:  # Linux
             self.font_family = "Ubuntu"
-            
-        # Configure style
-        self.style = ttk.Style()
-        self.style.theme_use('clam')  # Most customizable built-in theme
-        
-        # Configure base styles
-        self.style.configure('TFrame', background=self.bg_dark)
-        self.style.configure('TLabelframe', background=self.bg_dark, foreground=self.text_color)
-        self.style.configure('TLabelframe.Label', background=self.bg_dark, foreground=self.text_color, font=(self.font_family, 10))
-        self.style.configure('TLabel', background=self.bg_dark, foreground=self.text_color, font=(self.font_family, 10))
-        self.style.configure('TButton', background=self.accent_color, foreground=self.text_color, font=(self.font_family, 10))
-        self.style.map('TButton', 
-                      background=[('active', self.highlight_color), ('pressed', self.bg_light)],
-                      foreground=[('active', 'white')])
-        self.style.configure('TEntry', fieldbackground=self.bg_light, foreground=self.text_color, font=(self.font_family, 10))
-        
-        # Configure Treeview colors
-        self.style.configure('Treeview', 
-                           background=self.bg_medium, 
-                           foreground=self.text_color,
-                           fieldbackground=self.bg_medium,
-                           font=(self.font_family, 10))
-        self.style.map('Treeview', 
-                      background=[('selected', self.accent_color)],
-                      foreground=[('selected', 'white')])
-        self.style.configure('Treeview.Heading', font=(self.font_family, 10, 'bold'))
-        
-        # Configure menu appearance
-        self.root.option_add('*Menu.background', self.bg_medium)
-        self.root.option_add('*Menu.foreground', self.text_color)
-        self.root.option_add('*Menu.activeBackground', self.accent_color)
-        self.root.option_add('*Menu.activeForeground', 'white')
-        
-        # Accent style for important buttons
-        self.style.configure('Accent.TButton', font=(self.font_family, 10, 'bold'))
-        
-        # Configure window background
-        self.root.configure(background=self.bg_dark)
+        
+        # Styles are global to the Tk interpreter, so they are only installed once
+        self.style = _install_theme(self.root, THEME_PALETTE, self.font_family)
         
     def _create_layout(self):
         """Create the main layout"""
@@ -152,18 +393,13 @@ class FinancialAssistant:
         header_canvas = tk.Canvas(header_frame, height=60, bg=self.bg_dark, highlightthickness=0)
         header_canvas.pack(fill=tk.X, expand=True)
         
-        # Draw gradient in header
-        for i in range(60):
-            # Calculate color for each line to create gradient
-            r = int(30 + (i/60) * 18)
-            g = int(30 + (i/60) * 18)
-            b = int(46 + (i/60) * 23)
-            color = f'#{r:02x}{g:02x}{b:02x}'
-            header_canvas.create_line(0, i, 2000, i, fill=color)
+        # Draw gradient in header as a single cached image
+        self.header_gradient = self._get_header_gradient(60)
+        header_canvas.create_image(0, 0, image=self.header_gradient, anchor='nw')
         
         # Add title to header
         header_canvas.create_text(20, 30, text="Financial Database Assistant", 
-                                 fill=self.text_color, font=(self.font_family, 16, 'bold'),
+                                 fill=self.text_color, font='FaH1',
                                  anchor='w')
         
         # Create toolbar with styled buttons
@@ -174,17 +410,18 @@ class FinancialAssistant:
         button_frame = tk.Frame(toolbar, bg=self.bg_medium, padx=5, pady=5)
         button_frame.pack(fill=tk.X)
         
+        # Look up the widget class and handlers once for both button rows
+        Button = ttk.Button
+        connect = self._connect_database
+        unified = self._show_unified_dashboard
+        modern = self._show_modern_dashboard
+        
         # Add toolbar buttons with icons using the accent style
-        ttk.Button(button_frame, text="Connect Database", style="Accent.TButton", 
-                  command=self._connect_database).pack(side=tk.LEFT, padx=5)
-                  
-        # Button for Unified Dashboard
-        ttk.Button(button_frame, text="Unified Dashboard", style="Accent.TButton", 
-                  command=self._show_unified_dashboard).pack(side=tk.LEFT, padx=5)
-                  
-        # Button for Modern Dashboard 
-        ttk.Button(button_frame, text="Modern Dashboard", style="Accent.TButton", 
-                  command=self._show_modern_dashboard).pack(side=tk.LEFT, padx=5)
+        for text, command in (("Connect Database", connect),
+                              ("Unified Dashboard", unified),
+                              ("Modern Dashboard", modern)):
+            Button(button_frame, text=text, style=ACCENT_BUTTON_STYLE,
+                   command=command).pack(side=tk.LEFT, padx=5)
         
         # Create status bar with gradient effect
         status_frame = tk.Frame(main_frame, height=25, bg=self.bg_medium)
@@ -205,27 +442,55 @@ class FinancialAssistant:
         welcome_frame.pack(fill=tk.BOTH, expand=True)
         
         ttk.Label(welcome_frame, text="Welcome to Financial Database Assistant", 
-                font=(self.font_family, 18, 'bold')).pack(pady=(50, 20))
+                font='FaTitle').pack(pady=(50, 20))
         
         ttk.Label(welcome_frame, text="Connect to a database to get started, or use the toolbar to access dashboards.",
-                font=(self.font_family, 12)).pack(pady=10)
+                font='FaLarge').pack(pady=10)
         
         # Add quick access buttons
         button_frame = ttk.Frame(welcome_frame)
         button_frame.pack(pady=30)
         
-        ttk.Button(button_frame, text="Connect to Database", style="Accent.TButton",
-                 command=self._connect_database, width=25).pack(pady=5)
-        ttk.Button(button_frame, text="Open Unified Dashboard", style="Accent.TButton",
-                 command=self._show_unified_dashboard, width=25).pack(pady=5)
-        ttk.Button(button_frame, text="Open Modern Dashboard", style="Accent.TButton", 
-                 command=self._show_modern_dashboard, width=25).pack(pady=5)
+        for text, command in (("Connect to Database", connect),
+                              ("Open Unified Dashboard", unified),
+                              ("Open Modern Dashboard", modern)):
+            Button(button_frame, text=text, style=ACCENT_BUTTON_STYLE,
+                   command=command, width=25).pack(pady=5)
         
+    def _get_header_gradient(self, height, width=2000):
+        """Return a header gradient image, building it once per size and palette
+        
+        The main window and dialogs share these images, so each size is only
+        rendered once.
+        
+        Args:
+            height: Gradient height in pixels
+            width: Image width in pixels
+            
+        Returns:
+            tk.PhotoImage: The gradient image
+        """
+        key = (width, height, self.bg_dark)
+        image = self._gradient_cache.get(key)
+        
+        # Images belong to one Tk interpreter; rebuild if the cached one came from another root
+        if image is None or image.tk is not self.root.tk:
+            image = tk.PhotoImage(master=self.root, width=width, height=height)
+            # One 1-pixel-wide column of colors, tiled by Tk across the whole image
+            image.put(_header_gradient_data(height, self.bg_dark), to=(0, 0, width, height))
+            FinancialAssistant._gradient_cache[key] = image
+        return image
+    
     def _create_menu(self):
         """Create the menu bar"""
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
         
+        # Handlers that appear under more than one menu
+        unified = self._show_unified_dashboard
+        modern = self._show_modern_dashboard
+        fix_schema = self._fix_database_schema
+        
         # File menu
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
@@ -236,10 +501,10 @@ class FinancialAssistant:
         # Database menu
         db_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Database", menu=db_menu)
-        db_menu.add_command(label="Unified Dashboard", command=self._show_unified_dashboard)
-        db_menu.add_command(label="Modern Dashboard", command=self._show_modern_dashboard)
+        db_menu.add_command(label="Unified Dashboard", command=unified)
+        db_menu.add_command(label="Modern Dashboard", command=modern)
         db_menu.add_separator()
-        db_menu.add_command(label="Fix Database Schema", command=self._fix_database_schema)
+        db_menu.add_command(label="Fix Database Schema", command=fix_schema)
         db_menu.add_command(label="Schema Inspector", command=self._show_schema_inspector)
         
         # Import/Export menu
@@ -251,7 +516,7 @@ class FinancialAssistant:
         # Tools menu
         tools_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Tools", menu=tools_menu)
-        tools_menu.add_command(label="Fix Database Schema", command=self._fix_database_schema)
+        tools_menu.add_command(label="Fix Database Schema", command=fix_schema)
         
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -262,147 +527,112 @@ class FinancialAssistant:
         dashboard_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Dashboards", menu=dashboard_menu)
         
-        dashboard_menu.add_command(label="Unified Dashboard", command=self._show_unified_dashboard)
-        dashboard_menu.add_command(label="Modern Dashboard", command=self._show_modern_dashboard)
+        dashboard_menu.add_command(label="Unified Dashboard", command=unified)
+        dashboard_menu.add_command(label="Modern Dashboard", command=modern)
         
     def _try_auto_connect(self):
         """Try to automatically connect using environment variables"""
-        # Get database connection params from .env file
-        host = os.getenv("DB_HOST", "localhost")
-        port_str = os.getenv("DB_PORT", "5432")
-        db_name = os.getenv("DB_NAME", "")
-        username = os.getenv("DB_USER", "postgres")
-        password = os.getenv("DB_PASSWORD", "")
+        settings = self._auto_connect_settings()
         
         # Only try to connect if we have a database name
-        if db_name:
-            try:
-                # Convert port to integer
-                port = int(port_str)
-                
-                logger.info(f"Attempting auto-connect to {db_name} on {host}:{port}")
-                self.status_var.set(f"Connecting to {db_name}...")
-                self.root.update()
-                
-                # Store tables before validation for comparison
-                if hasattr(self.db_manager, 'tables'):
-                    self.db_manager.tables_before_validation = self.db_manager.tables.copy()
-                else:
-                    self.db_manager.tables_before_validation = []
-                
-                # Connect to the database
-                success, message = self.db_manager.connect_to_database(db_name, host, port, username, password)
+        if settings is None:
+            return
+        
+        db_name, host, port, username, password = settings
+        logger.info(f"Attempting auto-connect to {db_name} on {host}:{port}")
+        self.status_var.set(f"Connecting to {db_name}...")
+        
+        # Connect and validate the schema off the Tk thread so the window stays responsive
+        threading.Thread(target=self._auto_connect_worker,
+                         args=(db_name, host, port, username, password),
+                         daemon=True).start()
+    
+    def _auto_connect_settings(self):
+        """Read connection settings from the environment (.env file)
+        
+        Returns:
+            tuple: (db_name, host, port, username, password), or None if DB_NAME is
+                   unset or the port is invalid
+        """
+        env = os.environ
+        db_name = env.get("DB_NAME")
+        if not db_name:
+            return None
+        
+        host = env.get("DB_HOST", DB_DEFAULTS['DB_HOST'])
+        username = env.get("DB_USER", DB_DEFAULTS['DB_USER'])
+        password = env.get("DB_PASSWORD", "")
+        port_str = env.get("DB_PORT", DB_DEFAULTS['DB_PORT'])
+        try:
+            # Convert port to integer
+            port = int(port_str)
+        except ValueError:
+            logger.error(f"Invalid port in environment variable: {port_str}")
+            return None
+        
+        return db_name, host, port, username, password
+    
+    def _auto_connect_worker(self, db_name, host, port, username, password):
+        """Connect and fix the schema in a background thread (no Tk calls here)"""
+        success, message, fix_message, schema_error = False, None, None, None
+        try:
+            # Store tables before validation for comparison
+            self.db_manager.tables_before_validation = list(self.db_manager.tables)
+            
+            # Connect to the database
+            success, message = self.db_manager.connect_to_database(db_name, host, port, username, password)
+            
+            if success:
+                logger.info(f"Auto-connected to database: {db_name}")
                 
-                if success:
-                    self.status_var.set(f"Connected to {db_name}")
-                    logger.info(f"Auto-connected to database: {db_name}")
-                    
-                    # Automatically validate and fix schema issues
-                    self._validate_and_fix_database_schema()
-                    
-                    # Show the appropriate dashboard based on preferences
-                    if self.use_modern_ui:
-                        self._show_modern_dashboard()
-                    else:
-                        self._show_unified_dashboard()
-                else:
-                    self.status_var.set("Connection failed")
-                    logger.warning(f"Auto-connect failed: {message}")
-                    messagebox.showwarning("Connection Failed", message)
-                    
-            except ValueError:
-                logger.error(f"Invalid port in environment variable: {port_str}")
-            except Exception as e:
-                logger.error(f"Error in auto-connect: {str(e)}")
-                messagebox.showerror("Connection Error", str(e))
+                # Automatically validate and fix schema issues
+                try:
+                    fix_message = self._apply_schema_fixes()
+                except Exception as e:
+                    logger.error(f"Error validating and fixing database schema: {str(e)}")
+                    schema_error = str(e)
+        except Exception as e:
+            logger.error(f"Error in auto-connect: {str(e)}")
+            message = str(e)
+        
+        self._ui_queue.put((self._auto_connect_done, (db_name, success, message, fix_message, schema_error)))
+    
+    def _auto_connect_done(self, db_name, success, message, fix_message, schema_error):
+        """Report the auto-connect result on the Tk thread"""
+        if not success:
+            self.status_var.set("Connection failed")
+            logger.warning(f"Auto-connect failed: {message}")
+            messagebox.showwarning("Connection Failed", message)
+            return
+        
+        if schema_error:
+            self.status_var.set(f"Error: {schema_error}")
+        else:
+            self.status_var.set(f"Connected to {db_name}")
+            if fix_message:
+                messagebox.showinfo("Database Schema Fixed", fix_message)
+        
+        # Show the appropriate dashboard based on preferences
+        if self.use_modern_ui:
+            self._show_modern_dashboard()
+        else:
+            self._show_unified_dashboard()
 
-    def _validate_and_fix_database_schema(self):
-        """Automatically validate and fix database schema issues"""
+    def _validate_and_fix_database_schema(self, show_dialog=True):
+        """Automatically validate and fix database schema issues
+        
+        Args:
+            show_dialog: Whether to show a message box summarising applied fixes
+            
+        Returns:
+            str: Summary of the fixes applied, or None if nothing was changed
+        """
+        message = None
         try:
             self.status_var.set("Validating database schema...")
-            self.root.update()
-            
-            # Check and fix schema for core tables
-            tables_to_check = ['invoices', 'vendors', 'funds']
-            schema_results = {}
-            fixes_applied = False
-            conversions_performed = []
-            
-            for table in tables_to_check:
-                # Check if table exists, create if missing
-                if not self.db_manager.schema_validator.check_table_exists(table, create_if_missing=True):
-                    if table not in self.db_manager.tables:
-                        # New table was created
-                        fixes_applied = True
-                        logger.info(f"Created missing {table} table")
-                
-                # Update tables list if we created any
-                self.db_manager._fetch_tables()
-                
-                # Only continue if the table exists
-                if table in self.db_manager.tables:
-                    # Check for missing columns
-                    column_result = self.db_manager.schema_validator.validate_table(table, auto_fix=True)
-                    if not column_result['valid']:
-                        fixes_applied = True
-                        logger.info(f"Added missing columns to {table}")
-                    
-                    # Check for and fix type mismatches
-                    type_result = self.db_manager.schema_validator.validate_and_fix_column_types(table)
-                    if type_result.get('fixed', False):
-                        fixes_applied = True
-                        logger.info(f"Fixed column types in {table}")
-                        if 'fixed_columns' in type_result and type_result['fixed_columns']:
-                            fixed_cols = ', '.join(type_result['fixed_columns'])
-                            logger.info(f"Fixed columns in {table}: {fixed_cols}")
-                    
-                    schema_results[table] = {
-                        'columns': column_result,
-                        'types': type_result
-                    }
-            
-            # Check if any type conversions were performed
-            type_conversions = []
-            if (hasattr(self.db_manager.schema_validator, 'type_conversions_performed') and 
-                self.db_manager.schema_validator.type_conversions_performed):
-                type_conversions = self.db_manager.schema_validator.type_conversions_performed
-                if type_conversions:
-                    fixes_applied = True
-                    conversions_performed = type_conversions
             
-            # Show a message if fixes were applied
-            if fixes_applied:
-                # Build a detailed message about what was fixed
-                message = "The following automatic fixes were applied to your database:\n\n"
-                
-                # Any tables created
-                created_tables = [table for table in tables_to_check if table in self.db_manager.tables 
-                                 and not table in self.db_manager.tables_before_validation]
-                if created_tables:
-                    message += "Tables created:\n"
-                    for table in created_tables:
-                        message += f"- {table}\n"
-                    message += "\n"
-                    
-                # Any columns added
-                columns_added = []
-                for table, result in schema_results.items():
-                    if 'columns' in result and not result['columns']['valid'] and 'missing_columns' in result['columns']:
-                        for col in result['columns']['missing_columns']:
-                            columns_added.append(f"{table}.{col['name']} ({col['type']})")
-                
-                if columns_added:
-                    message += "Columns added:\n"
-                    for col in columns_added:
-                        message += f"- {col}\n"
-                    message += "\n"
-                
-                # Any type conversions
-                if conversions_performed:
-                    message += "Column types fixed:\n"
-                    for conv in conversions_performed:
-                        message += f"- {conv['table']}.{conv['column']}: {conv['from_type']} → {conv['to_type']}\n"
-                
+            message = self._apply_schema_fixes()
+            if message and show_dialog:
                 messagebox.showinfo("Database Schema Fixed", message)
             
             # Update status
@@ -412,115 +642,249 @@ class FinancialAssistant:
             logger.error(f"Error validating and fixing database schema: {str(e)}")
             self.status_var.set(f"Error: {str(e)}")
         
-    def _connect_database(self):
-        """Connect to the database"""
-        try:
-            # Show connection dialog
-            dialog = tk.Toplevel(self.root)
-            dialog.title("Connect to Database")
-            dialog.geometry("400x250")
-            dialog.configure(background=self.bg_dark)
-            dialog.transient(self.root)
-            dialog.grab_set()
-            
-            frame = ttk.Frame(dialog, padding="20")
-            frame.pack(fill=tk.BOTH, expand=True)
-            
-            # Add header with gradient effect
-            header_frame = tk.Frame(frame, height=40, bg=self.bg_dark)
-            header_frame.pack(fill=tk.X, pady=(0, 15))
-            
-            ttk.Label(header_frame, text="Database Connection", 
-                    font=(self.font_family, 14, 'bold')).pack(anchor=tk.W)
-            
-            # Connection parameters with improved styling
-            param_frame = ttk.Frame(frame)
-            param_frame.pack(fill=tk.X, pady=5)
-            
-            # Connection parameters
-            ttk.Label(param_frame, text="Host:").pack(anchor=tk.W)
-            host_entry = ttk.Entry(param_frame, font=(self.font_family, 10))
-            host_entry.pack(fill=tk.X, pady=(0, 10))
-            host_entry.insert(0, "localhost")
-            
-            ttk.Label(param_frame, text="Port:").pack(anchor=tk.W)
-            port_entry = ttk.Entry(param_frame, font=(self.font_family, 10))
-            port_entry.pack(fill=tk.X, pady=(0, 10))
-            port_entry.insert(0, "5432")
+        return message
+    
+    def _apply_schema_fixes(self):
+        """Validate the core tables and apply fixes (safe to run off the Tk thread)
+        
+        Returns:
+            str: Summary of the fixes applied, or None if nothing was changed
+        """
+        message = None
+        
+        # Check and fix schema for core tables
+        tables_to_check = ['invoices', 'vendors', 'funds']
+        schema_results = {}
+        fixes_applied = False
+        conversions_performed = []
+        
+        # Fetch column metadata for all core tables in one round trip
+        validator = self.db_manager.schema_validator
+        snapshot = validator.snapshot_tables(tables_to_check)
+        
+        # Only tables missing from the snapshot need an existence check / create
+        known_tables = self.db_manager.tables_set
+        created_any = False
+        for table in tables_to_check:
+            if table in snapshot:
+                continue
+            if validator.check_table_exists(table, create_if_missing=True) and table not in known_tables:
+                # New table was created
+                created_any = True
+                fixes_applied = True
+                logger.info(f"Created missing {table} table")
+        
+        # Update tables list only if we created any
+        if created_any:
+            self.db_manager._fetch_tables()
+            known_tables = self.db_manager.tables_set
+        
+        for table in tables_to_check:
+            # Only continue if the table exists
+            if table in known_tables:
+                # Check for missing columns
+                column_result = self.db_manager.schema_validator.validate_table(table, auto_fix=True, snapshot=snapshot)
+                if not column_result['valid'] or column_result.get('added_columns'):
+                    fixes_applied = True
+                    logger.info(f"Added missing columns to {table}")
+                
+                # Check for and fix type mismatches
+                type_result = self.db_manager.schema_validator.validate_and_fix_column_types(table, snapshot=snapshot)
+                if type_result.get('fixed', False):
+                    fixes_applied = True
+                    logger.info(f"Fixed column types in {table}")
+                    if 'fixed_columns' in type_result and type_result['fixed_columns']:
+                        fixed_cols = ', '.join(type_result['fixed_columns'])
+                        logger.info(f"Fixed columns in {table}: {fixed_cols}")
+                
+                schema_results[table] = {
+                    'columns': column_result,
+                    'types': type_result
+                }
+        
+        # Check if any type conversions were performed
+        type_conversions = []
+        if (hasattr(self.db_manager.schema_validator, 'type_conversions_performed') and 
+            self.db_manager.schema_validator.type_conversions_performed):
+            type_conversions = self.db_manager.schema_validator.type_conversions_performed
+            if type_conversions:
+                fixes_applied = True
+                conversions_performed = type_conversions
+        
+        # Summarise the fixes if any were applied
+        if fixes_applied:
+            # Build a detailed message about what was fixed
+            parts = ["The following automatic fixes were applied to your database:\n\n"]
             
-            ttk.Label(param_frame, text="Database:").pack(anchor=tk.W)
-            db_entry = ttk.Entry(param_frame, font=(self.font_family, 10))
-            db_entry.pack(fill=tk.X, pady=(0, 10))
+            # Any tables created
+            tables_before = set(self.db_manager.tables_before_validation)
+            created_tables = [table for table in tables_to_check if table in self.db_manager.tables_set 
+                             and not table in tables_before]
+            if created_tables:
+                parts.append("Tables created:\n")
+                parts.extend(f"- {table}\n" for table in created_tables)
+                parts.append("\n")
+                
+            # Any columns added
+            columns_added = [f"{table}.{col['name']} ({col['type']})"
+                             for table, result in schema_results.items()
+                             if 'columns' in result and result['columns'].get('added_columns')
+                             for col in result['columns']['added_columns']]
             
-            ttk.Label(param_frame, text="Username:").pack(anchor=tk.W)
-            user_entry = ttk.Entry(param_frame, font=(self.font_family, 10))
-            user_entry.pack(fill=tk.X, pady=(0, 10))
-            user_entry.insert(0, "postgres")
+            if columns_added:
+                parts.append("Columns added:\n")
+                parts.extend(f"- {col}\n" for col in columns_added)
+                parts.append("\n")
             
-            ttk.Label(param_frame, text="Password:").pack(anchor=tk.W)
-            pass_entry = ttk.Entry(param_frame, show="•", font=(self.font_family, 10))
-            pass_entry.pack(fill=tk.X, pady=(0, 10))
+            # Any type conversions
+            if conversions_performed:
+                parts.append("Column types fixed:\n")
+                parts.extend(f"- {conv['table']}.{conv['column']}: {conv['from_type']} → {conv['to_type']}\n"
+                             for conv in conversions_performed)
             
-            # Button frame
-            button_frame = ttk.Frame(frame)
-            button_frame.pack(fill=tk.X, pady=(15, 0))
+            message = ''.join(parts)
+        
+        return message
+        
+    def _connect_database(self):
+        """Connect to the database"""
+        try:
+            # Build the connection dialog once, then just show it again
+            dialog = self._connect_dialog
+            if dialog is None or not dialog.winfo_exists():
+                dialog = self._connect_dialog = self._build_connect_dialog()
             
-            def connect():
-                """Connect to database"""
-                try:
-                    # Get connection parameters
-                    host = host_entry.get()
-                    port = int(port_entry.get())  # Convert to integer
-                    database = db_entry.get()
-                    username = user_entry.get()
-                    password = pass_entry.get()
-                    
-                    # Connect to database
-                    success, message = self.db_manager.connect_to_database(database, host, port, username, password)
-                    
-                    # Update status
-                    if success:
-                        self.status_var.set(f"Connected to {database}")
-                        dialog.destroy()
-                        messagebox.showinfo("Success", message)
-                        
-                        # Show the dashboard based on user preference
-                        if self.use_modern_ui:
-                            self._show_modern_dashboard()
-                        else:
-                            self._show_unified_dashboard()
-                    else:
-                        messagebox.showerror("Connection Error", message)
-                    
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to connect to database: {str(e)}")
+            # Clear the password but keep the other fields from last time
+            dialog.pass_entry.delete(0, tk.END)
             
-            # Add styled buttons
-            ttk.Button(button_frame, text="Connect", style="Accent.TButton", 
-                     command=connect).pack(side=tk.RIGHT, padx=5)
-            ttk.Button(button_frame, text="Cancel", 
-                     command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+            dialog.deiconify()
+            dialog.grab_set()
             
             # Set focus to first field
-            host_entry.focus_set()
-            
-            # Make Enter key trigger connect
-            dialog.bind("<Return>", lambda event: connect())
+            dialog.host_entry.focus_set()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to show connection dialog: {str(e)}")
+    
+    def _build_connect_dialog(self):
+        """Build the connection dialog; it is hidden, not destroyed, when closed
+        
+        Returns:
+            tk.Toplevel: The dialog, with its entry widgets as attributes
+        """
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Connect to Database")
+        dialog.geometry("400x250")
+        dialog.configure(background=self.bg_dark)
+        dialog.transient(self.root)
+        
+        def hide():
+            dialog.grab_release()
+            dialog.withdraw()
+        
+        dialog.protocol("WM_DELETE_WINDOW", hide)
+        
+        frame = ttk.Frame(dialog, padding="20")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Add header with gradient effect, drawn from the shared gradient cache
+        header_canvas = tk.Canvas(frame, height=40, bg=self.bg_dark, highlightthickness=0)
+        header_canvas.pack(fill=tk.X, pady=(0, 15))
+        header_canvas.create_image(0, 0, image=self._get_header_gradient(40, width=400), anchor='nw')
+        header_canvas.create_text(0, 20, text="Database Connection", fill=self.text_color,
+                                  font='FaH2', anchor='w')
+        
+        # Connection parameters with improved styling
+        param_frame = ttk.Frame(frame)
+        param_frame.pack(fill=tk.X, pady=5)
+        
+        # Connection parameters
+        ttk.Label(param_frame, text="Host:").pack(anchor=tk.W)
+        host_entry = ttk.Entry(param_frame, font='FaBody')
+        host_entry.pack(fill=tk.X, pady=(0, 10))
+        host_entry.insert(0, "localhost")
+        
+        ttk.Label(param_frame, text="Port:").pack(anchor=tk.W)
+        port_entry = ttk.Entry(param_frame, font='FaBody')
+        port_entry.pack(fill=tk.X, pady=(0, 10))
+        port_entry.insert(0, "5432")
+        
+        ttk.Label(param_frame, text="Database:").pack(anchor=tk.W)
+        db_entry = ttk.Entry(param_frame, font='FaBody')
+        db_entry.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(param_frame, text="Username:").pack(anchor=tk.W)
+        user_entry = ttk.Entry(param_frame, font='FaBody')
+        user_entry.pack(fill=tk.X, pady=(0, 10))
+        user_entry.insert(0, "postgres")
+        
+        ttk.Label(param_frame, text="Password:").pack(anchor=tk.W)
+        pass_entry = ttk.Entry(param_frame, show="•", font='FaBody')
+        pass_entry.pack(fill=tk.X, pady=(0, 10))
+        
+        # Button frame
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X, pady=(15, 0))
+        
+        def connect():
+            """Connect to database"""
+            try:
+                # Get connection parameters
+                host = host_entry.get()
+                port = int(port_entry.get())  # Convert to integer
+                database = db_entry.get()
+                username = user_entry.get()
+                password = pass_entry.get()
+                
+                # Connect to database
+                success, message = self.db_manager.connect_to_database(database, host, port, username, password)
+                
+                # Update status
+                if success:
+                    self.status_var.set(f"Connected to {database}")
+                    hide()
+                    messagebox.showinfo("Success", message)
+                    
+                    # Show the dashboard based on user preference
+                    if self.use_modern_ui:
+                        self._show_modern_dashboard()
+                    else:
+                        self._show_unified_dashboard()
+                else:
+                    messagebox.showerror("Connection Error", message)
+                
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to connect to database: {str(e)}")
+        
+        # Add styled buttons
+        ttk.Button(button_frame, text="Connect", style="Accent.TButton", 
+                 command=connect).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Cancel", 
+                 command=hide).pack(side=tk.RIGHT, padx=5)
+        
+        # Make Enter key trigger connect
+        dialog.bind("<Return>", lambda event: connect())
+        
+        dialog.host_entry = host_entry
+        dialog.pass_entry = pass_entry
+        return dialog
             
     def _show_invoice_dashboard(self):
         """Open the invoice dashboard"""
         try:
+            if self._raise_dashboard_window('invoice'):
+                return
+            
             # Create a new window for the dashboard
             dashboard_window = tk.Toplevel(self.root)
             dashboard_window.title("Invoice Dashboard")
             dashboard_window.geometry("1000x700")
             
             # Create the dashboard
-            from finance_assistant.dashboard import InvoiceDashboard
-            dashboard = InvoiceDashboard(dashboard_window, self.db_manager)
+            dashboard_cls = self._get_dashboard_cls('invoice')
+            dashboard = dashboard_cls(dashboard_window, self.db_manager)
+            
+            self._dashboard_windows['invoice'] = dashboard_window
             
             # Log the action
             logger.info("Invoice dashboard opened")
@@ -532,6 +896,9 @@ class FinancialAssistant:
     def _show_modern_dashboard(self):
         """Open the modern three-panel dashboard interface"""
         try:
+            if self._raise_dashboard_window('modern'):
+                return
+            
             # Create a new window for the dashboard
             dashboard_window = tk.Toplevel(self.root)
             dashboard_window.title("Modern Invoice Dashboard")
@@ -539,8 +906,12 @@ class FinancialAssistant:
             dashboard_window.configure(bg="#1e1e2e")
             
             # Import and create the dashboard
-            from finance_assistant.modern_dashboard import ModernDashboard
-            dashboard = ModernDashboard(dashboard_window, self.db_manager, self.llm_client)
+            dashboard_cls = self._get_dashboard_cls('modern')
+            dashboard = dashboard_cls(dashboard_window, self.db_manager, self.llm_client)
+            
+            # Kept so imports can clear the dashboard's cached invoice lists
+            dashboard_window.dashboard = dashboard
+            self._dashboard_windows['modern'] = dashboard_window
             
             # Log the action
             logger.info("Modern Dashboard opened")
@@ -554,12 +925,37 @@ class FinancialAssistant:
         if not self.db_manager.is_connected:
             messagebox.showwarning("Warning", "Please connect to a database first")
             return
-            
+        
+        # Build the dialog once; later opens only refresh the table list and file
+        dialog = self._import_dialog
+        if dialog is None or not dialog.winfo_exists():
+            dialog = self._import_dialog = self._build_import_dialog()
+        else:
+            dialog.reset()
+            dialog.deiconify()
+        
+        # Make dialog modal
+        self._center_window(dialog)
+        dialog.grab_set()
+    
+    def _build_import_dialog(self):
+        """Build the CSV import dialog; it is hidden, not destroyed, when closed
+        
+        Returns:
+            tk.Toplevel: The dialog, with a reset() callable for reuse
+        """
         # Create dialog window
         dialog = tk.Toplevel(self.root)
         dialog.title("Import Data from CSV")
         dialog.geometry("500x320")
         dialog.configure(background=self.bg_dark)
+        dialog.transient(self.root)
+        
+        def hide():
+            dialog.grab_release()
+            dialog.withdraw()
+        
+        dialog.protocol("WM_DELETE_WINDOW", hide)
         
         # Create main frame
         main_frame = ttk.Frame(dialog, padding="10")
@@ -574,13 +970,12 @@ class FinancialAssistant:
         table_combo = ttk.Combobox(table_frame, textvariable=table_var, width=30)
         table_combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
-        # Fetch existing tables
-        self.db_manager._fetch_tables()
-        table_combo['values'] = sorted(self.db_manager.tables)
+        # Existing tables; a recent list is reused rather than re-queried on every open
+        table_combo['values'] = self.db_manager.get_tables_cached()
         
         def refresh_tables():
             self.db_manager._fetch_tables()
-            table_combo['values'] = sorted(self.db_manager.tables)
+            table_combo['values'] = self.db_manager.sorted_tables
             
         ttk.Button(table_frame, text="Refresh", command=refresh_tables).pack(side=tk.RIGHT, padx=(5, 0))
         
@@ -627,6 +1022,30 @@ class FinancialAssistant:
         
         ttk.Button(file_frame, text="Browse", command=browse_file).pack(side=tk.RIGHT, padx=(5, 0))
         
+        # File checks run in the background as soon as a file is chosen:
+        # path -> None while running, then the _precheck_csv_file result
+        precheck = {}
+        
+        def precheck_done(path, result):
+            precheck[path] = result
+            sniffed = result.get('delimiter')
+            # A delimiter the user picked wins over the sniffed one
+            if sniffed and path == file_path.get() and not delimiter_state['chosen']:
+                delimiter_var.set("\\t" if sniffed == "\t" else sniffed)
+        
+        def start_precheck(*_):
+            path = file_path.get()
+            if path in precheck or not os.path.isfile(path):
+                return
+            precheck[path] = None
+            
+            def run():
+                self._ui_queue.put((precheck_done, (path, _precheck_csv_file(path))))
+            
+            threading.Thread(target=run, daemon=True).start()
+        
+        file_path.trace_add('write', start_precheck)
+        
         # Options frame
         options_frame = ttk.LabelFrame(main_frame, text="Import Options")
         options_frame.pack(fill=tk.X, pady=(0, 10))
@@ -637,6 +1056,15 @@ class FinancialAssistant:
         delimiter_combo = ttk.Combobox(options_frame, textvariable=delimiter_var, values=[",", ";", "\\t", "|"], width=5)
         delimiter_combo.grid(row=0, column=1, sticky=tk.W, padx=5, pady=2)
         
+        # Set once the user picks or types a delimiter, so sniffing stops overriding it
+        delimiter_state = {'chosen': False}
+        
+        def choose_delimiter(event=None):
+            delimiter_state['chosen'] = True
+        
+        delimiter_combo.bind("<<ComboboxSelected>>", choose_delimiter)
+        delimiter_combo.bind("<Key>", choose_delimiter)
+        
         # Has header row
         header_var = tk.BooleanVar(value=True)
         header_check = ttk.Checkbutton(options_frame, text="CSV has header row", variable=header_var)
@@ -652,6 +1080,12 @@ class FinancialAssistant:
         auto_fix_check = ttk.Checkbutton(options_frame, text="Auto-fix schema issues", variable=auto_fix_var)
         auto_fix_check.grid(row=3, column=0, columnspan=2, sticky=tk.W, padx=5, pady=2)
         
+        # Rebuilding indexes locks the table, so it is opt-in and only used for large loads
+        defer_indexes_var = tk.BooleanVar(value=False)
+        defer_indexes_check = ttk.Checkbutton(options_frame, text="Rebuild indexes after large imports",
+                                              variable=defer_indexes_var)
+        defer_indexes_check.grid(row=4, column=0, columnspan=2, sticky=tk.W, padx=5, pady=2)
+        
         # Mode selection (append or replace)
         ttk.Label(options_frame, text="Import Mode:").grid(row=0, column=2, sticky=tk.W, padx=(15, 5), pady=2)
         mode_var = tk.StringVar(value="append")
@@ -660,38 +1094,37 @@ class FinancialAssistant:
         
         def import_data():
             """Start the CSV import process"""
-            # Check required fields
-            if not file_path.get():
-                messagebox.showerror("Error", "Please select a CSV file", parent=dialog)
-                return
-            
             # Determine table name
             if create_table_var.get():
                 table = new_table_entry.get().strip()
-                if not table:
-                    messagebox.showerror("Error", "Please enter a name for the new table", parent=dialog)
-                    return
             else:
                 table = table_var.get().strip()
-                if not table:
-                    messagebox.showerror("Error", "Please select a target table", parent=dialog)
-                    return
+            
+            # Check the inputs, then any problem the background file check found
+            error = _validate_import_request(file_path.get(), table, create_table_var.get())
+            if error is None:
+                error = (precheck.get(file_path.get()) or {}).get('error')
+            if error:
+                messagebox.showerror("Error", error, parent=dialog)
+                return
             
             # Close the dialog
-            dialog.destroy()
+            hide()
             
             # Prepare options
             import_options = {
                 'delimiter': delimiter_var.get() if delimiter_var.get() != "\\t" else "\t",
                 'has_header': header_var.get(),
                 'auto_fix': auto_fix_var.get(),
-                'mode': mode_var.get()
+                'mode': mode_var.get(),
+                'batch_size': IMPORT_BATCH_SIZE,
+                'defer_indexes': defer_indexes_var.get()
             }
             
             # Choose import method based on user selection
             if smart_map_var.get():
                 # Use smart mapping
-                self._show_smart_import_dialog(file_path.get(), table)
+                self._show_smart_import_dialog(file_path.get(), table, import_options)
             else:
                 # Use traditional import with progress dialog
                 self._show_import_progress(file_path.get(), table, import_options)
@@ -700,17 +1133,291 @@ class FinancialAssistant:
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=10)
         
-        cancel_button = ttk.Button(button_frame, text="Cancel", command=dialog.destroy)
+        cancel_button = ttk.Button(button_frame, text="Cancel", command=hide)
         cancel_button.pack(side=tk.RIGHT, padx=5)
         
         import_button = ttk.Button(button_frame, text="Import Data", command=import_data,
                                   style="Accent.TButton")
         import_button.pack(side=tk.RIGHT, padx=5)
         
-        # Make dialog modal
+        def reset():
+            # Imports and schema fixes refresh the cached list themselves; options are kept
+            table_combo['values'] = self.db_manager.get_tables_cached()
+            precheck.clear()
+            file_path.set("")
+        
+        dialog.reset = reset
+        return dialog
+    
+    def _center_window(self, window):
+        """Center a window on the screen
+        
+        Args:
+            window: The Toplevel to position
+        """
+        # One layout pass, then read the size and screen dimensions
+        window.update_idletasks()
+        width, height = window.winfo_width(), window.winfo_height()
+        x = (window.winfo_screenwidth() - width) // 2
+        y = (window.winfo_screenheight() - height) // 2
+        window.geometry(f"+{x}+{y}")
+    
+    def _show_smart_import_dialog(self, csv_file, table_name, import_options=None):
+        """Review the smart column mapping for a CSV file before importing it
+        
+        Args:
+            csv_file: Path to the CSV file
+            table_name: Target table name
+            import_options: Dictionary of import options
+        """
+        if import_options is None:
+            import_options = {'delimiter': ',', 'has_header': True, 'auto_fix': True, 'mode': 'append',
+                              'batch_size': IMPORT_BATCH_SIZE}
+        
+        # New tables have nothing to map against, so create them straight from the CSV
+        if import_options.get('mode') == 'replace' or not self.db_manager.table_exists(table_name):
+            self._show_import_progress(csv_file, table_name, import_options)
+            return
+        
+        # Analyze CSV headers against the table
+        mapping_info = self.db_manager.import_csv_with_smart_mapping(csv_file, table_name)
+        if 'error' in mapping_info:
+            messagebox.showerror("Error", f"Could not analyze CSV file: {mapping_info['error']}")
+            return
+        
+        new_columns = mapping_info['new_columns']
+        
+        # Create dialog window
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Review Column Mapping")
+        dialog.geometry("600x450")
+        dialog.configure(background=self.bg_dark)
         dialog.transient(self.root)
-        dialog.grab_set()
-        self.root.wait_window(dialog)
+        
+        frame = ttk.Frame(dialog, padding="15")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(frame, text=f"Mapping {os.path.basename(csv_file)} to {table_name}", 
+                font='FaH3').pack(anchor=tk.W, pady=(0, 5))
+        ttk.Label(frame, text=f"{len(mapping_info['csv_headers'])} CSV columns, "
+                            f"{len(new_columns)} not found in the table").pack(anchor=tk.W, pady=(0, 10))
+        
+        # Mapping preview
+        tree_frame = ttk.Frame(frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        
+        mapping_tree = ttk.Treeview(tree_frame, columns=("csv", "db", "action"), show="headings", height=12)
+        mapping_tree.heading("csv", text="CSV Column")
+        mapping_tree.heading("db", text="Table Column")
+        mapping_tree.heading("action", text="Action")
+        mapping_tree.column("csv", width=180)
+        mapping_tree.column("db", width=180)
+        mapping_tree.column("action", width=180)
+        
+        for csv_col in mapping_info['csv_headers']:
+            db_col = mapping_info['mappings'].get(csv_col, '')
+            if db_col in new_columns:
+                action = f"Create New Column ({new_columns[db_col]})"
+            else:
+                action = "Map to Existing"
+            mapping_tree.insert("", tk.END, values=(csv_col, db_col, action))
+        
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=mapping_tree.yview)
+        mapping_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        mapping_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Whether unmatched CSV columns should be added to the table or skipped
+        create_columns_var = tk.BooleanVar(value=True)
+        if new_columns:
+            ttk.Checkbutton(frame, text="Create new columns for unmatched CSV fields", 
+                          variable=create_columns_var).pack(anchor=tk.W, pady=(10, 0))
+        
+        def start_import():
+            if create_columns_var.get():
+                if new_columns and not self.db_manager.add_columns_to_table(table_name, new_columns):
+                    messagebox.showerror("Error", f"Could not add new columns to {table_name}", parent=dialog)
+                    return
+                column_mapping = mapping_info['mappings']
+            else:
+                # Skip unmatched columns; the importer consumes the pairs lazily
+                column_mapping = ((c, d) for c, d in mapping_info['mappings'].items() if d not in new_columns)
+            
+            dialog.destroy()
+            self._show_import_progress(csv_file, table_name, import_options, column_mapping)
+        
+        # Add buttons
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Import", command=start_import,
+                 style="Accent.TButton").pack(side=tk.RIGHT, padx=5)
+        
+        self._center_window(dialog)
+    
+    def _show_import_progress(self, csv_file, table_name, import_options, column_mapping=None):
+        """Import a CSV file on a background thread while showing progress
+        
+        Args:
+            csv_file: Path to the CSV file
+            table_name: Target table name
+            import_options: Dictionary of import options (delimiter, has_header, auto_fix, mode,
+                            batch_size, defer_indexes)
+            column_mapping: Optional dictionary (or iterable of pairs) mapping CSV columns to DB columns
+        """
+        # Create progress dialog
+        progress_dialog = tk.Toplevel(self.root)
+        progress_dialog.title("Importing Data")
+        progress_dialog.geometry("500x350")
+        progress_dialog.configure(background=self.bg_dark)
+        progress_dialog.transient(self.root)
+        
+        frame = ttk.Frame(progress_dialog, padding="15")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(frame, text=f"Importing {os.path.basename(csv_file)} into {table_name}", 
+                font='FaH3').pack(anchor=tk.W, pady=(0, 10))
+        
+        # Progress is measured in bytes so the file only has to be read once
+        progress_bar = ttk.Progressbar(frame, orient=tk.HORIZONTAL, mode='determinate',
+                                     maximum=max(os.path.getsize(csv_file), 1))
+        progress_bar.pack(fill=tk.X, pady=(0, 5))
+        
+        progress_var = tk.StringVar(value="Starting import...")
+        ttk.Label(frame, textvariable=progress_var).pack(anchor=tk.W, pady=(0, 10))
+        
+        # Import log
+        details_text = tk.Text(frame, height=10, bg=self.bg_light, fg=self.text_color,
+                             font='FaSmall', wrap=tk.WORD)
+        details_text.pack(fill=tk.BOTH, expand=True)
+        
+        close_button = ttk.Button(frame, text="Close", command=progress_dialog.destroy, state=tk.DISABLED)
+        close_button.pack(pady=(10, 0))
+        
+        # Log lines are buffered and written to the widget in one insert every 250 ms;
+        # only the most recent lines are kept so long imports don't grow the widget
+        log_buffer = []
+        max_log_lines = 500
+        
+        def add_log(message):
+            log_buffer.append(message)
+        
+        def flush_logs():
+            if not progress_dialog.winfo_exists():
+                return
+            
+            if log_buffer:
+                lines = log_buffer[:]
+                del log_buffer[:len(lines)]
+                details_text.insert(tk.END, "\n".join(lines) + "\n")
+                
+                # Trim from the top once the log exceeds the line cap
+                line_count = int(details_text.index('end-1c').split('.')[0])
+                if line_count > max_log_lines:
+                    details_text.delete('1.0', f'{line_count - max_log_lines}.0')
+                details_text.see(tk.END)
+            
+            progress_dialog.after(250, flush_logs)
+        
+        def progress_updater(rows_read, bytes_read):
+            progress_bar['value'] = bytes_read
+            
+            # Extrapolate the total row count from the average row size so far
+            estimated_total = int(rows_read * progress_bar['maximum'] / max(bytes_read, 1))
+            progress_var.set(f"Imported {rows_read:,} of ~{estimated_total:,} rows...")
+        
+        def import_finished(result):
+            progress_bar['value'] = progress_bar['maximum']
+            
+            if result.get('success'):
+                rows = result.get('successful_rows', result.get('rows_imported', 0))
+                progress_var.set(f"Import complete: {rows:,} rows")
+                add_log(f"Imported {rows:,} rows into {table_name}")
+                self.status_var.set(f"Imported {rows:,} rows into {table_name}")
+            else:
+                progress_var.set("Import failed")
+                add_log(f"Error: {result.get('error', 'Unknown error')}")
+                self.status_var.set("Import failed")
+            
+            # The data is in, but the table is missing indexes until they are rebuilt
+            index_errors = result.get('index_errors')
+            if index_errors:
+                for error in index_errors:
+                    add_log(f"Index rebuild failed: {error}")
+                messagebox.showwarning(
+                    "Indexes Not Rebuilt",
+                    f"{len(index_errors)} indexes on {table_name} could not be rebuilt. "
+                    "They will be retried the next time the database is connected.",
+                    parent=progress_dialog)
+            
+            close_button.configure(state=tk.NORMAL)
+            self.db_manager._fetch_tables()
+            
+            # An open modern dashboard would otherwise show its cached invoice list
+            modern_window = self._dashboard_windows.get('modern')
+            if result.get('success') and modern_window is not None and modern_window.winfo_exists():
+                modern_window.dashboard.invalidate_invoice_cache()
+        
+        # Only post progress when the bar would move at least 1% or 250 ms have passed
+        progress_state = {'time': 0.0, 'bytes': 0}
+        progress_step = progress_bar['maximum'] / 100
+        
+        def report_progress(rows_read, bytes_read):
+            now = time.monotonic()
+            if now - progress_state['time'] >= 0.25 or bytes_read - progress_state['bytes'] >= progress_step:
+                progress_state['time'] = now
+                progress_state['bytes'] = bytes_read
+                self._ui_queue.put((progress_updater, (rows_read, bytes_read)))
+        
+        def run_import():
+            try:
+                if import_options.get('mode') == 'replace' or not self.db_manager.table_exists(table_name):
+                    # Let the manager create (or recreate) the table from the CSV
+                    add_log(f"Creating table {table_name} from CSV...")
+                    result = self.db_manager.import_csv_to_new_table(
+                        csv_file, table_name, import_options, progress_callback=report_progress)
+                else:
+                    # Add any missing required columns before loading data
+                    if import_options.get('auto_fix') and self.db_manager.schema_validator:
+                        self.db_manager.schema_validator.validate_table(table_name, auto_fix=True)
+                        self.db_manager.invalidate_table_structure(table_name)
+                    
+                    # Plain indexes are rebuilt once after the load instead of per row,
+                    # when asked for and the file is a sizeable part of the table
+                    dropped_indexes = []
+                    if (import_options.get('defer_indexes')
+                            and self.db_manager.should_defer_indexes(table_name, os.path.getsize(csv_file))):
+                        dropped_indexes = self.db_manager.drop_secondary_indexes(table_name)
+                    
+                    result = {'success': False, 'error': 'Import did not complete'}
+                    try:
+                        # Stream the whole file through COPY and let the server coerce types
+                        result = self.db_manager.copy_import(
+                            csv_file, table_name, column_mapping,
+                            delimiter=import_options.get('delimiter', ','),
+                            has_header=import_options.get('has_header', True),
+                            progress_callback=report_progress,
+                            batch_size=import_options.get('batch_size', IMPORT_BATCH_SIZE),
+                            clean_on_error=import_options.get('auto_fix', True)
+                        )
+                    finally:
+                        if dropped_indexes:
+                            add_log(f"Rebuilding {len(dropped_indexes)} indexes on {table_name}...")
+                            index_errors = self.db_manager.restore_indexes(dropped_indexes)
+                            if index_errors:
+                                result['index_errors'] = index_errors
+            except Exception as e:
+                logger.error(f"Error importing CSV: {str(e)}")
+                result = {'success': False, 'error': str(e)}
+            
+            self._ui_queue.put((import_finished, (result,)))
+        
+        self._center_window(progress_dialog)
+        
+        add_log(f"Source: {csv_file}")
+        flush_logs()
+        threading.Thread(target=run_import, daemon=True).start()
     
     def _show_export_dialog(self):
         """Show dialog for exporting data to CSV"""
@@ -727,9 +1434,50 @@ class FinancialAssistant:
             messagebox.showwarning("Warning", "Please connect to a database first")
             return
         
-        # Run schema fixes
-        self._validate_and_fix_database_schema()
-        messagebox.showinfo("Schema Fix", "Database schema has been checked and fixed if needed")
+        # Non-modal window: confirmation and results are shown inline
+        fix_window = tk.Toplevel(self.root)
+        fix_window.title("Fix Database Schema")
+        fix_window.geometry("500x350")
+        fix_window.configure(background=self.bg_dark)
+        fix_window.transient(self.root)
+        
+        frame = ttk.Frame(fix_window, padding="15")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Confirmation bar gates the fix instead of an askyesno pop-up
+        confirm_bar = ttk.Frame(frame)
+        confirm_bar.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(confirm_bar, text="Check the core tables and apply schema fixes?").pack(side=tk.LEFT)
+        
+        # Results are written to the status text rather than a message box
+        status_text = tk.Text(frame, height=12, bg=self.bg_light, fg=self.text_color,
+                              font='FaBody', wrap=tk.WORD)
+        status_text.pack(fill=tk.BOTH, expand=True)
+        status_text.tag_configure("success", foreground="#4caf50")
+        status_text.tag_configure("error", foreground="#f44336")
+        
+        def run_fix():
+            confirm_bar.destroy()
+            status_text.insert(tk.END, "Validating core tables...\n")
+            status_text.update_idletasks()
+            
+            # Run schema fixes
+            message = self._validate_and_fix_database_schema(show_dialog=False)
+            
+            if self.status_var.get().startswith("Error"):
+                status_text.insert(tk.END, f"\n{self.status_var.get()}\n", "error")
+            else:
+                status_text.insert(tk.END, f"\n{message}\n" if message else "\n", "success")
+                status_text.insert(tk.END, "Database schema has been checked and fixed if needed\n", "success")
+            status_text.see(tk.END)
+            status_text.configure(state=tk.DISABLED)
+        
+        ttk.Button(confirm_bar, text="No", command=fix_window.destroy).pack(side=tk.RIGHT)
+        ttk.Button(confirm_bar, text="Yes", command=run_fix,
+                 style="Accent.TButton").pack(side=tk.RIGHT, padx=(0, 5))
+        
+        ttk.Button(frame, text="Close", command=fix_window.destroy).pack(pady=(10, 0))
     
     def _show_schema_inspector(self):
         """Show the database schema inspector dialog"""
@@ -741,13 +1489,32 @@ class FinancialAssistant:
     
     def _show_about(self):
         """Show the about dialog"""
+        # Built once; closing only hides it
+        about_dialog = self._about_dialog
+        if about_dialog is None or not about_dialog.winfo_exists():
+            about_dialog = self._about_dialog = self._build_about_dialog()
+        else:
+            about_dialog.deiconify()
+        about_dialog.grab_set()
+    
+    def _build_about_dialog(self):
+        """Build the about dialog; it is hidden, not destroyed, when closed
+        
+        Returns:
+            tk.Toplevel: The dialog
+        """
         # Create dialog window with dark theme
         about_dialog = tk.Toplevel(self.root)
         about_dialog.title("About")
         about_dialog.geometry("400x300")
         about_dialog.configure(background=self.bg_dark)
         about_dialog.transient(self.root)
-        about_dialog.grab_set()
+        
+        def hide():
+            about_dialog.grab_release()
+            about_dialog.withdraw()
+        
+        about_dialog.protocol("WM_DELETE_WINDOW", hide)
         
         # Create frame
         frame = ttk.Frame(about_dialog, padding="20")
@@ -755,7 +1522,7 @@ class FinancialAssistant:
         
         # Title
         ttk.Label(frame, text="Financial Database Assistant", 
-                font=(self.font_family, 16, "bold")).pack(pady=(0,10))
+                font='FaH1').pack(pady=(0,10))
         
         # Version
         ttk.Label(frame, text="Version 1.0.0").pack(pady=5)
@@ -765,7 +1532,9 @@ class FinancialAssistant:
         ttk.Label(frame, text=description, wraplength=350).pack(pady=10)
         
         # Close button
-        ttk.Button(frame, text="Close", command=about_dialog.destroy).pack(pady=20)
+        ttk.Button(frame, text="Close", command=hide).pack(pady=20)
+        
+        return about_dialog
     
     def _show_unified_dashboard(self):
         """Open the unified invoice dashboard with private equity enhancements"""
@@ -773,6 +1542,9 @@ class FinancialAssistant:
             if not self.db_manager.is_connected:
                 messagebox.showwarning("Warning", "Please connect to a database first")
                 return
+            
+            if self._raise_dashboard_window('unified'):
+                return
                 
             # Create a new window for the dashboard
             dashboard_window = tk.Toplevel(self.root)
@@ -781,8 +1553,10 @@ class FinancialAssistant:
             dashboard_window.configure(bg="#1e1e2e")
             
             # Import and create the dashboard
-            from finance_assistant.unified_dashboard import UnifiedDashboard
-            dashboard = UnifiedDashboard(dashboard_window, self.db_manager, self.llm_client)
+            dashboard_cls = self._get_dashboard_cls('unified')
+            dashboard = dashboard_cls(dashboard_window, self.db_manager, self.llm_client)
+            
+            self._dashboard_windows['unified'] = dashboard_window
             
             # Log the action
             logger.info("Private Equity Fund Management dashboard opened")
@@ -792,16 +1566,52 @@ class FinancialAssistant:
             messagebox.showerror("Error", f"Failed to open dashboard: {str(e)}")
     
     def run(self):
-        """Run the application"""
+        """Run the application
+        
+        Returns:
+            int: Exit status in headless mode, None after the window closes
+        """
+        if self.headless:
+            return self._run_headless()
         self.root.mainloop()
+    
+    def _run_headless(self):
+        """Connect from the environment and apply schema fixes without a UI
+        
+        Returns:
+            int: 0 on success, 1 on failure
+        """
+        settings = self._auto_connect_settings()
+        if settings is None:
+            logger.error("Headless mode needs DB_NAME (and a valid DB_PORT) in the environment")
+            return 1
+        
+        db_name, host, port, username, password = settings
+        self.db_manager.tables_before_validation = list(self.db_manager.tables)
+        success, message = self.db_manager.connect_to_database(db_name, host, port, username, password)
+        if not success:
+            logger.error(f"Connection failed: {message}")
+            return 1
+        
+        try:
+            fix_message = self._apply_schema_fixes()
+        except Exception as e:
+            logger.error(f"Error validating and fixing database schema: {str(e)}")
+            return 1
+        
+        logger.info(fix_message or f"Schema for {db_name} is up to date")
+        self.db_manager.close()
+        return 0
 
 # Entry point for the application
 if __name__ == "__main__":
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Financial Database Assistant")
     parser.add_argument("--modern-ui", action="store_true", help="Use the modern UI by default")
+    parser.add_argument("--headless", action="store_true",
+                        help="Connect using .env settings, fix the schema and exit without a UI")
     args = parser.parse_args()
     
     # Create and run the application
-    app = FinancialAssistant(use_modern_ui=args.modern_ui)
-    app.run()
+    app = FinancialAssistant(use_modern_ui=args.modern_ui, headless=args.headless)
+    sys.exit(app.run())
@@ -1,12 +1,352 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
+import collections
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
-import threading
 import time
 
 logger = logging.getLogger(__name__)
 
+# Seconds an invoice list query result is reused before the database is asked again
+_QUERY_CACHE_TTL = 30.0
+
+# Query results kept at most, oldest dropped first; per-invoice entries would otherwise pile up
+_QUERY_CACHE_MAX = 64
+
+# Milliseconds the invoice selection must stay put before its details are loaded
+_DETAIL_DEBOUNCE_MS = 150
+
+# Striping tag for even and odd invoice rows, indexed by row number & 1
+_ROW_PARITY_TAGS = ("evenrow", "oddrow")
+
+# Tag of the placeholder row shown while the invoice list is loading
+_LOADING_ROW_ID = "loading"
+
+# Invoices fetched per page; the next page is loaded as the list is scrolled to its end
+_INVOICE_PAGE_SIZE = 30
+
+# Invoice queries are built once and take their filter values as bound parameters
+_INVOICE_LIST_SQL = """
+    SELECT 
+        i.invoice_id, 
+        v.vendor_name, 
+        i.amount, 
+        i.invoice_date, 
+        i.payment_status
+    FROM 
+        invoices i
+    JOIN 
+        vendors v ON i.vendor_id = v.vendor_id
+    {where}
+    ORDER BY 
+        i.invoice_date DESC, i.invoice_id DESC
+    LIMIT %s OFFSET %s
+"""
+_ALL_INVOICES_SQL = _INVOICE_LIST_SQL.format(where="")
+_INVOICES_BY_STATUS_SQL = _INVOICE_LIST_SQL.format(where="WHERE i.payment_status = %s")
+
+_INVOICE_DETAIL_SQL = """
+    SELECT 
+        i.invoice_id, 
+        i.invoice_number, 
+        i.amount,
+        i.invoice_date,
+        i.due_date,
+        i.payment_status,
+        v.vendor_name,
+        v.vendor_type,
+        v.email as contact_email
+    FROM 
+        invoices i
+    JOIN 
+        vendors v ON i.vendor_id = v.vendor_id
+    WHERE 
+        i.invoice_id = %s
+"""
+
+_INVOICE_ITEMS_SQL = """
+    SELECT 
+        item_description, 
+        quantity, 
+        unit_price as rate, 
+        (quantity * unit_price) as amount
+    FROM 
+        invoice_items
+    WHERE 
+        invoice_id = %s
+"""
+
+# Also returns fund_id, so the relationship diagram can be drawn from these rows
+_INVOICE_ALLOCATIONS_SQL = """
+    SELECT 
+        f.fund_name, 
+        a.allocation_percentage,
+        (i.amount * a.allocation_percentage / 100) as allocated_amount,
+        f.fund_id
+    FROM 
+        expense_allocation a
+    JOIN 
+        funds f ON a.fund_id = f.fund_id
+    JOIN 
+        invoices i ON a.invoice_id = i.invoice_id
+    WHERE 
+        a.invoice_id = %s
+"""
+
+# Every dashboard metric in one scan of invoices, aggregated by the database
+_DASHBOARD_METRICS_SQL = """
+    SELECT 
+        COALESCE(SUM(amount), 0),
+        COALESCE(SUM(amount) FILTER (WHERE payment_status = 'Paid'
+                                       AND invoice_date >= date_trunc('year', CURRENT_DATE)), 0),
+        COALESCE(SUM(amount) FILTER (WHERE payment_status <> 'Paid'), 0),
+        COALESCE(SUM(amount) FILTER (WHERE payment_status <> 'Paid'
+                                       AND due_date < CURRENT_DATE), 0),
+        COALESCE(SUM(amount) FILTER (WHERE payment_status <> 'Paid'
+                                       AND due_date BETWEEN CURRENT_DATE AND CURRENT_DATE + 30), 0),
+        (SELECT COUNT(*) FROM expense_allocation)
+    FROM 
+        invoices
+"""
+
+_INVOICE_RELATIONSHIPS_SQL = """
+    SELECT 
+        i.invoice_id, i.invoice_number, 
+        v.vendor_id, v.vendor_name,
+        f.fund_id, f.fund_name,
+        a.allocation_percentage
+    FROM 
+        invoices i
+    JOIN 
+        vendors v ON i.vendor_id = v.vendor_id
+    LEFT JOIN 
+        expense_allocation a ON i.invoice_id = a.invoice_id
+    LEFT JOIN 
+        funds f ON a.fund_id = f.fund_id
+    WHERE 
+        i.invoice_id = %s
+"""
+
+def _format_invoice_rows(rows):
+    """Turn invoice list query rows into (invoice_id, values) pairs for the invoice table
+    
+    Args:
+        rows: Rows of (invoice_id, vendor_name, amount, invoice_date, payment_status)
+        
+    Returns:
+        list: (invoice_id, (vendor, amount, date, status)) tuples
+    """
+    # A column holds one date type, so find it once and compare types exactly per row
+    date_type = next((type(row[3]) for row in rows if isinstance(row[3], (date, datetime))), None)
+    
+    table_rows = []
+    for row in rows:
+        # Format date
+        date_str = row[3].strftime("%m/%d/%Y") if type(row[3]) is date_type else str(row[3])
+        
+        # Format amount
+        try:
+            amount = float(row[2])
+            amount_str = f"${amount:,.2f}"
+        except (ValueError, TypeError):
+            amount_str = f"${0:,.2f}"
+        
+        table_rows.append((row[0], (
+            row[1],  # vendor_name
+            amount_str,
+            date_str,
+            row[4]   # payment_status
+        )))
+    return table_rows
+
+def _amount_sort_key(value):
+    """Convert an amount to a float for sorting; values that aren't numbers sort as NaN"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return float('nan')
+
+def _format_date(value):
+    """Format a date for the detail panel, passing other values through as text"""
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%m/%d/%Y")
+    return str(value if value is not None else "")
+
+def _fmt_amount(value):
+    """Format an invoice amount for the detail panel's totals, passing '$' strings through"""
+    if isinstance(value, str) and value.startswith('$'):
+        return value
+    try:
+        return f"${float(value):.2f}"
+    except (ValueError, TypeError):
+        return "$0.00"
+
+def _format_item_rows(items):
+    """Format (item_description, quantity, rate, amount) sequences as items table rows"""
+    return [((i, description, quantity, f"${float(rate):.2f}", f"${float(amount):.2f}"), ())
+            for i, (description, quantity, rate, amount) in enumerate(items, 1)]
+
+def _format_alloc_rows(allocations):
+    """Format (fund_name, allocation_percentage, allocated_amount) sequences as allocations table rows"""
+    return [((fund_name, f"{float(percentage):.1f}%", f"${float(alloc_amount):.2f}"), ())
+            for fund_name, percentage, alloc_amount in allocations]
+
+# Backslash escapes for every character Tcl would otherwise substitute or split on
+_TCL_ESCAPES = str.maketrans({**{c: '\\' + c for c in '\\{}[]$"; \t'}, '\n': '\\n', '\r': '\\r'})
+
+def _tcl_word(value):
+    """Quote a value as a single Tcl word for a tk.eval script
+    
+    Every special character is backslash-escaped, so no $, [] or braces in
+    the data are ever substituted.
+    """
+    return str(value).translate(_TCL_ESCAPES) or '{}'
+
+def _tcl_list(values):
+    """Quote values as a single braced Tcl list word for a tk.eval script"""
+    return '{' + ' '.join(map(_tcl_word, values)) + '}'
+
+def _insert_rows(tree, rows):
+    """Append rows to a Treeview with a single Tcl script instead of one call per row
+    
+    Args:
+        tree: The ttk.Treeview to insert into
+        rows: Iterable of (values, tags) tuples
+    """
+    script = ''.join(f"{tree} insert {{}} end -values {_tcl_list(values)} -tags {_tcl_list(tags)}\n"
+                     for values, tags in rows)
+    if script:
+        tree.tk.eval(script)
+
+def _replace_rows(tree, rows):
+    """Make a Treeview show exactly these rows, reusing the items it already has
+    
+    Existing items are updated in place and only the surplus is deleted or the
+    shortfall inserted, all in one Tcl script, so switching between invoices
+    does not recreate the detail tables' items every time.
+    
+    Args:
+        tree: The ttk.Treeview to fill
+        rows: Sequence of (values, tags) tuples
+    """
+    children = tree.get_children()
+    script = ''.join(f"{tree} item {_tcl_word(iid)} -values {_tcl_list(values)} -tags {_tcl_list(tags)}\n"
+                     for iid, (values, tags) in zip(children, rows))
+    if len(children) > len(rows):
+        script += f"{tree} delete {_tcl_list(children[len(rows):])}\n"
+    script += ''.join(f"{tree} insert {{}} end -values {_tcl_list(values)} -tags {_tcl_list(tags)}\n"
+                      for values, tags in rows[len(children):])
+    if script:
+        tree.tk.eval(script)
+
+# Size of the relationship diagram image, matching the detail panel's canvas
+_DIAGRAM_SIZE = (500, 200)
+
+# Relationship diagram colours and the dash pattern of invoice-to-fund lines
+_DIAGRAM_INVOICE_COLOR = "#3498db"
+_DIAGRAM_VENDOR_COLOR = "#e74c3c"
+_DIAGRAM_FUND_COLOR = "#27ae60"
+_DIAGRAM_LINK_COLOR = "#2c3e50"
+_DIAGRAM_MUTED_COLOR = "#666666"
+_DIAGRAM_DASH = (4, 2)
+
+# Rendered relationship diagrams kept for quick re-selection, least recently shown dropped first
+_DIAGRAM_CACHE_MAX = 64
+
+# TrueType files tried for diagram text, (regular, bold), Arial first as on Windows
+_DIAGRAM_FONT_FILES = (
+    ("arial.ttf", "arialbd.ttf"),
+    ("DejaVuSans.ttf", "DejaVuSans-Bold.ttf"),
+    ("LiberationSans-Regular.ttf", "LiberationSans-Bold.ttf"),
+)
+
+# Diagram fonts by (pixel size, bold), loaded on first use
+_diagram_fonts = {}
+
+def _diagram_font(widget, size, bold=False):
+    """Return the font used for relationship diagram text, loading it once
+    
+    Args:
+        widget: Widget whose screen scaling converts points to pixels
+        size: Point size, as in a Tk font description
+        bold: Whether to use the bold face
+    """
+    # PIL sizes fonts in pixels, Tk in points
+    pixels = max(1, round(size * widget.winfo_fpixels('1p')))
+    font = _diagram_fonts.get((pixels, bold))
+    if font is None:
+        from PIL import ImageFont  # Only needed once a diagram is drawn
+        for files in _DIAGRAM_FONT_FILES:
+            try:
+                font = ImageFont.truetype(files[bold], pixels)
+                break
+            except OSError:
+                continue
+        else:
+            # Pillow 10.1+, the minimum in requirements.txt, ships a scalable default font
+            font = ImageFont.load_default(size=pixels)
+        _diagram_fonts[(pixels, bold)] = font
+    return font
+
+def _new_diagram_image():
+    """Create a blank relationship diagram image and a drawing context for it"""
+    from PIL import Image, ImageDraw  # Only needed once a diagram is drawn
+    image = Image.new("RGB", _DIAGRAM_SIZE, "white")
+    return image, ImageDraw.Draw(image)
+
+def _draw_centered_text(draw, x, y, text, font, fill):
+    """Draw (possibly multi-line) text centered on a point, like a Tk canvas text item"""
+    left, top, right, bottom = draw.multiline_textbbox((0, 0), text, font=font, align="center")
+    draw.multiline_text((x - (left + right) / 2, y - (top + bottom) / 2), text,
+                        font=font, fill=fill, align="center")
+
+def _draw_dashed_line(draw, start, end, dash=_DIAGRAM_DASH, **kwargs):
+    """Draw a dashed line, since ImageDraw only draws solid ones
+    
+    Args:
+        draw: ImageDraw to draw with
+        start: (x, y) the line starts at
+        end: (x, y) the line ends at
+        dash: Lengths of each dash and of the gap after it
+        **kwargs: Passed on to ImageDraw.line, e.g. fill and width
+    """
+    (x0, y0), (x1, y1) = start, end
+    length = ((x1 - x0) ** 2 + (y1 - y0) ** 2) ** 0.5
+    if not length:
+        return
+    dx, dy = (x1 - x0) / length, (y1 - y0) / length
+    on, off = dash
+    pos = 0.0
+    while pos < length:
+        stop = min(pos + on, length)
+        draw.line((x0 + dx * pos, y0 + dy * pos, x0 + dx * stop, y0 + dy * stop), **kwargs)
+        pos = stop + off
+
+def _show_diagram_image(canvas, image):
+    """Show a rendered diagram as the canvas's only item
+    
+    Args:
+        canvas: Canvas to show the diagram on
+        image: PIL image of the diagram
+        
+    Returns:
+        ImageTk.PhotoImage: The photo shown, which _show_diagram_photo can show again
+    """
+    from PIL import ImageTk  # Only needed once a diagram is drawn
+    photo = ImageTk.PhotoImage(image, master=canvas)
+    _show_diagram_photo(canvas, photo)
+    return photo
+
+def _show_diagram_photo(canvas, photo):
+    """Show an already rendered diagram photo as the canvas's only item
+    
+    The photo is kept on the canvas so it is not garbage collected while shown.
+    """
+    canvas.image = photo
+    canvas.create_image(0, 0, anchor="nw", image=photo)
+
 class ModernDashboard:
     def __init__(self, parent, db_manager=None, llm_client=None):
         """Initialize the modern dashboard with three-panel layout"""
@@ -34,16 +374,53 @@ class ModernDashboard:
             'category': None
         }
         
+        # One query thread, started on first use: every query goes through the shared
+        # psycopg2 connection, which runs one statement at a time, and a second thread's
+        # rollback could discard a transaction this one has open. The pool is shut down
+        # when the dashboard's frame is destroyed, dropping queued queries; concurrent.futures
+        # still waits for a query that is already running when the interpreter exits.
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dashboard-db')
+        
         # UI component references
         self.frame = None
         self.nav_frame = None
         self.list_frame = None
         self.detail_frame = None
         self.invoice_table = None
+        self.status_combo = None
         self.status_var = None
         self.sort_column = None
         self.sort_reverse = False
+        
+        # Rows currently in the invoice table: the raw query rows, their formatted
+        # (invoice_id, values) pairs, and the raw rows as NumPy columns for sorting
+        self._loaded_rows = []
+        self._loaded_table_rows = []
+        self._rows_cols = None
         self.selected_invoice_id = None
+        self._pending_detail = None  # after() id of a scheduled show_invoice_details
+        
+        # Query results keyed by status filter or (kind, invoice_id) -> (fetched_at, result),
+        # oldest first, which is also the order they expire in
+        self._query_cache = collections.OrderedDict()
+        
+        # Rendered relationship diagrams by invoice_id -> (drawn_at, rows drawn, photo), oldest first
+        self._diagram_cache = collections.OrderedDict()
+        
+        # Latest request number per kind ('list', 'page', 'details'); older replies are dropped
+        self._request_tokens = {}
+        
+        # Paging state of the invoice list: (cache key, query, params) of the current
+        # list, rows loaded so far, whether the last page was reached and one is in flight
+        self._list_query = None
+        self._loaded_offset = 0
+        self._list_exhausted = True
+        self._page_loading = False
+        
+        # Fonts shared by the detail panel's labels and diagram messages, created once
+        # so Tk does not parse a font description for every widget
+        self._label_font = tkfont.Font(root=parent, family="Arial", size=10, weight="bold")
+        self._message_font = tkfont.Font(root=parent, family="Arial", size=10)
         
         # Create UI
         self.create_ui()
@@ -62,6 +439,7 @@ class ModernDashboard:
         # Create the main container
         self.frame = ttk.Frame(self.parent)
         self.frame.pack(fill=tk.BOTH, expand=True)
+        self.frame.bind("<Destroy>", self._on_destroy)
         
         # Create paned window for resizable panels
         self.main_container = ttk.PanedWindow(self.frame, orient=tk.HORIZONTAL)
@@ -125,6 +503,10 @@ class ModernDashboard:
                 background=[("selected", "#e1f0fd")],
                 foreground=[("selected", text_dark)])
         
+        # Invoice row striping, configured once rather than on every load
+        self.invoice_table.tag_configure('oddrow', background='#f9f9f9')
+        self.invoice_table.tag_configure('evenrow', background=bg_light)
+        
         # Custom heading style
         style.configure("Treeview.Heading", 
                       font=('Arial', 10, 'bold'),
@@ -176,10 +558,21 @@ class ModernDashboard:
             icon_label.configure(foreground="white")
             text_label.configure(foreground="white")
             
-            # Bind click event
-            item_frame.bind("<Button-1>", lambda e, t=item["text"]: self.nav_item_clicked(t))
-            icon_label.bind("<Button-1>", lambda e, t=item["text"]: self.nav_item_clicked(t))
-            text_label.bind("<Button-1>", lambda e, t=item["text"]: self.nav_item_clicked(t))
+            # Clicks on the item or its labels go to the shared NavItem class binding
+            item_frame.nav_name = item["text"]
+            for widget in (item_frame, icon_label, text_label):
+                widget.bindtags(("NavItem",) + widget.bindtags())
+        
+        # One binding serves every nav item
+        self.nav_frame.bind_class("NavItem", "<Button-1>", self._nav_click_dispatch)
+    
+    def _nav_click_dispatch(self, event):
+        """Route a click on any nav item widget to nav_item_clicked"""
+        widget = event.widget
+        while widget is not None and not hasattr(widget, "nav_name"):
+            widget = widget.master
+        if widget is not None:
+            self.nav_item_clicked(widget.nav_name)
     
     def nav_item_clicked(self, item_name):
         """Handle navigation item click"""
@@ -200,7 +593,7 @@ class ModernDashboard:
         ttk.Label(header_frame, text="Status:").pack(side=tk.LEFT, padx=(20,5))
         
         self.filter_vars['status'] = tk.StringVar(value="All")
-        status_combo = ttk.Combobox(header_frame, textvariable=self.filter_vars['status'],
+        status_combo = self.status_combo = ttk.Combobox(header_frame, textvariable=self.filter_vars['status'],
                                   values=["All", "Paid", "Unpaid", "Pending", "Approved", "Overdue"], 
                                   width=10)
         status_combo.pack(side=tk.LEFT)
@@ -220,27 +613,27 @@ class ModernDashboard:
                                         height=20)
         
         # Configure columns
-        self.invoice_table.heading("vendor", text="Vendor")
-        self.invoice_table.heading("amount", text="Amount")
-        self.invoice_table.heading("date", text="Date")
-        self.invoice_table.heading("status", text="Status")
+        self.invoice_table.heading("vendor", text="Vendor", command=lambda: self.sort_by_column("vendor"))
+        self.invoice_table.heading("amount", text="Amount", command=lambda: self.sort_by_column("amount"))
+        self.invoice_table.heading("date", text="Date", command=lambda: self.sort_by_column("date"))
+        self.invoice_table.heading("status", text="Status", command=lambda: self.sort_by_column("status"))
         
-        self.invoice_table.column("vendor", width=150)
-        self.invoice_table.column("amount", width=100, anchor="e")
-        self.invoice_table.column("date", width=100, anchor="center")
-        self.invoice_table.column("status", width=80, anchor="center")
+        self.invoice_table.column("vendor", width=150, minwidth=150, stretch=tk.NO)
+        self.invoice_table.column("amount", width=100, minwidth=100, stretch=tk.NO, anchor="e")
+        self.invoice_table.column("date", width=100, minwidth=100, stretch=tk.NO, anchor="center")
+        self.invoice_table.column("status", width=80, minwidth=80, stretch=tk.NO, anchor="center")
         
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, 
-                                command=self.invoice_table.yview)
-        self.invoice_table.configure(yscrollcommand=scrollbar.set)
+        # Add scrollbar; scrolling near the end loads the next page of invoices
+        scrollbar = self._invoice_scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, 
+                                                         command=self.invoice_table.yview)
+        self.invoice_table.configure(yscrollcommand=self._on_invoice_scroll)
         
         # Pack table and scrollbar
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.invoice_table.pack(fill=tk.BOTH, expand=True)
         
         # Bind selection event to show details
-        self.invoice_table.bind("<<TreeviewSelect>>", self.show_invoice_details)
+        self.invoice_table.bind("<<TreeviewSelect>>", self._schedule_show_details)
         
         # Load invoices (sample data for now)
         self.load_sample_invoices()
@@ -263,8 +656,14 @@ class ModernDashboard:
         self.detail_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Default message
-        ttk.Label(self.detail_container, text="Select an invoice to view details", 
-                font=("Arial", 12)).pack(pady=50)
+        self.detail_placeholder = ttk.Label(self.detail_container, text="Select an invoice to view details", 
+                                         font=("Arial", 12))
+        self.detail_placeholder.pack(pady=50)
+        
+        # The detail view is built once and only refilled on each selection
+        self.detail_view = ttk.Frame(self.detail_container, style="Modern.TFrame")
+        self.detail_widgets = {}
+        self._build_detail_view(self.detail_view)
     
     def create_status_bar(self):
         """Create status bar at bottom of window"""
@@ -276,11 +675,34 @@ class ModernDashboard:
                                font=('Segoe UI', 9))
         status_label.pack(side=tk.LEFT, padx=5)
     
+    def _fill_invoice_table(self, rows):
+        """Replace the invoice table's contents while the table is unmapped
+        
+        Unpacking the Treeview for the duration saves Tk a layout and redraw
+        pass per inserted row; it is repacked once with its original options.
+        
+        Args:
+            rows: Iterable of (invoice_id, values) pairs in display order
+        """
+        table = self.invoice_table
+        pack_options = table.pack_info() if table.winfo_manager() == 'pack' else None
+        if pack_options:
+            table.pack_forget()
+        
+        try:
+            # Remove every row in one call
+            table.delete(*table.get_children())
+            
+            _insert_rows(table, ((values, (invoice_id, _ROW_PARITY_TAGS[i & 1]))
+                                 for i, (invoice_id, values) in enumerate(rows)))
+        finally:
+            if pack_options:
+                table.pack(**pack_options)
+    
     def load_sample_invoices(self):
         """Load sample invoice data for demo purposes"""
-        # Clear existing items
-        for item in self.invoice_table.get_children():
-            self.invoice_table.delete(item)
+        # Sample rows are not paged
+        self._list_query = None
         
         # Sample data
         sample_invoices = [
@@ -304,20 +726,181 @@ class ModernDashboard:
              "date": "08/15/2023", "status": "Pending"}
         ]
         
-        # Add invoices to table
-        for i, invoice in enumerate(sample_invoices):
-            self.invoice_table.insert("", "end", 
-                                    values=(
-                                        invoice["vendor"],
-                                        f"${invoice['amount']:,.2f}",
-                                        invoice["date"],
-                                        invoice["status"]
-                                    ), 
-                                    tags=(invoice["id"], "evenrow" if i % 2 == 0 else "oddrow"))
-        
-        # Apply row style
-        self.invoice_table.tag_configure('oddrow', background='#f9f9f9')
-        self.invoice_table.tag_configure('evenrow', background='#ffffff')
+        # Add invoices to table, in the same row shape the invoice queries return
+        rows = [(invoice["id"], invoice["vendor"], invoice["amount"],
+                 datetime.strptime(invoice["date"], "%m/%d/%Y").date(), invoice["status"])
+                for invoice in sample_invoices]
+        self._show_invoice_rows(rows, _format_invoice_rows(rows))
+    
+    def _show_invoice_rows(self, rows, table_rows):
+        """Replace the invoice table's rows, keeping the raw rows for sorting
+        
+        Args:
+            rows: Raw invoice list rows
+            table_rows: The same rows formatted by _format_invoice_rows
+        """
+        self._loaded_rows = list(rows)
+        self._loaded_table_rows = list(table_rows)
+        self._rows_cols = None
+        self._fill_invoice_table(self._sorted_table_rows())
+    
+    def _sorted_table_rows(self):
+        """Return the loaded table rows in the current sort order
+        
+        Returns:
+            list: (invoice_id, values) pairs
+        """
+        if self.sort_column is None or not self._loaded_rows:
+            return self._loaded_table_rows
+        
+        import numpy as np  # Only needed once a column is sorted
+        
+        # Build the column arrays once per set of loaded rows
+        if self._rows_cols is None:
+            rows = self._loaded_rows
+            self._rows_cols = {
+                'vendor': np.asarray([str(row[1] or "").lower() for row in rows]),
+                'amount': np.asarray([_amount_sort_key(row[2]) for row in rows], dtype=np.float64),
+                'date': np.asarray([row[3] if isinstance(row[3], (date, datetime)) else None for row in rows],
+                                   dtype='datetime64[D]'),
+                'status': np.asarray([str(row[4] or "").lower() for row in rows])
+            }
+        
+        order = np.argsort(self._rows_cols[self.sort_column], kind='stable')
+        if self.sort_reverse:
+            order = order[::-1]
+        
+        table_rows = self._loaded_table_rows
+        return [table_rows[i] for i in order]
+    
+    def sort_by_column(self, column):
+        """Sort the loaded invoices by a column, reversing the order on a second click
+        
+        Args:
+            column: Column name ('vendor', 'amount', 'date' or 'status')
+        """
+        if self.sort_column == column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = column
+            self.sort_reverse = False
+        
+        self._fill_invoice_table(self._sorted_table_rows())
+    
+    def _cached_query(self, key, query, params=None):
+        """Run an invoice list query, reusing a result from the last few seconds
+        
+        Args:
+            key: Cache key identifying the query, e.g. the status filter
+            query: SQL to run on a cache miss
+            params: Parameters bound to the query's placeholders
+            
+        Returns:
+            dict: Result of db_manager.execute_query
+        """
+        now = time.monotonic()
+        
+        cached = self._query_cache.get(key)
+        if cached and now - cached[0] < _QUERY_CACHE_TTL:
+            return cached[1]
+        
+        result = self.db_manager.execute_query(query, params)
+        if not result.get('error'):
+            self._query_cache.pop(key, None)
+            self._query_cache[key] = (now, result)
+            if len(self._query_cache) > _QUERY_CACHE_MAX:
+                self._query_cache.popitem(last=False)
+        return result
+    
+    def _fetch_invoice_list(self, key, query, params=None):
+        """Run an invoice list query and format its rows for the table, off the Tk thread
+        
+        The formatted rows are kept on the cached result under 'table_rows', so
+        a cache hit costs neither a query nor any formatting.
+        
+        Args:
+            key: Cache key identifying the query, e.g. the status filter
+            query: SQL to run on a cache miss
+            params: Parameters bound to the query's placeholders
+            
+        Returns:
+            dict: Query result with an added 'table_rows' list unless it is an error
+        """
+        result = self._cached_query(key, query, params)
+        if not result.get('error') and 'table_rows' not in result:
+            result['table_rows'] = _format_invoice_rows(result.get('rows') or [])
+        return result
+    
+    def invalidate_invoice_cache(self):
+        """Forget cached invoice lists and diagrams after invoices have been added or changed"""
+        self._query_cache.clear()
+        self._diagram_cache.clear()
+    
+    def _run_in_background(self, kind, work, callback):
+        """Run a database call on the dashboard's worker pool and hand its result to the Tk thread
+        
+        Only the most recent request of each kind is delivered, so quickly
+        switching filters or invoices never paints a stale reply over a newer one.
+        
+        Args:
+            kind: Request kind; a new request supersedes pending ones of the same kind
+            work: Function run on the worker thread; returns the result
+            callback: Function called on the Tk thread with the result
+        """
+        token = self._request_tokens.get(kind, 0) + 1
+        self._request_tokens[kind] = token
+        
+        def deliver(result):
+            if self._request_tokens.get(kind) == token and self.frame.winfo_exists():
+                callback(result)
+        
+        def worker():
+            # Skip queries superseded while they waited for a free thread
+            if self._request_tokens.get(kind) != token:
+                return
+            
+            try:
+                result = work()
+            except Exception as e:
+                result = {'error': str(e)}
+            
+            try:
+                self.parent.after(0, deliver, result)
+            except (RuntimeError, tk.TclError):
+                # The dashboard window was closed while the query ran
+                pass
+        
+        try:
+            self._db_executor.submit(worker)
+        except RuntimeError:
+            # The dashboard is being destroyed and its pool is shut down
+            pass
+    
+    def _on_destroy(self, event):
+        """Stop the query pool when the dashboard's frame is destroyed
+        
+        Args:
+            event: The <Destroy> event; children's events are ignored
+        """
+        if event.widget is self.frame:
+            self._db_executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _begin_list_loading(self, message):
+        """Show a placeholder row and lock the status filter while the invoice list loads
+        
+        Args:
+            message: Text for the status bar
+        """
+        self.status_var.set(message)
+        self.status_combo.state(['disabled'])
+        self._loaded_rows = []
+        self._loaded_table_rows = []
+        self._rows_cols = None
+        self._fill_invoice_table([(_LOADING_ROW_ID, ("Loading…", "", "", ""))])
+    
+    def _end_list_loading(self):
+        """Unlock the status filter once the invoice list has arrived"""
+        self.status_combo.state(['!disabled'])
     
     def load_invoices(self):
         """Load real invoices from database"""
@@ -325,62 +908,133 @@ class ModernDashboard:
         if not self.db_manager or not hasattr(self.db_manager, 'execute_query'):
             self.load_sample_invoices()
             return
+        
+        self._begin_list_loading("Loading invoices...")
+        self._start_invoice_list("All", _ALL_INVOICES_SQL, (), self._show_all_invoices)
+    
+    def _start_invoice_list(self, key, query, params, callback):
+        """Load the first page of an invoice list in the background
+        
+        Args:
+            key: Cache key of the list, e.g. the status filter
+            query: Invoice list SQL ending in LIMIT %s OFFSET %s
+            params: Parameters for the query's filter placeholders
+            callback: Function called on the Tk thread with the first page's result
+        """
+        self._list_query = (key, query, params)
+        self._loaded_offset = 0
+        self._list_exhausted = True
+        
+        # A page still loading for the previous list must not be appended to this one
+        self._request_tokens['page'] = self._request_tokens.get('page', 0) + 1
+        self._page_loading = False
+        
+        self._run_in_background('list', lambda: self._fetch_invoice_page(key, query, params, 0), callback)
+    
+    def _fetch_invoice_page(self, key, query, params, offset):
+        """Fetch one page of an invoice list, formatted for the table
+        
+        Args:
+            key: Cache key of the list
+            query: Invoice list SQL ending in LIMIT %s OFFSET %s
+            params: Parameters for the query's filter placeholders
+            offset: Number of rows to skip
             
+        Returns:
+            dict: Result of _fetch_invoice_list
+        """
+        return self._fetch_invoice_list((key, offset), query, tuple(params) + (_INVOICE_PAGE_SIZE, offset))
+    
+    def _first_page_loaded(self, result):
+        """Record how much of the current invoice list the table now holds
+        
+        Args:
+            result: Result of the first page's query
+        """
+        rows = result.get('rows') or []
+        self._loaded_offset = len(rows)
+        self._list_exhausted = len(rows) < _INVOICE_PAGE_SIZE
+    
+    def _on_invoice_scroll(self, first, last):
+        """Update the scrollbar and load the next page once the end of the list is in view
+        
+        Args:
+            first: Fraction of the list above the view
+            last: Fraction of the list up to the bottom of the view
+        """
+        self._invoice_scrollbar.set(first, last)
+        if float(last) >= 0.9:
+            self._load_next_invoice_page()
+    
+    def _load_next_invoice_page(self):
+        """Fetch the next page of the current invoice list in the background"""
+        if self._list_query is None or self._list_exhausted or self._page_loading:
+            return
+        
+        key, query, params = self._list_query
+        offset = self._loaded_offset
+        self._page_loading = True
+        self._run_in_background('page', lambda: self._fetch_invoice_page(key, query, params, offset),
+                                lambda result: self._append_invoice_page(offset, result))
+    
+    def _append_invoice_page(self, offset, result):
+        """Add a fetched page to the end of the invoice table
+        
+        Args:
+            offset: Row offset the page was fetched from
+            result: Result of the page query
+        """
+        self._page_loading = False
+        if result.get('error'):
+            logger.error(f"Error loading more invoices: {result.get('error')}")
+            return
+        if offset != self._loaded_offset:
+            return
+        
+        table_rows = result['table_rows']
+        if self.sort_column is not None:
+            # Note the row at the top of the view; refilling the sorted table
+            # below would otherwise scroll it back to the first row
+            shown = self._sorted_table_rows()
+            top = min(int(self.invoice_table.yview()[0] * len(shown)), len(shown) - 1)
+            top_row = shown[top] if shown else None
+        
+        self._loaded_rows.extend(result.get('rows') or [])
+        self._loaded_table_rows.extend(table_rows)
+        self._rows_cols = None
+        
+        if self.sort_column is None:
+            _insert_rows(self.invoice_table, ((values, (invoice_id, _ROW_PARITY_TAGS[(offset + i) & 1]))
+                                              for i, (invoice_id, values) in enumerate(table_rows)))
+        else:
+            # Merge the new page into the sorted order and keep the same row in view
+            sorted_rows = self._sorted_table_rows()
+            self._fill_invoice_table(sorted_rows)
+            if top_row is not None:
+                top = next(i for i, row in enumerate(sorted_rows) if row is top_row)
+                self.invoice_table.yview_moveto(top / len(sorted_rows))
+        
+        self._loaded_offset += len(table_rows)
+        self._list_exhausted = len(table_rows) < _INVOICE_PAGE_SIZE
+    
+    def _show_all_invoices(self, result):
+        """Fill the invoice table with the unfiltered invoice list
+        
+        Args:
+            result: Result of the invoice list query
+        """
+        self._end_list_loading()
         try:
-            # Query to get invoices
-            query = """
-            SELECT 
-                i.invoice_id, 
-                v.vendor_name, 
-                i.amount, 
-                i.invoice_date, 
-                i.payment_status
-            FROM 
-                invoices i
-            JOIN 
-                vendors v ON i.vendor_id = v.vendor_id
-            ORDER BY 
-                i.invoice_date DESC
-            LIMIT 100
-            """
-            
-            result = self.db_manager.execute_query(query)
-            
             # Check for error or no results
             if result.get('error') or not result.get('rows'):
                 logger.error(f"Error loading invoices: {result.get('error', 'No results')}")
                 self.load_sample_invoices()
                 return
-                
-            # Clear existing items
-            for item in self.invoice_table.get_children():
-                self.invoice_table.delete(item)
             
             # Add invoices to table
-            for i, row in enumerate(result['rows']):
-                # Format date
-                date_str = row[3].strftime("%m/%d/%Y") if isinstance(row[3], (date, datetime)) else str(row[3])
-                
-                # Format amount
-                try:
-                    amount = float(row[2])
-                    amount_str = f"${amount:,.2f}"
-                except (ValueError, TypeError):
-                    amount_str = f"${0:,.2f}"
-                
-                # Add to table
-                self.invoice_table.insert("", "end", 
-                                        values=(
-                                            row[1],  # vendor_name
-                                            amount_str,
-                                            date_str,
-                                            row[4]   # payment_status
-                                        ), 
-                                        tags=(row[0], "evenrow" if i % 2 == 0 else "oddrow"))
-            
-            # Apply row style
-            self.invoice_table.tag_configure('oddrow', background='#f9f9f9')
-            self.invoice_table.tag_configure('evenrow', background='#ffffff')
+            self._show_invoice_rows(result['rows'], result['table_rows'])
+            self._first_page_loaded(result)
+            self.status_var.set(f"Loaded {len(result['rows'])} invoices")
                 
         except Exception as e:
             logger.error(f"Error loading invoices: {str(e)}")
@@ -398,82 +1052,85 @@ class ModernDashboard:
         # Skip if db_manager is not available
         if not self.db_manager or not hasattr(self.db_manager, 'execute_query'):
             return
-            
+        
+        self._begin_list_loading(f"Loading {status} invoices...")
+        self._start_invoice_list(status, _INVOICES_BY_STATUS_SQL, (status,),
+                                 lambda result: self._show_filtered_invoices(status, result))
+    
+    def _show_filtered_invoices(self, status, result):
+        """Fill the invoice table with the invoices matching a status filter
+        
+        Args:
+            status: Status the invoices were filtered by
+            result: Result of the filtered invoice query
+        """
+        self._end_list_loading()
         try:
-            # Query to get filtered invoices
-            query = f"""
-            SELECT 
-                i.invoice_id, 
-                v.vendor_name, 
-                i.amount, 
-                i.invoice_date, 
-                i.payment_status
-            FROM 
-                invoices i
-            JOIN 
-                vendors v ON i.vendor_id = v.vendor_id
-            WHERE 
-                i.payment_status = '{status}'
-            ORDER BY 
-                i.invoice_date DESC
-            LIMIT 100
-            """
-            
-            result = self.db_manager.execute_query(query)
-            
             # Check for error or no results
             if result.get('error'):
                 logger.error(f"Error filtering invoices: {result.get('error')}")
+                self._fill_invoice_table([])
+                self.status_var.set(f"Could not load {status} invoices")
                 return
                 
-            # Clear existing items
-            for item in self.invoice_table.get_children():
-                self.invoice_table.delete(item)
-            
             # Add invoices to table
-            for i, row in enumerate(result.get('rows', [])):
-                # Format date
-                date_str = row[3].strftime("%m/%d/%Y") if isinstance(row[3], (date, datetime)) else str(row[3])
-                
-                # Format amount
-                try:
-                    amount = float(row[2])
-                    amount_str = f"${amount:,.2f}"
-                except (ValueError, TypeError):
-                    amount_str = f"${0:,.2f}"
-                
-                # Add to table
-                self.invoice_table.insert("", "end", 
-                                        values=(
-                                            row[1],  # vendor_name
-                                            amount_str,
-                                            date_str,
-                                            row[4]   # payment_status
-                                        ), 
-                                        tags=(row[0], "evenrow" if i % 2 == 0 else "oddrow"))
-            
-            # Apply row style
-            self.invoice_table.tag_configure('oddrow', background='#f9f9f9')
-            self.invoice_table.tag_configure('evenrow', background='#ffffff')
+            self._show_invoice_rows(result.get('rows') or [], result['table_rows'])
+            self._first_page_loaded(result)
             
             # Update status
             if not result.get('rows'):
                 self.status_var.set(f"No invoices found with status: {status}")
             else:
-                self.status_var.set(f"Found {len(result['rows'])} invoices with status: {status}")
+                self.status_var.set(f"Showing {len(result['rows'])} invoices with status: {status}")
                 
         except Exception as e:
             logger.error(f"Error filtering invoices: {str(e)}")
     
     def update_dashboard_data(self):
         """Update dashboard data"""
-        # This would query the database for metrics
-        # For now, just set the status
         self.status_var.set("Dashboard data refreshed")
         
+        # Metrics are aggregated by the database on a worker thread
+        if self.db_manager and hasattr(self.db_manager, 'execute_query'):
+            self._run_in_background('metrics', lambda: self._cached_query('metrics', _DASHBOARD_METRICS_SQL),
+                                    self._apply_dashboard_metrics)
+        
         # Load invoices
         self.load_invoices()
     
+    def _apply_dashboard_metrics(self, result):
+        """Store the totals computed by _DASHBOARD_METRICS_SQL
+        
+        Args:
+            result: Result of the metrics query
+        """
+        if result.get('error') or not result.get('rows'):
+            logger.error(f"Error loading dashboard metrics: {result.get('error', 'No results')}")
+            return
+        
+        (total, paid_this_year, unpaid, overdue, upcoming, allocations) = result['rows'][0]
+        self.total_amount = float(total)
+        self.total_paid_current_year = float(paid_this_year)
+        self.total_unpaid = float(unpaid)
+        self.total_overdue = float(overdue)
+        self.total_upcoming_payments = float(upcoming)
+        self.fund_allocation_count = allocations
+    
+    def _schedule_show_details(self, event=None):
+        """Load the selected invoice's details once the selection has settled
+        
+        Holding an arrow key fires a selection event per row; only the row the
+        selection stops on is looked up.
+        """
+        if self._pending_detail is not None:
+            self.frame.after_cancel(self._pending_detail)
+        self._pending_detail = self.frame.after(_DETAIL_DEBOUNCE_MS, self._do_show_details)
+    
+    def _do_show_details(self):
+        """Run the debounced show_invoice_details"""
+        self._pending_detail = None
+        self.show_invoice_details(None)
+    
     def show_invoice_details(self, event):
         """Show detailed view of invoice when selected"""
         # Get selected item
@@ -484,13 +1141,13 @@ class ModernDashboard:
         selected_item = selected_items[0]
         invoice_id = self.invoice_table.item(selected_item, "tags")[0]
         
+        # The loading placeholder has no details
+        if invoice_id == _LOADING_ROW_ID:
+            return
+        
         # Store selected invoice ID
         self.selected_invoice_id = invoice_id
         
-        # Clear existing detail view
-        for widget in self.detail_container.winfo_children():
-            widget.destroy()
-        
         # Get status from table
         values = self.invoice_table.item(selected_item, "values")
         status = values[3]
@@ -515,6 +1172,7 @@ class ModernDashboard:
             "invoice_number": f"INV-{invoice_id}",
             "vendor_name": vendor_name,
             "amount": amount_str,
+            "_amount_str": amount_str,
             "created_date": datetime.now() - timedelta(days=30),
             "due_date": datetime.now() + timedelta(days=15),
             "status": status,
@@ -524,160 +1182,148 @@ class ModernDashboard:
         
         # Sample items
         items = [
-            {"item_description": "Network Cable", "quantity": 4, "rate": 45.00, "amount": 180.00},
-            {"item_description": "Network Router", "quantity": 2, "rate": 220.00, "amount": 440.00}
+            # (item_description, quantity, rate, amount)
+            ("Network Cable", 4, 45.00, 180.00),
+            ("Network Router", 2, 220.00, 440.00)
         ]
         
         # Sample allocations
         allocations = [
-            {"fund_name": "Fund I", "allocation_percentage": 60, "allocated_amount": 1320.00},
-            {"fund_name": "Fund II", "allocation_percentage": 40, "allocated_amount": 880.00}
+            # (fund_name, allocation_percentage, allocated_amount)
+            ("Fund I", 60, 1320.00),
+            ("Fund II", 40, 880.00)
         ]
         
         # Create detail view
-        self.create_detail_view(invoice, allocations, items)
+        self.update_detail_view(invoice, _format_alloc_rows(allocations), _format_item_rows(items))
     
     def show_db_invoice_details(self, invoice_id):
         """Show invoice details from database"""
-        try:
-            # Query invoice details
-            query = f"""
-            SELECT 
-                i.invoice_id, 
-                i.invoice_number, 
-                i.amount,
-                i.invoice_date,
-                i.due_date,
-                i.payment_status,
-                v.vendor_name,
-                v.vendor_type,
-                v.email as contact_email
-            FROM 
-                invoices i
-            JOIN 
-                vendors v ON i.vendor_id = v.vendor_id
-            WHERE 
-                i.invoice_id = '{invoice_id}'
-            """
-            
-            result = self.db_manager.execute_query(query)
+        self._run_in_background('details',
+                                lambda: self._fetch_invoice_details(invoice_id),
+                                self._show_fetched_invoice_details)
+    
+    def _fetch_invoice_details(self, invoice_id):
+        """Run the invoice detail queries and format their table rows, off the Tk thread
+        
+        Line items and allocations are queried separately so that a database
+        without one of those tables still shows the invoice itself.
+        
+        Args:
+            invoice_id: Invoice to fetch
             
+        Returns:
+            dict: Invoice query result with added 'allocations', 'item_rows' and
+                'alloc_rows' when it has a row
+        """
+        result = self.db_manager.execute_query(_INVOICE_DETAIL_SQL, (invoice_id,))
+        if result.get('error') or not result.get('rows'):
+            return result
+        
+        items = self.db_manager.execute_query(_INVOICE_ITEMS_SQL, (invoice_id,))
+        if items.get('error'):
+            logger.warning(f"Error getting invoice items: {items['error']}")
+        
+        allocations = self.db_manager.execute_query(_INVOICE_ALLOCATIONS_SQL, (invoice_id,))
+        if allocations.get('error'):
+            logger.warning(f"Error getting invoice allocations: {allocations['error']}")
+        
+        result['allocations'] = allocations.get('rows') or []
+        result['item_rows'] = _format_item_rows(items.get('rows') or [])
+        result['alloc_rows'] = _format_alloc_rows(alloc[:3] for alloc in result['allocations'])
+        return result
+    
+    def _show_fetched_invoice_details(self, result):
+        """Build the detail view from the query run by show_db_invoice_details
+        
+        Args:
+            result: Result of the invoice detail query
+        """
+        try:
             if result.get('error') or not result.get('rows'):
                 logger.error(f"Error getting invoice details: {result.get('error', 'No results')}")
                 return
                 
             invoice_data = result['rows'][0]
             
+            # Relationship diagram rows, in the shape _INVOICE_RELATIONSHIPS_SQL returns
+            relationships = [
+                (invoice_data[0], invoice_data[1], None, invoice_data[6], alloc[3], alloc[0], alloc[1])
+                for alloc in result['allocations']
+            ] or [(invoice_data[0], invoice_data[1], None, invoice_data[6], None, None, None)]
+            
             # Convert to dict format
             invoice = {
                 "invoice_id": invoice_data[0],
                 "invoice_number": invoice_data[1],
                 "amount": invoice_data[2],
+                "_amount_str": _fmt_amount(invoice_data[2]),
                 "created_date": invoice_data[3],
                 "due_date": invoice_data[4],
                 "status": invoice_data[5],
                 "vendor_name": invoice_data[6],
                 "vendor_type": invoice_data[7],
-                "contact_email": invoice_data[8]
+                "contact_email": invoice_data[8],
+                "relationships": {'rows': relationships}
             }
             
-            # Query items
-            items_query = f"""
-            SELECT 
-                item_description, 
-                quantity, 
-                unit_price as rate, 
-                (quantity * unit_price) as amount
-            FROM 
-                invoice_items
-            WHERE 
-                invoice_id = '{invoice_id}'
-            """
-            
-            items_result = self.db_manager.execute_query(items_query)
-            items = items_result.get('rows', [])
-            
-            # Query allocations
-            allocations_query = f"""
-            SELECT 
-                f.fund_name, 
-                a.allocation_percentage,
-                (i.amount * a.allocation_percentage / 100) as allocated_amount
-            FROM 
-                expense_allocation a
-            JOIN 
-                funds f ON a.fund_id = f.fund_id
-            JOIN 
-                invoices i ON a.invoice_id = i.invoice_id
-            WHERE 
-                a.invoice_id = '{invoice_id}'
-            """
-            
-            allocations_result = self.db_manager.execute_query(allocations_query)
-            allocations = allocations_result.get('rows', [])
-            
             # Create detail view
-            self.create_detail_view(invoice, allocations, items)
+            self.update_detail_view(invoice, result['alloc_rows'], result['item_rows'])
             
         except Exception as e:
             logger.error(f"Error showing invoice details: {str(e)}")
     
-    def create_detail_view(self, invoice, allocations, items):
-        """Create the detail view for an invoice"""
+    def _build_detail_view(self, container):
+        """Create the detail view's widgets once; update_detail_view fills them in
+        
+        Args:
+            container: Frame the detail view is built in
+        """
+        widgets = self.detail_widgets
+        for name in ("title", "invoice_number", "created_date", "due_date",
+                     "vendor_name", "vendor_type", "contact_email", "amount"):
+            widgets[name] = tk.StringVar()
+        
         # Invoice header
-        ttk.Label(self.detail_container, text=f"Invoice - {invoice['invoice_number']}", 
+        ttk.Label(container, textvariable=widgets['title'], 
                  font=("Arial", 14, "bold")).pack(anchor="w", pady=(0,20))
         
         # Invoice details in two columns
-        detail_frame = ttk.Frame(self.detail_container, style="Modern.TFrame")
+        detail_frame = ttk.Frame(container, style="Modern.TFrame")
         detail_frame.pack(fill=tk.X, pady=10)
         
         # Left column - Invoice info
         left_col = ttk.Frame(detail_frame, style="Modern.TFrame")
         left_col.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        ttk.Label(left_col, text="Invoice Number:", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky="w", pady=2)
-        ttk.Label(left_col, text=invoice['invoice_number']).grid(row=0, column=1, sticky="w", pady=2)
+        ttk.Label(left_col, text="Invoice Number:", font=self._label_font).grid(row=0, column=0, sticky="w", pady=2)
+        ttk.Label(left_col, textvariable=widgets['invoice_number']).grid(row=0, column=1, sticky="w", pady=2)
         
-        # Format created date
-        created_date_str = ""
-        if isinstance(invoice.get('created_date'), (date, datetime)):
-            created_date_str = invoice['created_date'].strftime("%m/%d/%Y")
-        else:
-            created_date_str = str(invoice.get('created_date', ""))
-            
-        ttk.Label(left_col, text="Created Date:", font=("Arial", 10, "bold")).grid(row=1, column=0, sticky="w", pady=2)
-        ttk.Label(left_col, text=created_date_str).grid(row=1, column=1, sticky="w", pady=2)
+        ttk.Label(left_col, text="Created Date:", font=self._label_font).grid(row=1, column=0, sticky="w", pady=2)
+        ttk.Label(left_col, textvariable=widgets['created_date']).grid(row=1, column=1, sticky="w", pady=2)
         
-        # Format due date
-        due_date_str = ""
-        if isinstance(invoice.get('due_date'), (date, datetime)):
-            due_date_str = invoice['due_date'].strftime("%m/%d/%Y")
-        else:
-            due_date_str = str(invoice.get('due_date', ""))
-            
-        ttk.Label(left_col, text="Due Date:", font=("Arial", 10, "bold")).grid(row=2, column=0, sticky="w", pady=2)
-        ttk.Label(left_col, text=due_date_str).grid(row=2, column=1, sticky="w", pady=2)
+        ttk.Label(left_col, text="Due Date:", font=self._label_font).grid(row=2, column=0, sticky="w", pady=2)
+        ttk.Label(left_col, textvariable=widgets['due_date']).grid(row=2, column=1, sticky="w", pady=2)
         
         # Right column - Vendor info
         right_col = ttk.Frame(detail_frame, style="Modern.TFrame")
         right_col.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
         
-        ttk.Label(right_col, text="Vendor:", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky="w", pady=2)
-        ttk.Label(right_col, text=invoice.get('vendor_name', "")).grid(row=0, column=1, sticky="w", pady=2)
+        ttk.Label(right_col, text="Vendor:", font=self._label_font).grid(row=0, column=0, sticky="w", pady=2)
+        ttk.Label(right_col, textvariable=widgets['vendor_name']).grid(row=0, column=1, sticky="w", pady=2)
         
-        ttk.Label(right_col, text="Type:", font=("Arial", 10, "bold")).grid(row=1, column=0, sticky="w", pady=2)
-        ttk.Label(right_col, text=invoice.get('vendor_type', "")).grid(row=1, column=1, sticky="w", pady=2)
+        ttk.Label(right_col, text="Type:", font=self._label_font).grid(row=1, column=0, sticky="w", pady=2)
+        ttk.Label(right_col, textvariable=widgets['vendor_type']).grid(row=1, column=1, sticky="w", pady=2)
         
-        ttk.Label(right_col, text="Contact:", font=("Arial", 10, "bold")).grid(row=2, column=0, sticky="w", pady=2)
-        ttk.Label(right_col, text=invoice.get('contact_email', "")).grid(row=2, column=1, sticky="w", pady=2)
+        ttk.Label(right_col, text="Contact:", font=self._label_font).grid(row=2, column=0, sticky="w", pady=2)
+        ttk.Label(right_col, textvariable=widgets['contact_email']).grid(row=2, column=1, sticky="w", pady=2)
         
         # Items table
-        ttk.Label(self.detail_container, text="Items & Description", 
+        ttk.Label(container, text="Items & Description", 
                  font=("Arial", 11, "bold")).pack(anchor="w", pady=(20,10))
         
         # Create items table
-        items_frame = ttk.Frame(self.detail_container, style="Modern.TFrame")
+        items_frame = ttk.Frame(container, style="Modern.TFrame")
         items_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
         item_cols = ("no", "description", "qty", "rate", "amount")
@@ -689,50 +1335,23 @@ class ModernDashboard:
         items_table.heading("rate", text="Rate")
         items_table.heading("amount", text="Amount")
         
-        items_table.column("no", width=40, anchor="center")
-        items_table.column("description", width=250)
-        items_table.column("qty", width=60, anchor="e")
-        items_table.column("rate", width=80, anchor="e")
-        items_table.column("amount", width=100, anchor="e")
+        items_table.column("no", width=40, minwidth=40, stretch=tk.NO, anchor="center")
+        items_table.column("description", width=250, minwidth=250, stretch=tk.NO)
+        items_table.column("qty", width=60, minwidth=60, stretch=tk.NO, anchor="e")
+        items_table.column("rate", width=80, minwidth=80, stretch=tk.NO, anchor="e")
+        items_table.column("amount", width=100, minwidth=100, stretch=tk.NO, anchor="e")
         
-        # Add items to table
-        for i, item in enumerate(items):
-            # Handle different formats of data
-            # If item is a tuple/list
-            if isinstance(item, (list, tuple)):
-                description = item[0] if len(item) > 0 else ""
-                quantity = item[1] if len(item) > 1 else 0
-                rate = item[2] if len(item) > 2 else 0.0
-                amount = item[3] if len(item) > 3 else 0.0
-            # If item is a dict
-            else:
-                description = item.get('item_description', "")
-                quantity = item.get('quantity', 0)
-                rate = item.get('rate', 0.0)
-                amount = item.get('amount', 0.0)
-            
-            # Format item values
-            rate_str = f"${float(rate):.2f}"
-            amount_str = f"${float(amount):.2f}"
-            
-            # Add to table
-            items_table.insert("", "end", values=(
-                i+1,
-                description,
-                quantity,
-                rate_str,
-                amount_str
-            ))
-        
-        # Add scrollbar if needed
-        if len(items) > 5:
-            scrollbar = ttk.Scrollbar(items_frame, orient=tk.VERTICAL, 
-                                    command=items_table.yview)
-            items_table.configure(yscrollcommand=scrollbar.set)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Scrollbar is only packed when there are more items than rows shown
+        items_scrollbar = ttk.Scrollbar(items_frame, orient=tk.VERTICAL, 
+                                      command=items_table.yview)
+        items_table.configure(yscrollcommand=items_scrollbar.set)
+        items_table.pack(fill=tk.BOTH, expand=True)
+        
+        widgets['items_table'] = items_table
+        widgets['items_scrollbar'] = items_scrollbar
         
         # Totals
-        totals_frame = ttk.Frame(self.detail_container, style="Modern.TFrame")
+        totals_frame = ttk.Frame(container, style="Modern.TFrame")
         totals_frame.pack(fill=tk.X, pady=10)
         
         # Empty space on left
@@ -742,183 +1361,244 @@ class ModernDashboard:
         total_details = ttk.Frame(totals_frame, style="Modern.TFrame")
         total_details.pack(side=tk.RIGHT)
         
-        # Format amount string if needed
-        if isinstance(invoice.get('amount'), str) and invoice['amount'].startswith('$'):
-            amount_str = invoice['amount']
-        else:
-            try:
-                amount = float(invoice.get('amount', 0))
-                amount_str = f"${amount:.2f}"
-            except (ValueError, TypeError):
-                amount_str = "$0.00"
+        # All three totals show the invoice amount through the one shared StringVar
+        for row, (label, bold, color) in enumerate((("Sub-Total:", False, None),
+                                                     ("Total:", True, None),
+                                                     ("Balance Due:", False, "red"))):
+            ttk.Label(total_details, text=label, font=self._label_font).grid(row=row, column=0, sticky="e", pady=2)
+            value_label = ttk.Label(total_details, textvariable=widgets['amount'])
+            if bold:
+                value_label.configure(font=self._label_font)
+            if color:
+                value_label.configure(foreground=color)
+            value_label.grid(row=row, column=1, sticky="e", pady=2, padx=(10, 0))
         
-        ttk.Label(total_details, text="Sub-Total:", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky="e", pady=2)
-        ttk.Label(total_details, text=amount_str).grid(row=0, column=1, sticky="e", pady=2, padx=(10, 0))
+        # Fund allocations and the relationship diagram, shown only when there are allocations
+        alloc_section = ttk.Frame(container, style="Modern.TFrame")
         
-        ttk.Label(total_details, text="Total:", font=("Arial", 10, "bold")).grid(row=1, column=0, sticky="e", pady=2)
-        ttk.Label(total_details, text=amount_str, font=("Arial", 10, "bold")).grid(row=1, column=1, sticky="e", pady=2, padx=(10, 0))
+        ttk.Label(alloc_section, text="Fund Allocations", 
+                font=("Arial", 11, "bold")).pack(anchor="w", pady=(20,10))
         
-        ttk.Label(total_details, text="Balance Due:", font=("Arial", 10, "bold")).grid(row=2, column=0, sticky="e", pady=2)
-        ttk.Label(total_details, text=amount_str, foreground="red").grid(row=2, column=1, sticky="e", pady=2, padx=(10, 0))
+        alloc_frame = ttk.Frame(alloc_section, style="Modern.TFrame")
+        alloc_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
-        # Fund allocations
-        if allocations:
-            ttk.Label(self.detail_container, text="Fund Allocations", 
-                    font=("Arial", 11, "bold")).pack(anchor="w", pady=(20,10))
-            
-            alloc_frame = ttk.Frame(self.detail_container, style="Modern.TFrame")
-            alloc_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-            
-            alloc_cols = ("fund", "percentage", "amount")
-            alloc_table = ttk.Treeview(alloc_frame, columns=alloc_cols, show="headings", height=3)
-            
-            alloc_table.heading("fund", text="Fund")
-            alloc_table.heading("percentage", text="Percentage")
-            alloc_table.heading("amount", text="Amount")
-            
-            alloc_table.column("fund", width=200)
-            alloc_table.column("percentage", width=100, anchor="e")
-            alloc_table.column("amount", width=100, anchor="e")
-            
-            for alloc in allocations:
-                # Handle different formats of data
-                if isinstance(alloc, (list, tuple)):
-                    fund_name = alloc[0] if len(alloc) > 0 else ""
-                    percentage = alloc[1] if len(alloc) > 1 else 0
-                    alloc_amount = alloc[2] if len(alloc) > 2 else 0.0
-                else:
-                    fund_name = alloc.get('fund_name', "")
-                    percentage = alloc.get('allocation_percentage', 0)
-                    alloc_amount = alloc.get('allocated_amount', 0.0)
-                
-                # Format values
-                percentage_str = f"{float(percentage):.1f}%"
-                alloc_amount_str = f"${float(alloc_amount):.2f}"
-                
-                alloc_table.insert("", "end", values=(
-                    fund_name,
-                    percentage_str,
-                    alloc_amount_str
-                ))
-            
-            alloc_table.pack(fill=tk.BOTH, expand=True)
-            
-            # Add relationship visualization
-            self.create_relationship_diagram(self.detail_container, invoice.get('invoice_id', self.selected_invoice_id))
-    
-    def create_relationship_diagram(self, parent, invoice_id):
-        """Create a visualization of relationships for this invoice"""
-        # Create frame for diagram
-        diagram_frame = ttk.LabelFrame(parent, text="Relationship Diagram", style="Modern.TFrame")
+        alloc_cols = ("fund", "percentage", "amount")
+        alloc_table = ttk.Treeview(alloc_frame, columns=alloc_cols, show="headings", height=3)
+        
+        alloc_table.heading("fund", text="Fund")
+        alloc_table.heading("percentage", text="Percentage")
+        alloc_table.heading("amount", text="Amount")
+        
+        alloc_table.column("fund", width=200)
+        alloc_table.column("percentage", width=100, anchor="e")
+        alloc_table.column("amount", width=100, anchor="e")
+        
+        alloc_table.pack(fill=tk.BOTH, expand=True)
+        
+        # Relationship visualization
+        diagram_frame = ttk.LabelFrame(alloc_section, text="Relationship Diagram", style="Modern.TFrame")
         diagram_frame.pack(fill=tk.BOTH, expand=True, pady=(20, 10))
         
-        # Create canvas for visualization
         canvas = tk.Canvas(diagram_frame, width=500, height=200, bg="white")
         canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # If using sample data
-        if not self.db_manager or not hasattr(self.db_manager, 'execute_query'):
-            # Draw invoice node at center
-            canvas.create_oval(225, 75, 275, 125, fill="#3498db", outline="")
-            canvas.create_text(250, 100, text="Invoice", fill="white", font=("Arial", 10, "bold"))
-            
-            # Draw vendor relationship
-            canvas.create_line(225, 100, 125, 50, fill="#2c3e50", width=2)
-            canvas.create_rectangle(75, 25, 175, 75, fill="#e74c3c", outline="")
-            canvas.create_text(125, 50, text="Vendor\nNexage Digital", 
-                            fill="white", font=("Arial", 9), justify="center")
-            
-            # Draw fund relationships
-            y_pos1 = 150
-            canvas.create_line(250, 125, 150, y_pos1, fill="#2c3e50", width=2, dash=(4, 2))
-            canvas.create_text(200, 137, text="60%", fill="#2c3e50", font=("Arial", 8))
-            canvas.create_rectangle(100, y_pos1 - 25, 200, y_pos1 + 25, fill="#27ae60", outline="")
-            canvas.create_text(150, y_pos1, text="Fund\nFund I", fill="white", font=("Arial", 9), justify="center")
-            
-            y_pos2 = 150
-            canvas.create_line(250, 125, 350, y_pos2, fill="#2c3e50", width=2, dash=(4, 2))
-            canvas.create_text(300, 137, text="40%", fill="#2c3e50", font=("Arial", 8))
-            canvas.create_rectangle(300, y_pos2 - 25, 400, y_pos2 + 25, fill="#27ae60", outline="")
-            canvas.create_text(350, y_pos2, text="Fund\nFund II", fill="white", font=("Arial", 9), justify="center")
-            
-            return canvas
+        widgets['alloc_section'] = alloc_section
+        widgets['alloc_table'] = alloc_table
+        widgets['diagram_canvas'] = canvas
+    
+    def update_detail_view(self, invoice, alloc_rows, item_rows):
+        """Fill the prebuilt detail view with an invoice
+        
+        Args:
+            invoice: Dictionary of invoice and vendor fields
+            alloc_rows: Allocations table rows from _format_alloc_rows
+            item_rows: Items table rows from _format_item_rows
+        """
+        widgets = self.detail_widgets
+        
+        # Swap the placeholder for the detail view on the first selection
+        if not self.detail_view.winfo_manager():
+            self.detail_placeholder.pack_forget()
+            self.detail_view.pack(fill=tk.BOTH, expand=True)
+        
+        widgets['title'].set(f"Invoice - {invoice['invoice_number']}")
+        widgets['invoice_number'].set(invoice['invoice_number'])
+        widgets['created_date'].set(_format_date(invoice.get('created_date', "")))
+        widgets['due_date'].set(_format_date(invoice.get('due_date', "")))
+        widgets['vendor_name'].set(invoice.get('vendor_name', ""))
+        widgets['vendor_type'].set(invoice.get('vendor_type', ""))
+        widgets['contact_email'].set(invoice.get('contact_email', ""))
+        
+        # Add items to table
+        items_table = widgets['items_table']
+        _replace_rows(items_table, item_rows)
+        
+        # Show the scrollbar if needed
+        items_scrollbar = widgets['items_scrollbar']
+        if len(item_rows) > 5:
+            if not items_scrollbar.winfo_manager():
+                items_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, before=items_table)
+        else:
+            items_scrollbar.pack_forget()
+        
+        # Loaders format the amount once; the three totals labels share this variable
+        widgets['amount'].set(invoice.get('_amount_str') or _fmt_amount(invoice.get('amount')))
+        
+        # Fund allocations
+        alloc_section = widgets['alloc_section']
+        if not alloc_rows:
+            alloc_section.pack_forget()
+            return
+        
+        _replace_rows(widgets['alloc_table'], alloc_rows)
+        
+        if not alloc_section.winfo_manager():
+            alloc_section.pack(fill=tk.BOTH, expand=True)
+        
+        # Add relationship visualization
+        self.draw_relationship_diagram(widgets['diagram_canvas'], invoice.get('invoice_id', self.selected_invoice_id),
+                                       invoice.get('relationships'))
+    
+    def draw_relationship_diagram(self, canvas, invoice_id, result=None):
+        """Draw a visualization of relationships for this invoice
+        
+        The shapes are drawn into one PIL image which is then shown as a single
+        canvas item, rather than as a canvas item per line, box and label.
+        
+        Args:
+            canvas: Canvas to draw on; anything already on it is cleared
+            invoice_id: Invoice to draw
+            result: Relationship query result already fetched off the Tk thread; when
+                omitted it is fetched on the worker pool and the diagram drawn once it arrives
+        """
+        canvas.delete("all")
+        
+        # Whatever is drawn now replaces a diagram whose fallback query is still running
+        self._request_tokens['diagram'] = self._request_tokens.get('diagram', 0) + 1
         
-        # Query relationships from database
         try:
-            query = f"""
-            SELECT 
-                i.invoice_id, i.invoice_number, 
-                v.vendor_id, v.vendor_name,
-                f.fund_id, f.fund_name,
-                a.allocation_percentage
-            FROM 
-                invoices i
-            JOIN 
-                vendors v ON i.vendor_id = v.vendor_id
-            LEFT JOIN 
-                expense_allocation a ON i.invoice_id = a.invoice_id
-            LEFT JOIN 
-                funds f ON a.fund_id = f.fund_id
-            WHERE 
-                i.invoice_id = '{invoice_id}'
-            """
+            # If using sample data
+            if not self.db_manager or not hasattr(self.db_manager, 'execute_query'):
+                image, draw = _new_diagram_image()
+                
+                # Draw invoice node at center
+                draw.ellipse((225, 75, 275, 125), fill=_DIAGRAM_INVOICE_COLOR)
+                _draw_centered_text(draw, 250, 100, "Invoice", _diagram_font(canvas, 10, True), "white")
+                
+                # Draw vendor relationship
+                draw.line((225, 100, 125, 50), fill=_DIAGRAM_LINK_COLOR, width=2)
+                draw.rectangle((75, 25, 175, 75), fill=_DIAGRAM_VENDOR_COLOR)
+                _draw_centered_text(draw, 125, 50, "Vendor\nNexage Digital", _diagram_font(canvas, 9), "white")
+                
+                # Draw fund relationships
+                y_pos1 = 150
+                _draw_dashed_line(draw, (250, 125), (150, y_pos1), fill=_DIAGRAM_LINK_COLOR, width=2)
+                _draw_centered_text(draw, 200, 137, "60%", _diagram_font(canvas, 8), _DIAGRAM_LINK_COLOR)
+                draw.rectangle((100, y_pos1 - 25, 200, y_pos1 + 25), fill=_DIAGRAM_FUND_COLOR)
+                _draw_centered_text(draw, 150, y_pos1, "Fund\nFund I", _diagram_font(canvas, 9), "white")
+                
+                y_pos2 = 150
+                _draw_dashed_line(draw, (250, 125), (350, y_pos2), fill=_DIAGRAM_LINK_COLOR, width=2)
+                _draw_centered_text(draw, 300, 137, "40%", _diagram_font(canvas, 8), _DIAGRAM_LINK_COLOR)
+                draw.rectangle((300, y_pos2 - 25, 400, y_pos2 + 25), fill=_DIAGRAM_FUND_COLOR)
+                _draw_centered_text(draw, 350, y_pos2, "Fund\nFund II", _diagram_font(canvas, 9), "white")
+                
+                _show_diagram_image(canvas, image)
+                return canvas
             
-            result = self.db_manager.execute_query(query)
+            # Reuse the diagram drawn the last time this invoice was shown, as long as it
+            # is recent and was drawn from the same rows as any freshly fetched result
+            rows_key = tuple(map(tuple, result['rows'])) if result and result.get('rows') else None
+            cached = self._diagram_cache.get(invoice_id)
+            if (cached and time.monotonic() - cached[0] < _QUERY_CACHE_TTL
+                    and (result is None or cached[1] == rows_key)):
+                self._diagram_cache.move_to_end(invoice_id)
+                _show_diagram_photo(canvas, cached[2])
+                return canvas
+            
+            # Query relationships from database
+            if result is None:
+                canvas.create_text(250, 100, text="Loading fund allocations...", 
+                                 font=self._message_font, fill=_DIAGRAM_MUTED_COLOR)
+                # Constant SQL text with a bound id, so repeat selections hit the cache
+                self._run_in_background('diagram',
+                                        lambda: self._cached_query(('relationships', invoice_id),
+                                                                   _INVOICE_RELATIONSHIPS_SQL, (invoice_id,)),
+                                        lambda fetched: self.draw_relationship_diagram(canvas, invoice_id, fetched))
+                return canvas
             
             if result.get('error') or not result.get('rows'):
                 # Draw empty diagram with message
                 canvas.create_text(250, 100, text="No relationship data available", 
-                                 font=("Arial", 10), fill="#666666")
+                                 font=self._message_font, fill=_DIAGRAM_MUTED_COLOR)
                 return canvas
                 
             relationships = result['rows']
+            image, draw = _new_diagram_image()
             
             # Draw invoice node at center
-            canvas.create_oval(225, 75, 275, 125, fill="#3498db", outline="")
-            canvas.create_text(250, 100, text="Invoice", fill="white", font=("Arial", 10, "bold"))
+            draw.ellipse((225, 75, 275, 125), fill=_DIAGRAM_INVOICE_COLOR)
+            _draw_centered_text(draw, 250, 100, "Invoice", _diagram_font(canvas, 10, True), "white")
             
             # Draw vendor relationship
             if relationships:
                 vendor_name = relationships[0][3]  # vendor_name
-                canvas.create_line(225, 100, 125, 50, fill="#2c3e50", width=2)
-                canvas.create_rectangle(75, 25, 175, 75, fill="#e74c3c", outline="")
-                canvas.create_text(125, 50, text=f"Vendor\n{vendor_name}", 
-                                 fill="white", font=("Arial", 9), justify="center")
+                draw.line((225, 100, 125, 50), fill=_DIAGRAM_LINK_COLOR, width=2)
+                draw.rectangle((75, 25, 175, 75), fill=_DIAGRAM_VENDOR_COLOR)
+                _draw_centered_text(draw, 125, 50, f"Vendor\n{vendor_name}", _diagram_font(canvas, 9), "white")
             
             # Draw fund relationships
-            for i, rel in enumerate(relationships):
-                if rel[4]:  # If fund_id exists
+            funds = [rel for rel in relationships if rel[4]]  # Rows with a fund_id
+            if funds:
+                import numpy as np  # Only needed for invoices with allocations
+                
+                # Lay out every fund node at once, alternating left and right of the invoice
+                i = np.arange(len(funds))
+                offset = i * 50
+                x_pos = np.where(i % 2 == 0, 150 - offset, 350 + offset)
+                y_pos = 150 + (i // 2) * 50
+                
+                # Skip nodes whose box lies wholly outside the image; the
+                # allocations table above still lists every fund
+                width, height = _DIAGRAM_SIZE
+                visible = (x_pos + 50 >= 0) & (x_pos - 50 <= width) & (y_pos + 25 >= 0) & (y_pos - 25 <= height)
+                hidden = len(funds) - int(visible.sum())
+                funds = [rel for rel, shown in zip(funds, visible.tolist()) if shown]
+                x_pos, y_pos = x_pos[visible], y_pos[visible]
+                mid_x, mid_y = (250 + x_pos) // 2, (125 + y_pos) // 2
+                
+                for rel, x, y, mx, my in zip(funds, x_pos.tolist(), y_pos.tolist(),
+                                             mid_x.tolist(), mid_y.tolist()):
                     fund_name = rel[5]  # fund_name
                     percentage = rel[6]  # allocation_percentage
                     
-                    # Calculate position based on number of funds
-                    offset = i * 50
-                    if i % 2 == 0:
-                        x_pos = 150 - offset
-                    else:
-                        x_pos = 350 + offset
-                    
-                    y_pos = 150 + (i // 2) * 50
-                    
                     # Draw line from invoice to fund
-                    canvas.create_line(250, 125, x_pos, y_pos, fill="#2c3e50", width=2, dash=(4, 2))
+                    _draw_dashed_line(draw, (250, 125), (x, y), fill=_DIAGRAM_LINK_COLOR, width=2)
                     
                     # Add allocation percentage as text on the line
-                    mid_x, mid_y = (250 + x_pos) // 2, (125 + y_pos) // 2
-                    canvas.create_text(mid_x, mid_y, text=f"{percentage}%", 
-                                     fill="#2c3e50", font=("Arial", 8))
+                    _draw_centered_text(draw, mx, my, f"{percentage}%", _diagram_font(canvas, 8), _DIAGRAM_LINK_COLOR)
                     
                     # Draw fund node
-                    canvas.create_rectangle(x_pos - 50, y_pos - 25, x_pos + 50, y_pos + 25, 
-                                         fill="#27ae60", outline="")
-                    canvas.create_text(x_pos, y_pos, text=f"Fund\n{fund_name}", 
-                                     fill="white", font=("Arial", 9), justify="center")
+                    draw.rectangle((x - 50, y - 25, x + 50, y + 25), fill=_DIAGRAM_FUND_COLOR)
+                    _draw_centered_text(draw, x, y, f"Fund\n{fund_name}", _diagram_font(canvas, 9), "white")
+                
+                if hidden:
+                    # Note the culled funds in the bottom right corner
+                    more = f"+{hidden} more"
+                    font = _diagram_font(canvas, 9)
+                    _, _, right, bottom = draw.textbbox((0, 0), more, font=font)
+                    draw.text((width - 10 - right, height - 5 - bottom), more, font=font, fill=_DIAGRAM_MUTED_COLOR)
             
+            self._diagram_cache[invoice_id] = (time.monotonic(), rows_key, _show_diagram_image(canvas, image))
+            self._diagram_cache.move_to_end(invoice_id)
+            if len(self._diagram_cache) > _DIAGRAM_CACHE_MAX:
+                self._diagram_cache.popitem(last=False)
             return canvas
             
         except Exception as e:
             logger.error(f"Error creating relationship diagram: {str(e)}")
             # Draw empty diagram with message
+            canvas.delete("all")
             canvas.create_text(250, 100, text=f"Error creating diagram: {str(e)}", 
-                             font=("Arial", 10), fill="#666666")
+                             font=self._message_font, fill=_DIAGRAM_MUTED_COLOR)
             return canvas
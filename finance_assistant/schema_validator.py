@@ -15,6 +15,9 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# Leading type name of a column type definition, e.g. "numeric" in "NUMERIC(10,2)"
+_BASE_TYPE_RE = re.compile(r'^([a-z_]+)(\s*\(|$|\s)')
+
 class SchemaValidator:
     """Validates database schema and ensures required columns exist"""
     
@@ -81,12 +84,47 @@ class SchemaValidator:
         
         return schemas
     
-    def validate_table(self, table_name: str, auto_fix: bool = False) -> Dict[str, Any]:
+    def snapshot_tables(self, tables: List[str]) -> Dict[str, Dict[str, tuple]]:
+        """Fetch column metadata for several tables in a single query
+        
+        Args:
+            tables: The names of the tables to inspect
+            
+        Returns:
+            Dict: Mapping of lowercase table name to {column_name: (data_type, udt_name, is_nullable)}.
+                  Tables that don't exist are absent from the mapping.
+        """
+        db = self.db_manager.db
+        if not db.connected:
+            logger.error("Not connected to database")
+            return {}
+        
+        snapshot_query = """
+            SELECT table_name, column_name, data_type, udt_name, is_nullable
+            FROM information_schema.columns
+            WHERE table_name = ANY(%s)
+            ORDER BY table_name, ordinal_position
+        """
+        result = db.execute_query(snapshot_query, [list(tables)])
+        
+        if 'error' in result and result['error']:
+            logger.error(f"Error getting column snapshot: {result['error']}")
+            return {}
+        
+        snapshot = {}
+        for table, col_name, data_type, udt_name, is_nullable in result['rows']:
+            snapshot.setdefault(table.lower(), {})[col_name] = (data_type, udt_name, is_nullable == 'YES')
+        
+        return snapshot
+    
+    def validate_table(self, table_name: str, auto_fix: bool = False,
+                       snapshot: Optional[Dict[str, Dict[str, tuple]]] = None) -> Dict[str, Any]:
         """Validate that a table has the required columns
         
         Args:
             table_name: The name of the table to validate
             auto_fix: Whether to automatically add missing columns
+            snapshot: Optional pre-fetched result of snapshot_tables() to avoid a metadata query
             
         Returns:
             Dict: A dictionary with validation results
@@ -104,21 +142,27 @@ class SchemaValidator:
             logger.error("Not connected to database")
             return {'valid': False, 'table': table_name, 'error': 'Not connected to database'}
         
-        # Get columns with exact case preserved
-        columns_query = """
-            SELECT column_name, data_type, character_maximum_length
-            FROM information_schema.columns 
-            WHERE table_name = %s
-        """
-        result = db.execute_query(columns_query, [table_name])
-        
-        if 'error' in result and result['error']:
-            logger.error(f"Error getting columns for table '{table_name}': {result['error']}")
-            return {'valid': False, 'table': table_name, 'error': result['error']}
+        # Use the pre-fetched snapshot when it covers this table
+        if snapshot is not None and table_name.lower() in snapshot:
+            rows = [(col_name, meta[0]) for col_name, meta in snapshot[table_name.lower()].items()]
+        else:
+            # Get columns with exact case preserved
+            columns_query = """
+                SELECT column_name, data_type, character_maximum_length
+                FROM information_schema.columns 
+                WHERE table_name = %s
+            """
+            result = db.execute_query(columns_query, [table_name])
+            
+            if 'error' in result and result['error']:
+                logger.error(f"Error getting columns for table '{table_name}': {result['error']}")
+                return {'valid': False, 'table': table_name, 'error': result['error']}
+            
+            rows = result['rows']
         
         # Create case-insensitive mapping of actual columns
         actual_columns = {}
-        for row in result['rows']:
+        for row in rows:
             col_name = row[0]  # Original case preserved
             col_type = row[1]
             
@@ -150,8 +194,14 @@ class SchemaValidator:
             success = self._add_missing_columns_safely(table_name, missing_columns, actual_columns)
             if success:
                 self.fixed_tables.add(table_name.lower())
+                if snapshot is not None:
+                    # Every delta was applied; no need for another metadata round trip
+                    return {'valid': True, 'table': table_name, 'missing_columns': [],
+                            'added_columns': missing_columns}
                 # Validate again to confirm the fix worked, but without auto-fix to prevent loops
-                return self.validate_table(table_name, auto_fix=False)
+                result = self.validate_table(table_name, auto_fix=False)
+                result['added_columns'] = missing_columns
+                return result
         
         # Return validation result
         logger.warning(f"Table '{table_name}' is missing required columns: {[col['name'] for col in missing_columns]}")
@@ -172,6 +222,16 @@ class SchemaValidator:
         db = self.db_manager.db
         success = True
         
+        # Add every missing column in one ALTER TABLE statement (one round trip, one commit)
+        to_add = [column for column in missing_columns if column['name'].lower() not in actual_columns]
+        if len(to_add) > 1:
+            clauses = ", ".join(f"ADD COLUMN IF NOT EXISTS {column['name']} {column['type']}" for column in to_add)
+            result = db.execute_update(f"ALTER TABLE {table_name} {clauses}")
+            if not ('error' in result and result['error']):
+                logger.info(f"Successfully added columns {[column['name'] for column in to_add]} to table '{table_name}'")
+                return True
+            logger.warning(f"Combined ALTER TABLE failed, adding columns one at a time: {result['error']}")
+        
         for column in missing_columns:
             col_name = column['name']
             col_type = column['type']
@@ -398,7 +458,7 @@ class SchemaValidator:
             str: Base type (e.g., "numeric")
         """
         # Split on first parenthesis or space
-        match = re.match(r'^([a-z_]+)(\s*\(|$|\s)', type_def.lower())
+        match = _BASE_TYPE_RE.match(type_def.lower())
         if match:
             return match.group(1)
         return type_def.lower()
@@ -1067,11 +1127,12 @@ class SchemaValidator:
         
         return False
 
-    def validate_and_fix_column_types(self, table_name):
+    def validate_and_fix_column_types(self, table_name, snapshot=None):
         """Check and automatically fix column data types in a table
         
         Args:
             table_name: The name of the table to check
+            snapshot: Optional pre-fetched result of snapshot_tables() to avoid a metadata query
             
         Returns:
             dict: Results of the validation and fixing process
@@ -1093,21 +1154,26 @@ class SchemaValidator:
         for col_name, col_type in expected_schema['optional_columns'].items():
             expected_types[col_name.lower()] = col_type.lower()
         
-        # Get actual column information from database
-        column_query = """
-            SELECT column_name, data_type, udt_name
-            FROM information_schema.columns
-            WHERE table_name = %s
-        """
-        
-        result = self.db_manager.db.execute_query(column_query, (table_name,))
-        if 'error' in result and result['error']:
-            logger.error(f"Error getting column info: {result['error']}")
-            return {'valid': False, 'fixed': False, 'error': result['error']}
+        if snapshot is not None and table_name.lower() in snapshot:
+            rows = [(col_name, meta[0], meta[1]) for col_name, meta in snapshot[table_name.lower()].items()]
+        else:
+            # Get actual column information from database
+            column_query = """
+                SELECT column_name, data_type, udt_name
+                FROM information_schema.columns
+                WHERE table_name = %s
+            """
+            
+            result = self.db_manager.db.execute_query(column_query, (table_name,))
+            if 'error' in result and result['error']:
+                logger.error(f"Error getting column info: {result['error']}")
+                return {'valid': False, 'fixed': False, 'error': result['error']}
+            
+            rows = result['rows']
         
         # Find columns with incorrect types
         type_mismatches = []
-        for row in result['rows']:
+        for row in rows:
             col_name = row[0].lower()
             actual_type = row[1].lower()
             udt_name = row[2].lower()  # Underlying type name
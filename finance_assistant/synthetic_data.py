@@ -48,7 +48,8 @@ class SyntheticDataGenerator:
         try:
             # Only works on Windows with MS Access installed
             conn_str = f"DRIVER={{Microsoft Access Driver (*.mdb, *.accdb)}};DBQ={self.output_path};"
-            self.conn = pyodbc.connect(conn_str, autocommit=True)
+            # Each generator commits its rows once instead of the driver committing per INSERT
+            self.conn = pyodbc.connect(conn_str, autocommit=False)
             self.cursor = self.conn.cursor()
             logger.info(f"Connected to Access database at {self.output_path}")
             return True
@@ -150,6 +151,7 @@ class SyntheticDataGenerator:
                     [Status] TEXT
                 )
             ''')
+            self.conn.commit()
             
             logger.info("Created database schema")
             return True
@@ -160,6 +162,7 @@ class SyntheticDataGenerator:
     def generate_vendors(self, count=30):
         """Generate synthetic vendor data"""
         try:
+            rows = []
             for i in range(1, count + 1):
                 vendor_name = random.choice(self.company_names) if random.random() < 0.8 else f"Vendor {i}"
                 vendor_type = random.choice(self.vendor_types)
@@ -167,12 +170,7 @@ class SyntheticDataGenerator:
                 is_1099 = random.choice([0, 1])
                 status = "Active" if random.random() < 0.8 else "Inactive"
                 
-                self.cursor.execute('''
-                    INSERT INTO [vendor list] (
-                        [Name], [Vendor Type], [Contact Email], [Contact Phone],
-                        [Address], [Payment Terms], [Is 1099], [Status], [Description]
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                rows.append((
                     vendor_name,
                     vendor_type,
                     f"contact@{vendor_name.lower().replace(' ', '')}.com",
@@ -184,25 +182,32 @@ class SyntheticDataGenerator:
                     f"Description for {vendor_name}"
                 ))
             
+            # One prepared statement and one commit for the whole set
+            self.cursor.executemany('''
+                INSERT INTO [vendor list] (
+                    [Name], [Vendor Type], [Contact Email], [Contact Phone],
+                    [Address], [Payment Terms], [Is 1099], [Status], [Description]
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            self.conn.commit()
+            
             logger.info(f"Generated {count} vendor records")
             return True
         except Exception as e:
             logger.error(f"Error generating vendors: {str(e)}")
+            self.conn.rollback()
             return False
     
     def generate_funds(self, count=5):
         """Generate synthetic fund data"""
         try:
+            rows = []
             for i in range(1, count + 1):
                 fund_name = self.fund_names[i-1] if i <= len(self.fund_names) else f"Fund {i}"
                 start_date = datetime.now() - timedelta(days=random.randint(365, 730))
                 end_date = start_date + timedelta(days=random.randint(365, 730))
                 
-                self.cursor.execute('''
-                    INSERT INTO Funds (
-                        [Name], [Description], [Balance], [Start Date], [End Date], [Status]
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
+                rows.append((
                     fund_name,
                     f"Description for {fund_name}",
                     random.uniform(10000, 1000000),
@@ -211,10 +216,19 @@ class SyntheticDataGenerator:
                     "Active" if random.random() < 0.8 else "Closed"
                 ))
             
+            # One prepared statement and one commit for the whole set
+            self.cursor.executemany('''
+                INSERT INTO Funds (
+                    [Name], [Description], [Balance], [Start Date], [End Date], [Status]
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            ''', rows)
+            self.conn.commit()
+            
             logger.info(f"Generated {count} fund records")
             return True
         except Exception as e:
             logger.error(f"Error generating funds: {str(e)}")
+            self.conn.rollback()
             return False
     
     def generate_invoices(self, count=100):
@@ -239,6 +253,7 @@ class SyntheticDataGenerator:
                 funds = self.fund_names
             
             # Generate invoices
+            rows = []
             for i in range(1, count + 1):
                 # Select a random vendor
                 vendor = random.choice(vendors)
@@ -264,13 +279,7 @@ class SyntheticDataGenerator:
                 # Sometimes include NULL values to mimic real data
                 fund = random.choice(funds) if random.random() < 0.9 else None
                 
-                self.cursor.execute('''
-                    INSERT INTO Invoices (
-                        [Vendor ID], [Vendor], [Fund Paid By], [Invoice#], [Invoice Date],
-                        [Due Date], [total_amount], [Status], [Payment Status],
-                        [Date of Payment], [Check], [Amount], [Days Overdue], [Notes]
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                rows.append((
                     vendor_id,
                     vendor_name,
                     fund,
@@ -287,10 +296,21 @@ class SyntheticDataGenerator:
                     f"Notes for invoice {i}" if random.random() < 0.3 else None
                 ))
             
+            # One prepared statement and one commit for the whole set
+            self.cursor.executemany('''
+                INSERT INTO Invoices (
+                    [Vendor ID], [Vendor], [Fund Paid By], [Invoice#], [Invoice Date],
+                    [Due Date], [total_amount], [Status], [Payment Status],
+                    [Date of Payment], [Check], [Amount], [Days Overdue], [Notes]
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            self.conn.commit()
+            
             logger.info(f"Generated {count} invoice records")
             return True
         except Exception as e:
             logger.error(f"Error generating invoices: {str(e)}")
+            self.conn.rollback()
             return False
     
     def generate_expenses(self, count=150):
@@ -315,6 +335,7 @@ class SyntheticDataGenerator:
                 funds = self.fund_names
             
             # Generate expenses
+            rows = []
             for i in range(1, count + 1):
                 # Select a random vendor
                 vendor = random.choice(vendors) if random.random() < 0.8 else (None, None)
@@ -331,12 +352,7 @@ class SyntheticDataGenerator:
                 # Fund allocation
                 fund = random.choice(funds) if random.random() < 0.9 else None
                 
-                self.cursor.execute('''
-                    INSERT INTO Expenses (
-                        [Date], [Category], [Amount], [Description], [Vendor ID],
-                        [Vendor], [Fund], [Status], [Notes]
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                rows.append((
                     expense_date,
                     category,
                     amount,
@@ -348,10 +364,20 @@ class SyntheticDataGenerator:
                     f"Notes for expense {i}" if random.random() < 0.3 else None
                 ))
             
+            # One prepared statement and one commit for the whole set
+            self.cursor.executemany('''
+                INSERT INTO Expenses (
+                    [Date], [Category], [Amount], [Description], [Vendor ID],
+                    [Vendor], [Fund], [Status], [Notes]
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            self.conn.commit()
+            
             logger.info(f"Generated {count} expense records")
             return True
         except Exception as e:
             logger.error(f"Error generating expenses: {str(e)}")
+            self.conn.rollback()
             return False
     
     def generate_revenue(self, count=80):
@@ -370,6 +396,7 @@ class SyntheticDataGenerator:
             revenue_sources = ["Sales", "Services", "Grants", "Investments", "Donations", "Fees", "Interest"]
             
             # Generate revenue
+            rows = []
             for i in range(1, count + 1):
                 # Random date within last year
                 revenue_date = datetime.now() - timedelta(days=random.randint(0, 365))
@@ -381,11 +408,7 @@ class SyntheticDataGenerator:
                 # Fund allocation
                 fund = random.choice(funds) if random.random() < 0.9 else None
                 
-                self.cursor.execute('''
-                    INSERT INTO Revenue (
-                        [Date], [Source], [Amount], [Description], [Fund], [Status], [Notes]
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                rows.append((
                     revenue_date,
                     source,
                     amount,
@@ -395,10 +418,19 @@ class SyntheticDataGenerator:
                     f"Notes for revenue {i}" if random.random() < 0.3 else None
                 ))
             
+            # One prepared statement and one commit for the whole set
+            self.cursor.executemany('''
+                INSERT INTO Revenue (
+                    [Date], [Source], [Amount], [Description], [Fund], [Status], [Notes]
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            self.conn.commit()
+            
             logger.info(f"Generated {count} revenue records")
             return True
         except Exception as e:
             logger.error(f"Error generating revenue: {str(e)}")
+            self.conn.rollback()
             return False
     
     def generate_all(self):
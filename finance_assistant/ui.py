@@ -481,7 +481,7 @@ class UIManager:
         self.chat_area.tag_configure("thinking", foreground="#999999", font=("Arial", 11, "italic"))
         
         # Update UI immediately
-        self.app.root.update()
+        self.app.root.update_idletasks()
 
     def remove_thinking(self):
         """Remove the thinking indicator"""
@@ -495,7 +495,7 @@ class UIManager:
             self.chat_area.yview(tk.END)
             
             # Update UI immediately
-            self.app.root.update()
+            self.app.root.update_idletasks()
 
     def clear_chat(self):
         """Clear the chat area"""
@@ -6,6 +6,7 @@ A simplified Python application that connects to a PostgreSQL database
 and displays an invoice dashboard with real-time updates.
 """
 
+import csv
 import logging
 import os
 import sys
@@ -954,18 +955,13 @@ Following these conventions will make your database more maintainable and less p
                 if not filename:
                     return
                     
-                # Create a DataFrame from the table data
-                data = []
-                for item in table_tree.get_children():
-                    values = table_tree.item(item)["values"]
-                    data.append({
-                        "Table Name": values[0],
-                        "Row Count": values[1],
-                        "Naming Status": values[2]
-                    })
-                    
-                df = pd.DataFrame(data)
-                df.to_csv(filename, index=False)
+                # Write the table data straight out with the csv module;
+                # the result set is tiny, so building a DataFrame is wasted work
+                with open(filename, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(["Table Name", "Row Count", "Naming Status"])
+                    writer.writerows(table_tree.item(item)["values"][:3]
+                                     for item in table_tree.get_children())
                 
                 messagebox.showinfo("Success", f"Schema exported to {filename}")
                 
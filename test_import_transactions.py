@@ -0,0 +1,104 @@
+"""
+Test script for CSV imports on a connection left in autocommit mode.
+
+PostgresDatabase.commit_transaction and rollback_transaction switch the shared
+connection back to autocommit, as the startup schema fix-up does. The batched
+import paths rely on savepoints, so this script runs them right after a
+commit_transaction() call and checks that every good row is loaded.
+
+Connection settings are read from DB_HOST, DB_PORT, DB_NAME, DB_USER and
+DB_PASSWORD (or a .env file). The script creates and drops its own scratch table.
+"""
+
+import csv
+import os
+import sys
+import tempfile
+
+from dotenv import load_dotenv
+
+from finance_assistant.database.manager import DatabaseManager
+
+TABLE_NAME = "import_transaction_test"
+COLUMN_MAPPING = {'id': 'id', 'note': 'note', 'amount': 'amount'}
+GOOD_ROWS = 2500
+
+print("Testing CSV imports after commit_transaction()")
+print("==============================================")
+
+load_dotenv()
+manager = DatabaseManager()
+if not manager.db.connect(os.getenv('DB_NAME', 'postgres'), os.getenv('DB_HOST', 'localhost'),
+                          int(os.getenv('DB_PORT', '5432')), os.getenv('DB_USER', 'postgres'),
+                          os.getenv('DB_PASSWORD') or None):
+    print(f"✗ Could not connect to the database: {manager.db.error}")
+    sys.exit(1)
+manager.connected = True
+
+# One CSV with a duplicate key at the end, so each path has to isolate a bad row
+csv_file = os.path.join(tempfile.mkdtemp(), "import_transaction_test.csv")
+with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+    writer = csv.writer(f)
+    writer.writerow(['id', 'note', 'amount'])
+    for i in range(GOOD_ROWS):
+        writer.writerow([i, f"note {i}", i * 1.5])
+    writer.writerow([5, 'duplicate', 1])
+
+failures = 0
+
+
+def check(name, imported):
+    """Compare the rows in the scratch table with the rows the import reported"""
+    global failures
+    loaded = manager.db.execute_query(f"SELECT COUNT(*) FROM {TABLE_NAME}")['rows'][0][0]
+    if imported == GOOD_ROWS and loaded == GOOD_ROWS and manager.db.connection.autocommit:
+        print(f"✓ {name}: {loaded} rows imported, autocommit restored")
+    else:
+        print(f"✗ {name}: reported {imported}, table has {loaded} of {GOOD_ROWS} rows")
+        failures += 1
+
+
+def reset_table():
+    """Recreate the scratch table and leave the connection the way commit_transaction does"""
+    manager.db.execute_update(f"DROP TABLE IF EXISTS {TABLE_NAME}_reject")
+    manager.db.execute_update(f"DROP TABLE IF EXISTS {TABLE_NAME}")
+    manager.db.execute_update(
+        f"CREATE TABLE {TABLE_NAME} (id INTEGER PRIMARY KEY, note TEXT, amount NUMERIC)")
+    manager.invalidate_table_structure(TABLE_NAME)
+    manager.db.begin_transaction()
+    manager.db.commit_transaction()
+
+
+try:
+    reset_table()
+    result = manager._execute_mapped_import(csv_file, TABLE_NAME, COLUMN_MAPPING)
+    check("Mapped import", result.get('successful_rows'))
+    
+    reset_table()
+    with open(csv_file, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    column_types = {'id': 'integer', 'note': 'text', 'amount': 'numeric'}
+    imported = manager._insert_rows_individually(TABLE_NAME, rows, list(COLUMN_MAPPING.values()),
+                                                 COLUMN_MAPPING, column_types)
+    check("Row-by-row fallback", imported)
+    
+    reset_table()
+    result = manager._execute_mapped_import_with_progress(csv_file, TABLE_NAME, COLUMN_MAPPING,
+                                                          batch_size=1000)
+    check("Batched import with bisection", result.get('successful_rows'))
+    if manager.table_exists(f"{TABLE_NAME}_reject"):
+        print("✓ Batched import with bisection: duplicate row quarantined")
+    else:
+        print("✗ Batched import with bisection: duplicate row was not quarantined")
+        failures += 1
+finally:
+    manager.db.execute_update(f"DROP TABLE IF EXISTS {TABLE_NAME}_reject")
+    manager.db.execute_update(f"DROP TABLE IF EXISTS {TABLE_NAME}")
+    os.remove(csv_file)
+    manager.close()
+
+print("\nOVERALL STATUS:")
+if failures:
+    print(f"✗ {failures} import path(s) FAILED")
+    sys.exit(1)
+print("✓ Imports work on a connection left in autocommit mode")